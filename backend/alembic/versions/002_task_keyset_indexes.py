@@ -0,0 +1,23 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '002_task_keyset_indexes'
+down_revision = '001_create_tables'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index(
+        'ix_tasks_due_created_uuid', 'tasks',
+        ['due_date', 'created_date', 'task_uuid'],
+        postgresql_where=sa.text('deleted_date IS NULL')
+    )
+    op.create_index(
+        'ix_tasks_assigned_due_created_uuid', 'tasks',
+        ['assigned_to', 'due_date', 'created_date', 'task_uuid'],
+        postgresql_where=sa.text('deleted_date IS NULL')
+    )
+
+def downgrade():
+    op.drop_index('ix_tasks_assigned_due_created_uuid', table_name='tasks')
+    op.drop_index('ix_tasks_due_created_uuid', table_name='tasks')
@@ -0,0 +1,27 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = '003_create_task_counters'
+down_revision = '002_task_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'task_counters',
+        sa.Column('assigned_to', UUID(as_uuid=True), primary_key=True),
+        sa.Column('status', sa.String, primary_key=True),
+        sa.Column('task_count', sa.Integer, nullable=False, server_default='0'),
+    )
+    # Seed from the live tasks; unassigned tasks use the nil UUID as their key
+    op.execute("""
+        INSERT INTO task_counters (assigned_to, status, task_count)
+        SELECT COALESCE(assigned_to, '00000000-0000-0000-0000-000000000000'::uuid), status, COUNT(*)
+        FROM tasks
+        WHERE deleted_date IS NULL
+        GROUP BY 1, 2
+    """)
+
+def downgrade():
+    op.drop_table('task_counters')
@@ -0,0 +1,38 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+revision = '004_create_tasks_archive'
+down_revision = '003_create_task_counters'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Monthly partitions are created on demand by TaskArchiveService
+    op.create_table(
+        'tasks_archive',
+        sa.Column('task_uuid', UUID(as_uuid=True), nullable=False),
+        sa.Column('archived_date', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('title', sa.String, nullable=False),
+        sa.Column('description', sa.String, nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('due_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('tags', ARRAY(sa.String), nullable=True),
+        sa.Column('status', sa.String, nullable=False),
+        sa.Column('priority', sa.Integer, nullable=False),
+        sa.Column('assigned_to', UUID(as_uuid=True), nullable=True),
+        sa.Column('deleted_date', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('task_uuid', 'archived_date'),
+        postgresql_partition_by='RANGE (archived_date)'
+    )
+    op.create_index('ix_tasks_archive_assigned_to', 'tasks_archive', ['assigned_to'])
+    # Finds long-completed live tasks for the archive job
+    op.create_index(
+        'ix_tasks_done_completed_date', 'tasks', ['completed_date'],
+        postgresql_where=sa.text("status = 'Done' AND deleted_date IS NULL")
+    )
+
+def downgrade():
+    op.drop_index('ix_tasks_done_completed_date', table_name='tasks')
+    op.drop_table('tasks_archive')
@@ -0,0 +1,26 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '005_task_search_vector'
+down_revision = '004_create_tasks_archive'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Generated and stored, so it stays in step with title/description on every write
+    op.add_column('tasks', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))",
+            persisted=True
+        )
+    ))
+    op.create_index(
+        'ix_tasks_search_vector', 'tasks', ['search_vector'],
+        postgresql_using='gin'
+    )
+
+def downgrade():
+    op.drop_index('ix_tasks_search_vector', table_name='tasks')
+    op.drop_column('tasks', 'search_vector')
@@ -0,0 +1,25 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '006_task_modified_date'
+down_revision = '005_task_search_vector'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Existing rows start from their last known change; the server default
+    # also stamps rows inserted by SQL that bypasses the model (COPY imports)
+    op.add_column('tasks', sa.Column(
+        'modified_date', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+    ))
+    op.execute(
+        "UPDATE tasks SET modified_date = GREATEST(created_date, completed_date, deleted_date) "
+        "WHERE GREATEST(created_date, completed_date, deleted_date) IS NOT NULL"
+    )
+    op.create_index('ix_tasks_modified_uuid', 'tasks', ['modified_date', 'task_uuid'])
+    op.add_column('tasks_archive', sa.Column('modified_date', sa.DateTime(timezone=True), nullable=True))
+
+def downgrade():
+    op.drop_column('tasks_archive', 'modified_date')
+    op.drop_index('ix_tasks_modified_uuid', table_name='tasks')
+    op.drop_column('tasks', 'modified_date')
@@ -0,0 +1,14 @@
+from alembic import op
+
+revision = '008_tasks_archive_changes_index'
+down_revision = '007_user_trigram_search'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # GET /tasks/changes reads archive moves after its cursor in this order;
+    # created on the partitioned parent, so every monthly partition gets one
+    op.create_index('ix_tasks_archive_archived_uuid', 'tasks_archive', ['archived_date', 'task_uuid'])
+
+def downgrade():
+    op.drop_index('ix_tasks_archive_archived_uuid', table_name='tasks_archive')
@@ -0,0 +1,96 @@
+"""Cost of turning a page of tasks into a JSON response body.
+
+Usage: python -m benchmarks.bench_json_response [--iterations N] [--sizes 10,100,1000]
+
+Needs no database: pages are built from detached Task objects. Compares
+the jsonable_encoder + json.dumps path older FastAPI versions took, the
+response_model path of current FastAPI (validate into TaskResponse, then
+Pydantic's dump_json), the same with ORJSONResponse as response class, and
+dump_task_list, which encodes the rows with orjson without validating
+them again. Also times NDJSON export chunks with json and with orjson.
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from models.task import Task
+from dto.task_dto import TaskResponse, dump_task_list
+from services.task_export import _ndjson_chunk
+
+TASK_LIST = TypeAdapter(List[TaskResponse])
+
+def make_tasks(count):
+    now = datetime.utcnow()
+    return [
+        Task(
+            task_uuid=uuid.uuid4(), title=f"Task {i}", description="Write the quarterly report " * 3,
+            created_date=now, due_date=now + timedelta(days=i % 30), completed_date=None,
+            tags=["report", "q3"], status="To Do", priority=i % 5, assigned_to=uuid.uuid4(), deleted_date=None
+        )
+        for i in range(count)
+    ]
+
+def timed(fn, iterations, rounds=5):
+    """Best-of-rounds average time per call, in microseconds."""
+    fn()
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = (time.perf_counter() - start) / iterations * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def legacy(tasks):
+    return json.dumps(jsonable_encoder([TaskResponse.model_validate(task) for task in tasks])).encode()
+
+def response_model(tasks):
+    return TASK_LIST.dump_json(TASK_LIST.validate_python(tasks))
+
+def orjson_response_class(tasks):
+    return orjson.dumps(TASK_LIST.dump_python(TASK_LIST.validate_python(tasks), mode="json"))
+
+def legacy_ndjson_chunk(rows, columns):
+    return "".join(json.dumps(dict(zip(columns, row)), default=str) + "\n" for row in rows)
+
+def bench_pages(sizes, iterations):
+    for size in sizes:
+        tasks = make_tasks(size)
+        assert dump_task_list(tasks) == response_model(tasks)
+        runs = max(iterations // size, 3)
+        results = [
+            ("jsonable_encoder+json", timed(lambda: legacy(tasks), runs)),
+            ("response_model", timed(lambda: response_model(tasks), runs)),
+            ("ORJSONResponse", timed(lambda: orjson_response_class(tasks), runs)),
+            ("dump_task_list", timed(lambda: dump_task_list(tasks), runs)),
+        ]
+        baseline = results[1][1]
+        print(f"page of {size:>5} tasks")
+        for label, elapsed in results:
+            print(f"  {label:<24} {elapsed:10.1f} us   ({baseline / elapsed:4.1f}x vs response_model)")
+
+def bench_export(iterations):
+    columns = list(TaskResponse.model_fields)
+    rows = [tuple(getattr(task, name) for name in columns) for task in make_tasks(1000)]
+    runs = max(iterations // 1000, 3)
+    stdlib = timed(lambda: legacy_ndjson_chunk(rows, columns), runs)
+    fast = timed(lambda: _ndjson_chunk(rows, columns), runs)
+    print(f"NDJSON export chunk of 1000 rows   json: {stdlib:9.1f} us   orjson: {fast:9.1f} us   ({stdlib / fast:4.1f}x)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000, help="Tasks to encode per timing round")
+    parser.add_argument("--sizes", default="10,100,1000")
+    args = parser.parse_args(argv)
+
+    bench_pages([int(size) for size in args.sizes.split(",")], args.iterations)
+    bench_export(args.iterations)
+
+if __name__ == "__main__":
+    main()
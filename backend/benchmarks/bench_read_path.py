@@ -0,0 +1,116 @@
+"""Time and allocations of reading task and user list pages: ORM instances vs Core rows.
+
+Usage: python -m benchmarks.bench_read_path --url DATABASE_URL [--rows N] [--iterations N]
+
+The database must have the schema applied. --rows tasks and users are
+inserted in a transaction that is rolled back at the end, so nothing is
+left behind. For each list, the previous ORM query (full Task / User
+instances) and the Core select() the services now use are timed over a
+page of --rows rows, fetch plus JSON encoding, and tracemalloc reports
+the memory allocated while building one page.
+"""
+import argparse
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from models.task import Task
+from models.user import User
+from dto.task_dto import dump_task_list
+from services.task_service import TaskService
+from services.user_service import UserService
+
+def timed(fn, iterations, rounds=3):
+    """Best-of-rounds average time per call, in milliseconds."""
+    fn()
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = (time.perf_counter() - start) / iterations * 1e3
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def allocated(fn):
+    """Peak bytes and number of blocks allocated by one call."""
+    fn()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = fn()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    del result
+    return peak, blocks
+
+def seed(session, rows):
+    now = datetime.utcnow()
+    users = [
+        {"user_uuid": uuid.uuid4(), "username": f"bench-{uuid.uuid4().hex}", "name": "Bench User",
+         "email": f"{uuid.uuid4().hex}@example.com", "password": "x", "created_date": now}
+        for _ in range(rows)
+    ]
+    session.execute(insert(User), users)
+    session.execute(insert(Task), [
+        {"task_uuid": uuid.uuid4(), "title": f"Task {i}", "description": "Write the quarterly report " * 3,
+         "created_date": now, "due_date": now + timedelta(minutes=i), "tags": ["report", "q3"],
+         "status": "To Do", "priority": i % 5, "assigned_to": users[i]["user_uuid"]}
+        for i in range(rows)
+    ])
+
+def orm_tasks(session, rows):
+    tasks = TaskService(session)._keyset_order()
+    page = session.query(Task).filter(Task.deleted_date == None).order_by(*tasks).limit(rows).all()
+    body = dump_task_list(page)
+    session.expunge_all()
+    return body
+
+def core_tasks(session, rows):
+    return dump_task_list(TaskService(session).get_tasks_filtered(limit=rows))
+
+def orm_users(session, rows):
+    page = session.query(User).filter(User.deleted_date == None).limit(rows).all()
+    session.expunge_all()
+    return page
+
+def core_users(session, rows):
+    return UserService(session).get_users(limit=rows)
+
+def report(label, session, rows, iterations, legacy, core):
+    legacy_ms = timed(lambda: legacy(session, rows), iterations)
+    core_ms = timed(lambda: core(session, rows), iterations)
+    legacy_peak, legacy_blocks = allocated(lambda: legacy(session, rows))
+    core_peak, core_blocks = allocated(lambda: core(session, rows))
+    print(f"{label} ({rows} rows)")
+    print(f"  ORM instances  {legacy_ms:8.2f} ms   peak {legacy_peak / 1024:8.1f} KiB   {legacy_blocks:7d} blocks")
+    print(f"  Core rows      {core_ms:8.2f} ms   peak {core_peak / 1024:8.1f} KiB   {core_blocks:7d} blocks"
+          f"   ({legacy_ms / core_ms:4.1f}x faster)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", required=True, help="Database with the schema applied")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.url)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            seed(session, args.rows)
+            session.flush()
+            report("task list page, fetch + JSON", session, args.rows, args.iterations, orm_tasks, core_tasks)
+            report("user list page, fetch", session, args.rows, args.iterations, orm_users, core_users)
+        finally:
+            session.close()
+            transaction.rollback()
+
+if __name__ == "__main__":
+    main()
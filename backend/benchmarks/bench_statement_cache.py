@@ -0,0 +1,99 @@
+"""Per-call overhead of the hot TaskService/UserService lookups.
+
+Usage: python -m benchmarks.bench_statement_cache [--iterations N] [--url DATABASE_URL]
+
+Compares the previous ORM Query lookups with lambda_stmt and with the prebuilt
+select() + bindparam statements the services now use. The "build" section
+needs no database: it times constructing each statement and generating the
+cache key SQLAlchemy uses to find its compiled form. With --url it also times
+full lookups (execute + fetch) against that database, which must have the
+schema applied.
+"""
+import argparse
+import time
+import uuid
+from sqlalchemy import create_engine, lambda_stmt, select
+from sqlalchemy.orm import sessionmaker
+from models.task import Task
+from models.user import User
+from services.task_service import _GET_LIVE_TASK
+from services.user_service import _GET_USER_BY_USERNAME
+
+def legacy_task_query(session, task_uuid):
+    return session.query(Task).filter(Task.task_uuid == task_uuid, Task.deleted_date == None)
+
+def lambda_task_stmt(task_uuid):
+    return lambda_stmt(lambda: select(Task).where(Task.task_uuid == task_uuid, Task.deleted_date == None).limit(1))
+
+def legacy_user_query(session, username):
+    return session.query(User).filter(User.username.ilike(username.lower()), User.deleted_date == None)
+
+def lambda_user_stmt(username):
+    username = username.lower()
+    return lambda_stmt(lambda: select(User).where(User.username.ilike(username), User.deleted_date == None).limit(1))
+
+def timed(fn, iterations, rounds=5):
+    """Best-of-rounds average time per call, in microseconds."""
+    fn()
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = (time.perf_counter() - start) / iterations * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def report(label, legacy, lambda_, prebuilt):
+    print(
+        f"{label:<40} query(): {legacy:7.1f} us   lambda_stmt: {lambda_:7.1f} us   "
+        f"prebuilt: {prebuilt:7.1f} us   ({legacy / prebuilt:4.1f}x)"
+    )
+
+def bench_build(iterations):
+    session = sessionmaker()()
+    task_uuid = uuid.uuid4()
+    report(
+        "get_task build + cache key",
+        timed(lambda: legacy_task_query(session, task_uuid).statement._generate_cache_key(), iterations),
+        timed(lambda: lambda_task_stmt(task_uuid)._generate_cache_key(), iterations),
+        timed(lambda: _GET_LIVE_TASK._generate_cache_key(), iterations)
+    )
+    report(
+        "get_user_by_username build + cache key",
+        timed(lambda: legacy_user_query(session, "Someone").statement._generate_cache_key(), iterations),
+        timed(lambda: lambda_user_stmt("Someone")._generate_cache_key(), iterations),
+        timed(lambda: _GET_USER_BY_USERNAME._generate_cache_key(), iterations)
+    )
+
+def bench_execute(url, iterations):
+    session = sessionmaker(bind=create_engine(url))()
+    task_uuid = uuid.uuid4()
+    try:
+        report(
+            "get_task execute",
+            timed(lambda: legacy_task_query(session, task_uuid).first(), iterations),
+            timed(lambda: session.execute(lambda_task_stmt(task_uuid)).scalars().first(), iterations),
+            timed(lambda: session.execute(_GET_LIVE_TASK, {"task_uuid": task_uuid}).scalars().first(), iterations)
+        )
+        report(
+            "get_user_by_username execute",
+            timed(lambda: legacy_user_query(session, "someone").first(), iterations),
+            timed(lambda: session.execute(lambda_user_stmt("someone")).scalars().first(), iterations),
+            timed(lambda: session.execute(_GET_USER_BY_USERNAME, {"username": "someone"}).scalars().first(), iterations)
+        )
+    finally:
+        session.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--url", default=None, help="Database to run full lookups against")
+    args = parser.parse_args(argv)
+
+    bench_build(args.iterations)
+    if args.url:
+        bench_execute(args.url, max(args.iterations // 5, 1))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Latency of GET /users/search queries over a large user directory.
+
+Usage: python -m benchmarks.bench_user_search --url DATABASE_URL [--users N] [--queries N]
+
+The database must have the schema applied, trigram indexes (migration
+007) included. --users users are inserted in a transaction that is rolled
+back at the end, so nothing is left behind. The Redis cache is switched
+off, so every call reaches the database; the terms are prefixes
+and substrings of the seeded usernames, names and emails, from one
+character up. Reports p50 / p99 per term length, and for comparison the
+offset page through GET /users a picker had to walk before.
+"""
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+from models.user import User
+from services.redis_service import redis_manager
+from services.user_service import UserService
+
+FIRST_NAMES = [
+    "Ada", "Alan", "Alice", "Amir", "Ana", "Ben", "Carla", "Chen", "Dana", "David", "Elena", "Emma", "Farah",
+    "Grace", "Hana", "Ivan", "Jamal", "Jia", "John", "Julia", "Kofi", "Lars", "Lena", "Liam", "Maria", "Mei",
+    "Nia", "Noah", "Olga", "Omar", "Priya", "Raj", "Rosa", "Sam", "Sara", "Sven", "Tariq", "Uma", "Yusuf", "Zoe"
+]
+LAST_NAMES = [
+    "Adams", "Baker", "Chen", "Diaz", "Evans", "Fischer", "Garcia", "Hansen", "Ivanova", "Jensen", "Khan",
+    "Lopez", "Meyer", "Nakamura", "Okafor", "Patel", "Quinn", "Rossi", "Silva", "Tanaka", "Umar", "Varga",
+    "Weber", "Xu", "Young", "Zhang", "Novak", "Kowalski", "Murphy", "Smith"
+]
+
+def seed(session, count):
+    now = datetime.utcnow()
+    users = []
+    for i in range(count):
+        first, last = random.choice(FIRST_NAMES), random.choice(LAST_NAMES)
+        username = f"{first}.{last}{i}".lower()
+        users.append({
+            "user_uuid": uuid.uuid4(), "username": username, "name": f"{first} {last}",
+            "email": f"{username}@example.com", "password": "x", "created_date": now
+        })
+    for start in range(0, count, 10000):
+        session.execute(insert(User), users[start:start + 10000])
+    # Merge the GIN pending lists as autovacuum would have by now; a bulk
+    # insert leaves them for every query to scan linearly
+    session.execute(text(
+        "SELECT gin_clean_pending_list(indexrelid) FROM pg_index "
+        "WHERE indrelid = 'users'::regclass AND indexrelid::regclass::text LIKE '%_trgm'"
+    ))
+    session.execute(text("ANALYZE users"))
+    return users
+
+def terms(users, length, count):
+    """Prefixes (and, from 3 characters, substrings) of seeded values."""
+    picked = []
+    for _ in range(count):
+        value = random.choice(users)[random.choice(["username", "name", "email"])].lower()
+        start = 0 if length < 3 or random.random() < 0.5 else random.randrange(max(len(value) - length, 1))
+        picked.append(value[start:start + length])
+    return picked
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", required=True, help="Database with the schema applied")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200, help="Queries per term length")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    random.seed(42)
+    # Measure the database, not a cache hit or a Redis reconnect attempt
+    redis_manager.get_client = lambda: None
+    engine = create_engine(args.url)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            users = seed(session, args.users)
+            service = UserService(session)
+            print(f"search_users over {args.users} users, limit {args.limit}")
+            for length in (1, 2, 3, 4, 6, 8):
+                samples = [timed(lambda: service.search_users(term, args.limit)) for term in terms(users, length, args.queries)]
+                print(f"  {length} chars   p50 {percentile(samples, 0.5):7.2f} ms   p99 {percentile(samples, 0.99):7.2f} ms")
+            pages = [timed(lambda: service.get_users(skip=skip, limit=100)) for skip in range(0, args.users, args.users // 20)]
+            print(f"  GET /users page of 100 (offset walk)   p50 {percentile(pages, 0.5):7.2f} ms   "
+                  f"max {max(pages):7.2f} ms, {args.users // 100} pages to see everyone")
+        finally:
+            session.close()
+            transaction.rollback()
+
+if __name__ == "__main__":
+    main()
@@ -98,6 +98,72 @@ class ConfigSettings(BaseSettings):
     CACHE_DEFAULT_TTL: int = 300
     CACHE_TASK_LIST_TTL: int = 60
     CACHE_USER_INFO_TTL: int = 900
+    CACHE_COUNT_TTL: int = 30
+    CACHE_TAG_FACETS_TTL: int = 30
+    CACHE_TASK_ENTITY_TTL: int = 300
+    CACHE_TASK_ENTITY_L1_SIZE: int = 1024
+    CACHE_TASK_ENTITY_L1_TTL: int = 30
+    
+    # Archive settings
+    ARCHIVE_DELETED_RETENTION_DAYS: int = 7
+    ARCHIVE_COMPLETED_RETENTION_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 1000
+    ARCHIVE_MAX_LIMIT: int = 100
+    
+    # Bulk endpoint settings
+    BULK_MAX_BATCH_SIZE: int = 1000
+    BULK_MAX_IDS: int = 100
+    
+    # Tag facet settings
+    TAG_FACETS_MAX_LIMIT: int = 200
+    
+    # Export settings
+    EXPORT_BATCH_SIZE: int = 1000
+    
+    # Delta sync settings
+    CHANGES_MAX_LIMIT: int = 1000
+    CHANGES_SAFETY_LAG_SECONDS: int = 5
+    
+    # Import settings
+    IMPORT_BATCH_SIZE: int = 5000
+    IMPORT_MAX_ERRORS: int = 1000
+    
+    # Admission control settings
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_INITIAL_LIMIT: int = 20
+    ADMISSION_MIN_LIMIT: int = 2
+    ADMISSION_MAX_LIMIT: int = 40
+    ADMISSION_QUEUE_SIZE: int = 50
+    ADMISSION_QUEUE_TIMEOUT: float = 2.0
+    ADMISSION_LATENCY_TARGET_MS: int = 1000
+    ADMISSION_PRIORITY_RESERVE: int = 5
+    ADMISSION_PRIORITY_PATHS: List[str] = ["/auth"]
+    ADMISSION_EXEMPT_PATHS: List[str] = ["/health", "/metrics", "/tasks/stream"]
+    
+    # Response compression settings
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_PRECOMPRESSED_PATHS: List[str] = ["/tasks/statuses"]
+    
+    # Task change stream settings
+    STREAM_MAX_LENGTH: int = 10000
+    STREAM_QUEUE_SIZE: int = 256
+    STREAM_MAX_SUBSCRIBERS: int = 1000
+    STREAM_HEARTBEAT_SECONDS: int = 15
+    STREAM_RETRY_MS: int = 3000
+    
+    # Due-date reminder scheduler settings
+    REMINDER_HORIZON_SECONDS: int = 3600
+    REMINDER_MAX_LOADED: int = 100000
+    REMINDER_LEASE_TTL_SECONDS: int = 15
+    REMINDER_CATCH_UP_SECONDS: int = 3600
+    
+    # User search settings
+    USER_SEARCH_CACHE_TTL: int = 5
+    USER_SEARCH_MAX_LIMIT: int = 50
+    USER_SEARCH_CANDIDATES: int = 200
     
     # API settings
     API_TITLE: str = "Task-O-Matic API"
@@ -245,6 +311,94 @@ def merge_toml_with_settings(toml_config: Dict[str, Any], settings: ConfigSettin
         settings.CACHE_DEFAULT_TTL = cache_config.get("default_ttl", settings.CACHE_DEFAULT_TTL)
         settings.CACHE_TASK_LIST_TTL = cache_config.get("task_list_ttl", settings.CACHE_TASK_LIST_TTL)
         settings.CACHE_USER_INFO_TTL = cache_config.get("user_info_ttl", settings.CACHE_USER_INFO_TTL)
+        settings.CACHE_COUNT_TTL = cache_config.get("count_ttl", settings.CACHE_COUNT_TTL)
+        settings.CACHE_TAG_FACETS_TTL = cache_config.get("tag_facets_ttl", settings.CACHE_TAG_FACETS_TTL)
+        settings.CACHE_TASK_ENTITY_TTL = cache_config.get("task_entity_ttl", settings.CACHE_TASK_ENTITY_TTL)
+        settings.CACHE_TASK_ENTITY_L1_SIZE = cache_config.get("task_entity_l1_size", settings.CACHE_TASK_ENTITY_L1_SIZE)
+        settings.CACHE_TASK_ENTITY_L1_TTL = cache_config.get("task_entity_l1_ttl", settings.CACHE_TASK_ENTITY_L1_TTL)
+    
+    # Archive settings
+    if "archive" in toml_config:
+        archive_config = toml_config["archive"]
+        settings.ARCHIVE_DELETED_RETENTION_DAYS = archive_config.get("deleted_retention_days", settings.ARCHIVE_DELETED_RETENTION_DAYS)
+        settings.ARCHIVE_COMPLETED_RETENTION_DAYS = archive_config.get("completed_retention_days", settings.ARCHIVE_COMPLETED_RETENTION_DAYS)
+        settings.ARCHIVE_BATCH_SIZE = archive_config.get("batch_size", settings.ARCHIVE_BATCH_SIZE)
+        settings.ARCHIVE_MAX_LIMIT = archive_config.get("max_limit", settings.ARCHIVE_MAX_LIMIT)
+    
+    # Bulk endpoint settings
+    if "bulk" in toml_config:
+        bulk_config = toml_config["bulk"]
+        settings.BULK_MAX_BATCH_SIZE = bulk_config.get("max_batch_size", settings.BULK_MAX_BATCH_SIZE)
+        settings.BULK_MAX_IDS = bulk_config.get("max_ids", settings.BULK_MAX_IDS)
+    
+    # Tag facet settings
+    if "tags" in toml_config:
+        tags_config = toml_config["tags"]
+        settings.TAG_FACETS_MAX_LIMIT = tags_config.get("max_limit", settings.TAG_FACETS_MAX_LIMIT)
+    
+    # Export settings
+    if "export" in toml_config:
+        export_config = toml_config["export"]
+        settings.EXPORT_BATCH_SIZE = export_config.get("batch_size", settings.EXPORT_BATCH_SIZE)
+    
+    # Delta sync settings
+    if "changes" in toml_config:
+        changes_config = toml_config["changes"]
+        settings.CHANGES_MAX_LIMIT = changes_config.get("max_limit", settings.CHANGES_MAX_LIMIT)
+        settings.CHANGES_SAFETY_LAG_SECONDS = changes_config.get("safety_lag_seconds", settings.CHANGES_SAFETY_LAG_SECONDS)
+    
+    # Import settings
+    if "import" in toml_config:
+        import_config = toml_config["import"]
+        settings.IMPORT_BATCH_SIZE = import_config.get("batch_size", settings.IMPORT_BATCH_SIZE)
+        settings.IMPORT_MAX_ERRORS = import_config.get("max_errors", settings.IMPORT_MAX_ERRORS)
+    
+    # Admission control settings
+    if "admission" in toml_config:
+        admission_config = toml_config["admission"]
+        settings.ADMISSION_ENABLED = admission_config.get("enabled", settings.ADMISSION_ENABLED)
+        settings.ADMISSION_INITIAL_LIMIT = admission_config.get("initial_limit", settings.ADMISSION_INITIAL_LIMIT)
+        settings.ADMISSION_MIN_LIMIT = admission_config.get("min_limit", settings.ADMISSION_MIN_LIMIT)
+        settings.ADMISSION_MAX_LIMIT = admission_config.get("max_limit", settings.ADMISSION_MAX_LIMIT)
+        settings.ADMISSION_QUEUE_SIZE = admission_config.get("queue_size", settings.ADMISSION_QUEUE_SIZE)
+        settings.ADMISSION_QUEUE_TIMEOUT = admission_config.get("queue_timeout", settings.ADMISSION_QUEUE_TIMEOUT)
+        settings.ADMISSION_LATENCY_TARGET_MS = admission_config.get("latency_target_ms", settings.ADMISSION_LATENCY_TARGET_MS)
+        settings.ADMISSION_PRIORITY_RESERVE = admission_config.get("priority_reserve", settings.ADMISSION_PRIORITY_RESERVE)
+        settings.ADMISSION_PRIORITY_PATHS = admission_config.get("priority_paths", settings.ADMISSION_PRIORITY_PATHS)
+        settings.ADMISSION_EXEMPT_PATHS = admission_config.get("exempt_paths", settings.ADMISSION_EXEMPT_PATHS)
+    
+    # Response compression settings
+    if "compression" in toml_config:
+        compression_config = toml_config["compression"]
+        settings.COMPRESSION_ENABLED = compression_config.get("enabled", settings.COMPRESSION_ENABLED)
+        settings.COMPRESSION_MINIMUM_SIZE = compression_config.get("minimum_size", settings.COMPRESSION_MINIMUM_SIZE)
+        settings.COMPRESSION_GZIP_LEVEL = compression_config.get("gzip_level", settings.COMPRESSION_GZIP_LEVEL)
+        settings.COMPRESSION_BROTLI_QUALITY = compression_config.get("brotli_quality", settings.COMPRESSION_BROTLI_QUALITY)
+        settings.COMPRESSION_PRECOMPRESSED_PATHS = compression_config.get("precompressed_paths", settings.COMPRESSION_PRECOMPRESSED_PATHS)
+    
+    # Task change stream settings
+    if "stream" in toml_config:
+        stream_config = toml_config["stream"]
+        settings.STREAM_MAX_LENGTH = stream_config.get("max_length", settings.STREAM_MAX_LENGTH)
+        settings.STREAM_QUEUE_SIZE = stream_config.get("queue_size", settings.STREAM_QUEUE_SIZE)
+        settings.STREAM_MAX_SUBSCRIBERS = stream_config.get("max_subscribers", settings.STREAM_MAX_SUBSCRIBERS)
+        settings.STREAM_HEARTBEAT_SECONDS = stream_config.get("heartbeat_seconds", settings.STREAM_HEARTBEAT_SECONDS)
+        settings.STREAM_RETRY_MS = stream_config.get("retry_ms", settings.STREAM_RETRY_MS)
+    
+    # Due-date reminder scheduler settings
+    if "reminders" in toml_config:
+        reminders_config = toml_config["reminders"]
+        settings.REMINDER_HORIZON_SECONDS = reminders_config.get("horizon_seconds", settings.REMINDER_HORIZON_SECONDS)
+        settings.REMINDER_MAX_LOADED = reminders_config.get("max_loaded", settings.REMINDER_MAX_LOADED)
+        settings.REMINDER_LEASE_TTL_SECONDS = reminders_config.get("lease_ttl_seconds", settings.REMINDER_LEASE_TTL_SECONDS)
+        settings.REMINDER_CATCH_UP_SECONDS = reminders_config.get("catch_up_seconds", settings.REMINDER_CATCH_UP_SECONDS)
+    
+    # User search settings
+    if "user_search" in toml_config:
+        user_search_config = toml_config["user_search"]
+        settings.USER_SEARCH_CACHE_TTL = user_search_config.get("cache_ttl", settings.USER_SEARCH_CACHE_TTL)
+        settings.USER_SEARCH_MAX_LIMIT = user_search_config.get("max_limit", settings.USER_SEARCH_MAX_LIMIT)
+        settings.USER_SEARCH_CANDIDATES = user_search_config.get("candidates", settings.USER_SEARCH_CANDIDATES)
     
     # API settings
     if "api" in toml_config:
@@ -1,6 +1,7 @@
 import tomli
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from config.settings import settings
 import os
 
 with open(os.path.join(os.path.dirname(__file__), "config.toml"), "rb") as f:
@@ -8,7 +9,13 @@ with open(os.path.join(os.path.dirname(__file__), "config.toml"), "rb") as f:
 
 DATABASE_URL = config["database"]["url"]
 
-engine = create_engine(DATABASE_URL)
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
@@ -17,3 +24,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def pool_saturated() -> bool:
+    """True when every connection the pool may open is checked out."""
+    checkedout = getattr(engine.pool, "checkedout", None)
+    if checkedout is None:
+        return False
+    return checkedout() >= settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
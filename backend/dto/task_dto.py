@@ -1,28 +1,31 @@
-from pydantic import BaseModel
-from typing import Optional, List
+import orjson
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Optional, List, Dict, Tuple
 from uuid import UUID
-from datetime import datetime
+from datetime import date, datetime
 
 class TaskCreate(BaseModel):
     title: str
-    description: Optional[str]
-    due_date: Optional[datetime]
-    tags: Optional[List[str]]
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
+    tags: Optional[List[str]] = None
     status: str
     priority: int
-    assigned_to: Optional[UUID]
+    assigned_to: Optional[UUID] = None
 
 class TaskUpdate(BaseModel):
-    title: Optional[str]
-    description: Optional[str]
-    due_date: Optional[datetime]
-    tags: Optional[List[str]]
-    status: Optional[str]
-    priority: Optional[int]
-    assigned_to: Optional[UUID]
-    completed_date: Optional[datetime]
+    title: Optional[str] = None
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
+    tags: Optional[List[str]] = None
+    status: Optional[str] = None
+    priority: Optional[int] = None
+    assigned_to: Optional[UUID] = None
+    completed_date: Optional[datetime] = None
 
 class TaskResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     task_uuid: UUID
     title: str
     description: Optional[str]
@@ -34,3 +37,137 @@ class TaskResponse(BaseModel):
     priority: int
     assigned_to: Optional[UUID]
     deleted_date: Optional[datetime]
+    # Defaulted so entities cached before the column existed still load
+    modified_date: Optional[datetime] = None
+
+class TaskAssignee(BaseModel):
+    """Compact user embedded in a task read with expand=assignee."""
+    user_uuid: UUID
+    username: str
+    name: str
+
+class TaskExpandedResponse(TaskResponse):
+    # Only present with expand=assignee; None when unassigned
+    assignee: Optional[TaskAssignee] = None
+
+# Related objects a task read can embed with `expand=`
+TASK_EXPANSIONS = ("assignee",)
+
+def parse_task_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse a comma separated `fields=` value, validated against TaskResponse."""
+    if not fields:
+        return None
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in TaskResponse.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown task fields: {', '.join(unknown)}")
+    return names or None
+
+def parse_task_expand(expand: Optional[str]) -> Tuple[str, ...]:
+    """Parse a comma separated `expand=` value, validated against TASK_EXPANSIONS."""
+    if not expand:
+        return ()
+    names = tuple(dict.fromkeys(name.strip() for name in expand.split(",") if name.strip()))
+    unknown = [name for name in names if name not in TASK_EXPANSIONS]
+    if unknown:
+        raise ValueError(f"Unknown expansions: {', '.join(unknown)}")
+    return names
+
+def _task_dict(task, names: Tuple[str, ...], expand: Tuple[str, ...]) -> dict:
+    data = {name: getattr(task, name) for name in names}
+    if "assignee" in expand:
+        # Columns joined in by TaskService (assignee_uuid, assignee_username, assignee_name)
+        data["assignee"] = None if task.assignee_uuid is None else {
+            "user_uuid": task.assignee_uuid, "username": task.assignee_username, "name": task.assignee_name
+        }
+    return data
+
+def dump_task(task, expand: Tuple[str, ...] = ()) -> bytes:
+    """Serialize one task row like dump_task_list does a list."""
+    return orjson.dumps(_task_dict(task, tuple(TaskResponse.model_fields), expand), option=orjson.OPT_UTC_Z)
+
+def dump_task_list(tasks, fields: Optional[Tuple[str, ...]] = None, expand: Tuple[str, ...] = ()) -> bytes:
+    """Serialize task rows (ORM objects or Rows) as a JSON list with orjson.
+
+    Rows read from tasks already have TaskResponse's types, so they are not
+    validated again; the output is the JSON TaskResponse would produce,
+    trimmed to `fields` if given, plus the `expand`ed objects.
+    """
+    names = fields or tuple(TaskResponse.model_fields)
+    return orjson.dumps([_task_dict(task, names, expand) for task in tasks], option=orjson.OPT_UTC_Z)
+
+class ArchivedTaskResponse(TaskResponse):
+    archived_date: datetime
+
+class TaskSummary(BaseModel):
+    counts: Dict[str, int]
+    total: int
+    overdue: int
+
+class DailyCount(BaseModel):
+    date: date
+    count: int
+
+class TaskStats(BaseModel):
+    total: int
+    overdue: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+    completed_per_day: List[DailyCount]
+
+class TagCount(BaseModel):
+    tag: str
+    count: int
+
+class TaskBulkCreate(BaseModel):
+    # Items are validated one by one so a bad item does not fail the batch
+    items: List[Dict[str, Any]]
+
+class TaskBulkPatchItem(TaskUpdate):
+    task_uuid: UUID
+
+class TaskBulkFilter(BaseModel):
+    q: Optional[str] = None
+    status: Optional[str] = None
+    due_date_from: Optional[str] = None
+    due_date_to: Optional[str] = None
+    assigned_to_me: Optional[bool] = None
+    tags_any: Optional[str] = None
+    tags_all: Optional[str] = None
+
+class TaskBulkPatch(BaseModel):
+    """Either per-item updates (`items`) or one `update` applied to a `filter`."""
+    items: Optional[List[Dict[str, Any]]] = None
+    filter: Optional[TaskBulkFilter] = None
+    update: Optional[TaskUpdate] = None
+
+class TaskBulkDelete(BaseModel):
+    task_uuids: List[UUID]
+
+class BulkItemError(BaseModel):
+    index: int
+    task_uuid: Optional[UUID] = None
+    detail: str
+
+class TaskBulkResponse(BaseModel):
+    tasks: List[TaskResponse]
+    errors: List[BulkItemError] = []
+
+class ImportRowError(BaseModel):
+    line: int
+    detail: str
+
+class TaskChange(TaskResponse):
+    # Set when the task was moved to the archive; the client should drop it
+    archived_date: Optional[datetime] = None
+
+class TaskChanges(BaseModel):
+    """Tasks changed after a cursor, in modification order; deleted and archived ones are removals."""
+    changes: List[TaskChange]
+    next_cursor: Optional[str]
+    has_more: bool
+
+class TaskImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: List[ImportRowError]
@@ -0,0 +1,28 @@
+"""Move deleted and long-completed tasks into the tasks_archive table.
+
+Usage: python -m jobs.archive_tasks [--batch-size N] [--max-batches N]
+"""
+import argparse
+import logging
+import sys
+from db import SessionLocal
+from services.task_archive_service import TaskArchiveService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Archive deleted and long-completed tasks.")
+    parser.add_argument("--batch-size", type=int, default=None, help="Tasks moved per transaction")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        TaskArchiveService(db).archive_expired(batch_size=args.batch_size, max_batches=args.max_batches)
+    finally:
+        db.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
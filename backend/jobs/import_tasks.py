@@ -0,0 +1,37 @@
+"""Import tasks from a CSV or NDJSON file (the /tasks/export formats).
+
+Usage: python -m jobs.import_tasks PATH [--format csv|ndjson] [--batch-size N]
+"""
+import argparse
+import logging
+import sys
+from db import SessionLocal
+from services.task_import_service import IMPORT_FORMATS, TaskImportService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import tasks from a CSV or NDJSON file.")
+    parser.add_argument("path", help="File to import, or - for stdin")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None, help="Defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows validated and copied per transaction")
+    args = parser.parse_args(argv)
+
+    export_format = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    source = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    db = SessionLocal()
+    try:
+        report = TaskImportService(db).import_file(source, export_format, batch_size=args.batch_size)
+    finally:
+        db.close()
+        if source is not sys.stdin.buffer:
+            source.close()
+
+    for error in report["errors"]:
+        logger.warning(f"Line {error['line']}: {error['detail']}")
+    logger.info(f"Imported {report['imported']} tasks, {report['failed']} rows rejected")
+    return 1 if report["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Recompute task counters from the tasks table and report drift.
+
+Usage: python -m jobs.reconcile_task_counters [--dry-run]
+"""
+import argparse
+import logging
+import sys
+from db import SessionLocal
+from services.task_counter_service import TaskCounterService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Reconcile task_counters with the tasks table.")
+    parser.add_argument("--dry-run", action="store_true", help="Report drift without fixing it")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        drift = TaskCounterService(db).reconcile(fix=not args.dry_run)
+    finally:
+        db.close()
+
+    for item in drift:
+        logger.warning(
+            f"Counter drift for assigned_to={item['assigned_to']} status={item['status']}: "
+            f"expected {item['expected']}, found {item['actual']}"
+        )
+    logger.info(f"Reconciliation finished: {len(drift)} drifted counters")
+    return 1 if drift and args.dry_run else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
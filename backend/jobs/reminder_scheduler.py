@@ -0,0 +1,26 @@
+"""Fire task.due events as open tasks reach their due date.
+
+Usage: python -m jobs.reminder_scheduler
+
+Long-running: run one per replica if you like, only the holder of the
+Redis lease fires reminders and the others take over if it goes away.
+"""
+import logging
+import signal
+import sys
+from db import SessionLocal
+from services.reminder_scheduler import DueReminderScheduler
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main(argv=None) -> int:
+    scheduler = DueReminderScheduler(SessionLocal)
+    # Stop between rounds so the lease is released for the next replica right away
+    signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: scheduler.stop())
+    scheduler.run()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,17 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routers.task_router import router as task_router
 from routers.user_router import router as user_router
 from routers.auth_router import router as auth_router
+from authorization.dependencies import get_current_active_user
+from middleware.admission_control import AdmissionController, AdmissionControlMiddleware, threadpool_saturated
+from middleware.compression import CompressionMiddleware, CompressionStats
 from services.redis_service import redis_manager
+from services.task_list_cache import task_list_cache
+from services.task_entity_cache import task_entity_cache
+from services.task_events import task_event_broker
 from config.settings import settings
+from db import pool_saturated
 import logging
 
 # Configure logging
@@ -19,6 +26,30 @@ app = FastAPI(
     redoc_url=settings.API_REDOC_URL
 )
 
+# Response compression, innermost so admission latency includes it
+compression_stats = CompressionStats()
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        stats=compression_stats,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        precompressed_paths=settings.COMPRESSION_PRECOMPRESSED_PATHS
+    )
+
+# Admission control, added before CORS so CORS wraps it and 503s carry CORS headers
+admission_controller = AdmissionController.from_settings(
+    overloaded=lambda: pool_saturated() or threadpool_saturated()
+)
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=admission_controller,
+        priority_paths=settings.ADMISSION_PRIORITY_PATHS,
+        exempt_paths=settings.ADMISSION_EXEMPT_PATHS
+    )
+
 # Add CORS middleware with explicit configuration
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +71,8 @@ app.add_middleware(
         "Authorization",
         "X-Requested-With",
         "Cache-Control",
+        "If-None-Match",
+        "Last-Event-ID",
         "Pragma",
         "Origin",
         "Referer",
@@ -49,7 +82,11 @@ app.add_middleware(
         "X-RateLimit-Limit",
         "X-RateLimit-Remaining",
         "X-RateLimit-Reset",
-        "X-Process-Time"
+        "X-Process-Time",
+        "X-Next-Cursor",
+        "X-Total-Count",
+        "X-Cache",
+        "ETag"
     ]
 )
 
@@ -64,10 +101,16 @@ async def startup_event():
             logger.warning("Failed to connect to Redis - rate limiting may not work properly")
     else:
         logger.info("Rate limiting disabled")
+    # Cross-worker invalidation of the in-process task cache
+    task_entity_cache.start()
+    # Fan-out of task change events to this worker's stream subscribers
+    task_event_broker.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
+    task_entity_cache.stop()
+    task_event_broker.stop()
     redis_manager.close()
     logger.info("Application shutdown complete")
 
@@ -89,6 +132,19 @@ async def health_check():
         "redis_info": redis_manager.get_info() if redis_manager.is_connected() else None
     }
 
+@app.get("/metrics", dependencies=[Depends(get_current_active_user)])
+def metrics():
+    """Cache counters (task list pages are shared, the rest is per worker), admission control state,
+    per-route compression and task stream subscribers. Requires a logged in user: the numbers
+    describe traffic and internals that anonymous clients should not see."""
+    return {
+        "task_list_cache": task_list_cache.metrics(),
+        "task_entity_cache": task_entity_cache.metrics(),
+        "admission": admission_controller.metrics(),
+        "compression": compression_stats.metrics(),
+        "task_stream": task_event_broker.metrics()
+    }
+
 # Include routers with prefixes - Make sure task router is included!
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(task_router, prefix="/tasks", tags=["Tasks"])
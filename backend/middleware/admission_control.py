@@ -0,0 +1,181 @@
+import asyncio
+import math
+import time
+import logging
+from collections import deque
+from typing import Callable, List, Optional
+from anyio import to_thread
+from starlette.responses import JSONResponse
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Multiplicative decrease applied to the limit on overload
+BACKOFF_FACTOR = 0.75
+
+def threadpool_saturated() -> bool:
+    """True when every worker thread sync routes run on is busy (call from the event loop)."""
+    limiter = to_thread.current_default_thread_limiter()
+    return limiter.borrowed_tokens >= limiter.total_tokens
+
+class AdmissionController:
+    """Adaptive concurrency limit for one worker (AIMD).
+
+    Requests beyond the limit wait in a bounded queue for up to
+    queue_timeout seconds and are rejected once it is full or they time
+    out, so a slow database costs a few fast 503s instead of every
+    request queueing for a pool connection.
+
+    After each request the limit grows by 1/limit (about +1 per limit's
+    worth of requests) if the request found the limit in use and nothing
+    looked overloaded, and shrinks by BACKOFF_FACTOR, at most once per
+    latency target, if the time to first byte exceeded the target or the
+    connection pool or threadpool was exhausted. Priority requests may use
+    priority_reserve slots above the limit and are queued ahead.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        queue_size: int,
+        queue_timeout: float,
+        latency_target: float,
+        priority_reserve: int = 0,
+        overloaded: Optional[Callable[[], bool]] = None
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.latency_target = latency_target
+        self.priority_reserve = priority_reserve
+        self.overloaded = overloaded or (lambda: False)
+        self.in_flight = 0
+        self._waiters = deque()
+        self._last_decrease = 0.0
+        self.stats = {"admitted": 0, "queued": 0, "rejected": 0, "timed_out": 0}
+
+    @classmethod
+    def from_settings(cls, overloaded: Optional[Callable[[], bool]] = None) -> "AdmissionController":
+        return cls(
+            initial_limit=settings.ADMISSION_INITIAL_LIMIT,
+            min_limit=settings.ADMISSION_MIN_LIMIT,
+            max_limit=settings.ADMISSION_MAX_LIMIT,
+            queue_size=settings.ADMISSION_QUEUE_SIZE,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+            latency_target=settings.ADMISSION_LATENCY_TARGET_MS / 1000,
+            priority_reserve=settings.ADMISSION_PRIORITY_RESERVE,
+            overloaded=overloaded
+        )
+
+    def _capacity(self, priority: bool) -> int:
+        return int(self.limit) + (self.priority_reserve if priority else 0)
+
+    @property
+    def retry_after(self) -> int:
+        """Seconds a rejected client should wait before retrying."""
+        return max(1, math.ceil(self.queue_timeout))
+
+    async def acquire(self, priority: bool = False) -> bool:
+        """Admit a request, waiting in the queue if needed. False means reject it."""
+        if self.in_flight < self._capacity(priority) and (priority or not self._waiters):
+            self.in_flight += 1
+            self.stats["admitted"] += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.stats["rejected"] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        if priority:
+            self._waiters.appendleft((priority, waiter))
+        else:
+            self._waiters.append((priority, waiter))
+        self.stats["queued"] += 1
+        try:
+            # The slot is handed over by release(): in_flight already counts it
+            await asyncio.wait_for(waiter, self.queue_timeout)
+            self.stats["admitted"] += 1
+            return True
+        except asyncio.TimeoutError:
+            self.stats["timed_out"] += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._free_slot()
+            raise
+        finally:
+            if (priority, waiter) in self._waiters:
+                self._waiters.remove((priority, waiter))
+
+    def release(self, latency: float, was_at_limit: bool) -> None:
+        """Free a slot and adapt the limit to how the request went."""
+        now = time.monotonic()
+        if latency > self.latency_target or self.overloaded():
+            if now - self._last_decrease >= self.latency_target:
+                self.limit = max(self.min_limit, self.limit * BACKOFF_FACTOR)
+                self._last_decrease = now
+                logger.info(f"Admission limit lowered to {int(self.limit)} (latency {latency * 1000:.0f} ms)")
+        elif was_at_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._free_slot()
+
+    def _free_slot(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < self._capacity(self._waiters[0][0]):
+            _, waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(True)
+
+    def metrics(self) -> dict:
+        return dict(self.stats, limit=int(self.limit), in_flight=self.in_flight, queued_now=len(self._waiters))
+
+class AdmissionControlMiddleware:
+    """ASGI middleware putting HTTP requests through an AdmissionController.
+
+    Exempt paths (health checks, metrics) bypass it; priority paths (auth)
+    get the priority lane. Rejected requests get 503 with Retry-After.
+    Latency is measured to the start of the response, so long streamed
+    bodies (exports) hold a slot without counting as slow.
+    """
+
+    def __init__(self, app, controller: AdmissionController, priority_paths: List[str], exempt_paths: List[str]):
+        self.app = app
+        self.controller = controller
+        self.priority_paths = tuple(priority_paths)
+        self.exempt_paths = tuple(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or path.startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+
+        controller = self.controller
+        if not await controller.acquire(priority=path.startswith(self.priority_paths)):
+            response = JSONResponse(
+                {"detail": "Server is busy, please retry later"},
+                status_code=503,
+                headers={"Retry-After": str(controller.retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        was_at_limit = controller.in_flight >= int(controller.limit)
+        start = time.perf_counter()
+        first_byte = None
+
+        async def send_timed(message):
+            nonlocal first_byte
+            if message["type"] == "http.response.start" and first_byte is None:
+                first_byte = time.perf_counter() - start
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            controller.release(first_byte if first_byte is not None else time.perf_counter() - start, was_at_limit)
@@ -0,0 +1,250 @@
+import time
+import zlib
+from typing import Dict, List, Optional
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only gzip is offered
+    brotli = None
+
+# Content types worth compressing; anything else (images, archives) passes through
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/xml", "application/javascript")
+# Event streams must reach the client as each event is written
+UNCOMPRESSIBLE_TYPES = ("text/event-stream",)
+
+# Bodies of precompressed paths kept per worker; they only change on deploy
+PRECOMPRESSED_MAX_ENTRIES = 32
+
+def supported_encodings() -> List[str]:
+    """Content codings this worker can produce, best first."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+def negotiate_encoding(accept_encoding: str, available: List[str]) -> Optional[str]:
+    """Pick the coding to use from an Accept-Encoding header, None for identity.
+
+    Highest q-value wins; on a tie the order of `available` decides. A `*`
+    entry covers the codings the header does not name.
+    """
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip()] = q
+
+    best, best_q = None, 0.0
+    for coding in available:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+class _Encoder:
+    """Incremental gzip or brotli encoder."""
+
+    def __init__(self, coding: str, level: int):
+        self.coding = coding
+        if coding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compress a chunk; non-final chunks are flushed so they can be sent right away."""
+        if self.coding == "br":
+            out = self._compressor.process(data)
+            return out + (self._compressor.finish() if final else self._compressor.flush())
+        out = self._compressor.compress(data)
+        return out + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+class CompressionStats:
+    """Per-route compression counters: bytes before and after, and CPU time spent."""
+
+    def __init__(self):
+        self.routes: Dict[str, dict] = {}
+
+    def record(self, route: str, coding: str, bytes_in: int, bytes_out: int, cpu_seconds: float, precompressed: bool = False) -> None:
+        stats = self.routes.setdefault(route, {
+            "responses": 0, "precompressed": 0, "gzip": 0, "br": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0
+        })
+        stats["responses"] += 1
+        stats["precompressed"] += int(precompressed)
+        stats[coding] += 1
+        stats["bytes_in"] += bytes_in
+        stats["bytes_out"] += bytes_out
+        stats["cpu_seconds"] += cpu_seconds
+
+    def metrics(self) -> dict:
+        return {
+            route: {
+                **{key: value for key, value in stats.items() if key != "cpu_seconds"},
+                "cpu_ms": round(stats["cpu_seconds"] * 1000, 3),
+                "ratio": round(stats["bytes_in"] / stats["bytes_out"], 2) if stats["bytes_out"] else None
+            }
+            for route, stats in self.routes.items()
+        }
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with gzip or brotli, as the client accepts.
+
+    Only compressible content types of at least minimum_size bytes are
+    compressed; responses that already carry a Content-Encoding, say
+    no-transform, or are event streams pass through untouched. Streamed
+    bodies (exports) are compressed chunk by chunk and flushed, so rows
+    still reach the client as they are produced. Compressed responses get
+    Vary: Accept-Encoding and a weak ETag, since the bytes differ from the
+    identity representation while If-None-Match still matches.
+
+    Bodies of precompressed_paths (static reference data) are compressed
+    once at the highest level and then served from memory.
+    """
+
+    def __init__(
+        self,
+        app,
+        stats: CompressionStats,
+        minimum_size: int,
+        gzip_level: int,
+        brotli_quality: int,
+        precompressed_paths: List[str]
+    ):
+        self.app = app
+        self.stats = stats
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "br": brotli_quality}
+        self.precompressed_paths = set(precompressed_paths)
+        self.available = supported_encodings()
+        self._precompressed: Dict[tuple, bytes] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        coding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.available)
+        responder = _CompressionResponder(self, scope, coding, send)
+        await self.app(scope, receive, responder.send)
+
+    def _compress_body(self, scope, coding: str, body: bytes, etag: Optional[str]) -> tuple:
+        """Compress a whole body, from the precompressed store when the path is static."""
+        path = scope.get("path", "")
+        if path not in self.precompressed_paths:
+            return _Encoder(coding, self.levels[coding]).compress(body, final=True), False
+
+        key = (path, coding, etag or body)
+        compressed = self._precompressed.get(key)
+        if compressed is not None:
+            return compressed, True
+        if len(self._precompressed) >= PRECOMPRESSED_MAX_ENTRIES:
+            self._precompressed.clear()
+        compressed = _Encoder(coding, 11 if coding == "br" else 9).compress(body, final=True)
+        self._precompressed[key] = compressed
+        return compressed, False
+
+    def _route(self, scope) -> str:
+        """Route template of the request, e.g. /tasks/{task_uuid}, for the stats."""
+        path = scope.get("path", "")
+        for name, value in scope.get("path_params", {}).items():
+            path = path.replace(str(value), "{" + name + "}", 1)
+        return path
+
+class _CompressionResponder:
+    """Per-request send wrapper: holds back the response start until the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, scope, coding: Optional[str], send):
+        self.middleware = middleware
+        self.scope = scope
+        self.coding = coding
+        self._send = send
+        self.start_message = None
+        self.encoder = None
+        self.passthrough = False
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_seconds = 0.0
+
+    def _eligible(self, message) -> bool:
+        if message["status"] < 200 or message["status"] in (204, 304):
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith(UNCOMPRESSIBLE_TYPES)
+
+    async def send(self, message):
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            if self._eligible(message):
+                self.start_message = message
+            else:
+                self.passthrough = True
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                # Too small to be worth it: identity, and the coding does not vary
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if self.coding is None:
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+
+            headers["Content-Encoding"] = self.coding
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+
+            if not more_body:
+                start = time.thread_time()
+                compressed, precompressed = self.middleware._compress_body(self.scope, self.coding, body, etag)
+                self.middleware.stats.record(
+                    self.middleware._route(self.scope), self.coding, len(body), len(compressed),
+                    time.thread_time() - start, precompressed
+                )
+                headers["Content-Length"] = str(len(compressed))
+                await self._send(self.start_message)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            # Streamed body: length unknown up front
+            del headers["Content-Length"]
+            self.encoder = _Encoder(self.coding, self.middleware.levels[self.coding])
+            await self._send(self.start_message)
+
+        start = time.thread_time()
+        compressed = self.encoder.compress(body, final=not more_body)
+        self.cpu_seconds += time.thread_time() - start
+        self.bytes_in += len(body)
+        self.bytes_out += len(compressed)
+        if not more_body:
+            self.middleware.stats.record(
+                self.middleware._route(self.scope), self.coding, self.bytes_in, self.bytes_out, self.cpu_seconds
+            )
+        if compressed or not more_body:
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
@@ -1,6 +1,6 @@
 import uuid
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, ARRAY
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, ARRAY, Index, text
 from datetime import datetime
 from models.base import Base
 from constants import Status, Priority
@@ -13,8 +13,31 @@ class Task(Base):
     created_date = Column(DateTime, default=datetime.utcnow)
     due_date = Column(DateTime, nullable=True, index=True)
     completed_date = Column(DateTime, nullable=True)
-    tags = Column(ARRAY(String), nullable=True, index=True)
+    tags = Column(ARRAY(String), nullable=True)
     status = Column(String, nullable=False, index=True)
     priority = Column(Integer, nullable=False, index=True)
     assigned_to = Column(UUID(as_uuid=True), ForeignKey("users.user_uuid"), nullable=True)
     deleted_date = Column(DateTime, nullable=True, index=True)
+    # Stamped on every insert and update, soft deletes included (GET /tasks/changes)
+    modified_date = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # Array operators (&&, @>) used by the tag filters
+        Index("ix_tasks_tags", "tags", postgresql_using="gin"),
+        # Keyset pagination order for GET /tasks, restricted to live tasks
+        Index(
+            "ix_tasks_due_created_uuid", "due_date", "created_date", "task_uuid",
+            postgresql_where=text("deleted_date IS NULL")
+        ),
+        Index(
+            "ix_tasks_assigned_due_created_uuid", "assigned_to", "due_date", "created_date", "task_uuid",
+            postgresql_where=text("deleted_date IS NULL")
+        ),
+        # Delta sync order, over deleted tasks too so they come back as tombstones
+        Index("ix_tasks_modified_uuid", "modified_date", "task_uuid"),
+        # Long-completed live tasks picked up by the archive job
+        Index(
+            "ix_tasks_done_completed_date", "completed_date",
+            postgresql_where=text("status = 'Done' AND deleted_date IS NULL")
+        ),
+    )
@@ -0,0 +1,28 @@
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Integer, ARRAY, Index
+from datetime import datetime
+from models.base import Base
+
+class TaskArchive(Base):
+    """Cold storage for deleted and long-completed tasks, partitioned by archive month."""
+    __tablename__ = "tasks_archive"
+    task_uuid = Column(UUID(as_uuid=True), primary_key=True, nullable=False)
+    archived_date = Column(DateTime, primary_key=True, default=datetime.utcnow)
+    title = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    created_date = Column(DateTime, nullable=True)
+    due_date = Column(DateTime, nullable=True)
+    completed_date = Column(DateTime, nullable=True)
+    tags = Column(ARRAY(String), nullable=True)
+    status = Column(String, nullable=False)
+    priority = Column(Integer, nullable=False)
+    assigned_to = Column(UUID(as_uuid=True), nullable=True)
+    deleted_date = Column(DateTime, nullable=True)
+    modified_date = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_tasks_archive_assigned_to", "assigned_to"),
+        # Archive moves reported by GET /tasks/changes, in feed order
+        Index("ix_tasks_archive_archived_uuid", "archived_date", "task_uuid"),
+        {"postgresql_partition_by": "RANGE (archived_date)"},
+    )
@@ -0,0 +1,13 @@
+import uuid
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer
+from models.base import Base
+
+# Counter key used for tasks that are not assigned to anyone
+UNASSIGNED = uuid.UUID(int=0)
+
+class TaskCounter(Base):
+    __tablename__ = "task_counters"
+    assigned_to = Column(UUID(as_uuid=True), primary_key=True, default=UNASSIGNED)
+    status = Column(String, primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0)
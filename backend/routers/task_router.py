@@ -1,12 +1,38 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel
-from db import get_db
+from datetime import date, datetime, timedelta
+from fastapi import (
+    APIRouter, BackgroundTasks, Depends, File, HTTPException, Request, Response, UploadFile, WebSocket,
+    status as ws_status
+)
+from starlette.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from db import SessionLocal, get_db
+from config.settings import settings
 from services.task_service import TaskService
+from services.task_archive_service import TaskArchiveService
+from services.task_export import EXPORT_MEDIA_TYPES, export_chunks
+from services.task_import_service import TaskImportService
+from services.task_events import TaskEventFilter, task_event_broker
+from services.task_stream import WS_TRY_AGAIN_LATER, sse_events, websocket_events
+from services.redis_service import redis_manager
+from services.user_service import UserService
+from authorization.auth_service import AuthService
+from services.task_list_cache import CACHE_MISS, CACHE_REFRESH, CACHE_STALE, render_task_list, task_list_cache
+from services.cache_service import cache_service
+from services.etags import (
+    PRIVATE_REVALIDATE, STATIC_REFERENCE, content_etag, etag_matches, not_modified, weak_etag
+)
+from services.pagination import ExpiredCursorError, InvalidCursorError, parse_ids
+from services.count_service import COUNT_MODES
 from models.task import Status, Priority
 from models.user import User
 from authorization.dependencies import get_current_active_user
-from dto.task_dto import TaskCreate, TaskUpdate, TaskResponse
+from dto.task_dto import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskSummary, TaskStats, TagCount, ArchivedTaskResponse,
+    TaskBulkCreate, TaskBulkPatch, TaskBulkPatchItem, TaskBulkDelete, TaskBulkResponse, TaskImportResponse,
+    TaskChanges, TaskExpandedResponse, dump_task, parse_task_expand, parse_task_fields
+)
 from constants import Status as TaskStatus
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
@@ -23,17 +49,436 @@ router = APIRouter(tags=["tasks"])
 class TaskAssignmentRequest(BaseModel):
     user_uuid: Optional[UUID] = None
 
+TASK_STATUSES = {
+    "TO_DO": TaskStatus.TO_DO,
+    "IN_PROGRESS": TaskStatus.IN_PROGRESS,
+    "DONE": TaskStatus.DONE
+}
+TASK_STATUSES_ETAG = weak_etag(sorted((key, value.value) for key, value in TASK_STATUSES.items()))
+
 @router.get("/statuses", response_model=Dict[str, str])
 def get_task_statuses(
     request: Request,
+    response: Response,
     rate_limit: dict = Depends(check_tasks_read_rate_limit)
 ):
     """Get all available task statuses for filtering."""
-    return {
-        "TO_DO": TaskStatus.TO_DO,
-        "IN_PROGRESS": TaskStatus.IN_PROGRESS,
-        "DONE": TaskStatus.DONE
-    }
+    if etag_matches(request, TASK_STATUSES_ETAG):
+        return not_modified(TASK_STATUSES_ETAG, STATIC_REFERENCE)
+    response.headers["ETag"] = TASK_STATUSES_ETAG
+    response.headers["Cache-Control"] = STATIC_REFERENCE
+    return TASK_STATUSES
+
+def _parse_tags(tags: Optional[str]) -> Optional[List[str]]:
+    if not tags:
+        return None
+    return list(dict.fromkeys(tag.strip() for tag in tags.split(",") if tag.strip())) or None
+
+# Filters shared by the task list and the tag facets
+def _task_filters(current_user, q, status, due_date_from, due_date_to, assigned_to_me, tags_any, tags_all):
+    filters = {}
+
+    if q:
+        filters['q'] = q
+    if status:
+        filters['status'] = status
+    if due_date_from:
+        filters['due_date_from'] = due_date_from
+    if due_date_to:
+        filters['due_date_to'] = due_date_to
+    if assigned_to_me:
+        filters['assigned_to'] = current_user.user_uuid
+    tags_any = _parse_tags(tags_any)
+    if tags_any:
+        filters['tags_any'] = tags_any
+    tags_all = _parse_tags(tags_all)
+    if tags_all:
+        filters['tags_all'] = tags_all
+
+    return filters
+
+@router.get("/summary", response_model=TaskSummary)
+def get_task_summary(
+    request: Request,
+    scope: str = "mine",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_read_rate_limit)
+):
+    """Get task counts by status for the current user ("mine") or everyone ("all")."""
+    if scope not in ("mine", "all"):
+        raise HTTPException(status_code=400, detail="scope must be one of: mine, all")
+
+    service = TaskService(db)
+    return service.get_task_summary(current_user.user_uuid if scope == "mine" else None)
+
+@router.get("/stats", response_model=TaskStats)
+def get_task_stats(
+    request: Request,
+    completed_from: Optional[date] = None,
+    completed_to: Optional[date] = None,
+    q: Optional[str] = None,
+    status: Optional[str] = None,
+    due_date_from: Optional[str] = None,
+    due_date_to: Optional[str] = None,
+    assigned_to_me: Optional[bool] = None,
+    tags_any: Optional[str] = None,
+    tags_all: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_read_rate_limit)
+):
+    """Get counts by status and priority, the overdue count and completions per day
+    (the last 30 days unless given) for the tasks matching the same filters as GET /tasks."""
+    completed_to = completed_to or datetime.utcnow().date()
+    completed_from = completed_from or completed_to - timedelta(days=29)
+    service = TaskService(db)
+    filters = _task_filters(
+        current_user, q, status, due_date_from, due_date_to, assigned_to_me, tags_any, tags_all
+    )
+    try:
+        return service.get_task_stats(completed_from, completed_to, **filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/tags", response_model=List[TagCount])
+def get_tag_facets(
+    request: Request,
+    limit: int = 50,
+    q: Optional[str] = None,
+    status: Optional[str] = None,
+    due_date_from: Optional[str] = None,
+    due_date_to: Optional[str] = None,
+    assigned_to_me: Optional[bool] = None,
+    tags_any: Optional[str] = None,
+    tags_all: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_read_rate_limit)
+):
+    """Get tag counts for the tasks matching the same filters as GET /tasks, most used first."""
+    service = TaskService(db)
+    filters = _task_filters(
+        current_user, q, status, due_date_from, due_date_to, assigned_to_me, tags_any, tags_all
+    )
+    try:
+        return service.get_tag_facets(limit=limit, **filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/export")
+def export_tasks(
+    request: Request,
+    format: str = "ndjson",
+    q: Optional[str] = None,
+    status: Optional[str] = None,
+    due_date_from: Optional[str] = None,
+    due_date_to: Optional[str] = None,
+    assigned_to_me: Optional[bool] = None,
+    tags_any: Optional[str] = None,
+    tags_all: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_read_rate_limit)
+):
+    """Stream every task matching the GET /tasks filters as NDJSON or CSV."""
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_MEDIA_TYPES)}")
+
+    service = TaskService(db)
+    filters = _task_filters(
+        current_user, q, status, due_date_from, due_date_to, assigned_to_me, tags_any, tags_all
+    )
+    try:
+        result = service.stream_tasks(settings.EXPORT_BATCH_SIZE, **filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        export_chunks(request, result, format, settings.EXPORT_BATCH_SIZE),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'}
+    )
+
+def _stream_filter(current_user_uuid, status, assigned_to_me, tags_any):
+    return TaskEventFilter(
+        assigned_to=current_user_uuid if assigned_to_me else None,
+        status=status,
+        tags_any=_parse_tags(tags_any)
+    )
+
+def _stream_unavailable() -> Optional[str]:
+    # Events reach this worker through Redis; without it a stream would stay silent
+    if not redis_manager.get_client():
+        return "Task stream is unavailable"
+    if task_event_broker.subscriber_count >= settings.STREAM_MAX_SUBSCRIBERS:
+        return "Too many task stream subscribers, please retry later"
+    return None
+
+@router.get("/stream")
+def stream_task_events(
+    request: Request,
+    status: Optional[str] = None,
+    assigned_to_me: Optional[bool] = None,
+    tags_any: Optional[str] = None,
+    last_event_id: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_read_rate_limit)
+):
+    """Stream task changes (created, updated, assigned, completed, deleted) as Server-Sent Events.
+
+    Optionally only tasks assigned to the caller, in a status, or with any
+    of the given tags. Reconnecting with Last-Event-ID (or last_event_id)
+    replays what was missed; a tasks.reset event means re-fetch the list.
+    """
+    event_filter = _stream_filter(current_user.user_uuid, status, assigned_to_me, tags_any)
+    unavailable = _stream_unavailable()
+    if unavailable:
+        raise HTTPException(
+            status_code=503, detail=unavailable, headers={"Retry-After": str(max(1, settings.STREAM_RETRY_MS // 1000))}
+        )
+    # The stream may stay open for hours; do not hold a pooled connection meanwhile
+    db.close()
+
+    return StreamingResponse(
+        sse_events(event_filter, request.headers.get("last-event-id") or last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _websocket_user_uuid(token: Optional[str]) -> Optional[UUID]:
+    if not token:
+        return None
+    db = SessionLocal()
+    try:
+        user = AuthService(UserService(db)).get_current_user(token)
+        return user.user_uuid if user else None
+    finally:
+        db.close()
+
+@router.websocket("/stream")
+async def stream_task_events_websocket(
+    websocket: WebSocket,
+    token: Optional[str] = None,
+    status: Optional[str] = None,
+    assigned_to_me: Optional[bool] = None,
+    tags_any: Optional[str] = None,
+    last_event_id: Optional[str] = None
+):
+    """The task change stream over a WebSocket, one JSON message per event.
+
+    Browsers cannot set headers on WebSockets, so the access token may be
+    passed as `token`. Heartbeats are {"type": "heartbeat"} messages; a
+    close with code 1013 means resume with last_event_id.
+    """
+    authorization = websocket.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    user_uuid = await run_in_threadpool(_websocket_user_uuid, token)
+    if user_uuid is None:
+        await websocket.close(code=ws_status.WS_1008_POLICY_VIOLATION, reason="Could not validate credentials")
+        return
+    event_filter = _stream_filter(user_uuid, status, assigned_to_me, tags_any)
+    unavailable = _stream_unavailable()
+    if unavailable:
+        await websocket.close(code=WS_TRY_AGAIN_LATER, reason=unavailable)
+        return
+
+    await websocket.accept()
+    await websocket_events(websocket, event_filter, last_event_id)
+
+@router.get("/changes", response_model=TaskChanges)
+def get_task_changes(
+    request: Request,
+    since: Optional[str] = None,
+    limit: int = 500,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_read_rate_limit)
+):
+    """Get tasks changed after the `since` cursor, for incremental sync.
+
+    Start without `since`, then pass back `next_cursor` each time; keep
+    going while `has_more` is true. Deleted tasks come back with
+    deleted_date set, archived ones with archived_date set. 410 means the cursor is too old: sync the full list again.
+    """
+    if not 1 <= limit <= settings.CHANGES_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {settings.CHANGES_MAX_LIMIT}")
+
+    service = TaskService(db)
+    try:
+        rows, next_cursor, has_more = service.get_changes(cursor=since, limit=limit)
+    except ExpiredCursorError as e:
+        raise HTTPException(status_code=410, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"changes": rows, "next_cursor": next_cursor, "has_more": has_more}
+
+@router.post("/import", response_model=TaskImportResponse)
+def import_tasks(
+    request: Request,
+    file: UploadFile = File(...),
+    format: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_write_rate_limit)
+):
+    """Import tasks from an uploaded CSV or NDJSON file (the export formats).
+
+    The format defaults to the file extension. Invalid rows, and lines that
+    are not UTF-8 or not parseable CSV, are skipped and reported by line
+    number; the first IMPORT_MAX_ERRORS are listed.
+    """
+    if format is None:
+        format = "csv" if (file.filename or "").lower().endswith(".csv") else "ndjson"
+
+    service = TaskImportService(db)
+    try:
+        return service.import_file(file.file, format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/archive", response_model=List[ArchivedTaskResponse])
+def get_archived_tasks(
+    request: Request,
+    skip: int = 0,
+    limit: int = 10,
+    assigned_to_me: Optional[bool] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_read_rate_limit)
+):
+    """Get archived (deleted or long-completed) tasks."""
+    if skip < 0:
+        raise HTTPException(status_code=400, detail="skip must not be negative")
+    if not 1 <= limit <= settings.ARCHIVE_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {settings.ARCHIVE_MAX_LIMIT}")
+
+    service = TaskArchiveService(db)
+    return service.get_archived_tasks(
+        skip=skip,
+        limit=limit,
+        assigned_to=current_user.user_uuid if assigned_to_me else None
+    )
+
+@router.get("/archive/{task_uuid}", response_model=ArchivedTaskResponse)
+def get_archived_task(
+    task_uuid: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_read_rate_limit)
+):
+    """Get a specific archived task."""
+    service = TaskArchiveService(db)
+    task = service.get_archived_task(task_uuid)
+    if not task:
+        raise HTTPException(status_code=404, detail="Archived task not found")
+    return task
+
+@router.post("/archive/{task_uuid}/restore", response_model=TaskResponse)
+def restore_archived_task(
+    task_uuid: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_write_rate_limit)
+):
+    """Restore an archived task as a live task."""
+    service = TaskArchiveService(db)
+    restored = service.restore_task(task_uuid)
+    if not restored:
+        raise HTTPException(status_code=404, detail="Archived task not found")
+    return restored
+
+def _check_bulk_size(count: int):
+    if count > settings.BULK_MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.BULK_MAX_BATCH_SIZE} items are allowed per request"
+        )
+
+# Validate bulk items one by one, collecting errors by index instead of failing the request
+def _validate_bulk_items(model, items):
+    valid, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, model(**item)))
+        except ValidationError as e:
+            detail = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+            errors.append({"index": index, "detail": detail})
+    return valid, errors
+
+@router.post("/bulk", response_model=TaskBulkResponse)
+def create_tasks_bulk(
+    bulk: TaskBulkCreate,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_write_rate_limit)
+):
+    """Create many tasks in one transaction; invalid items are reported in `errors` by index."""
+    _check_bulk_size(len(bulk.items))
+    valid, errors = _validate_bulk_items(TaskCreate, bulk.items)
+
+    service = TaskService(db)
+    tasks, item_errors = service.create_tasks([(index, task.dict()) for index, task in valid])
+    return {"tasks": tasks, "errors": sorted(errors + item_errors, key=lambda error: error["index"])}
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+def update_tasks_bulk(
+    bulk: TaskBulkPatch,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_write_rate_limit)
+):
+    """Partially update many tasks in one transaction.
+
+    Send either `items` (each with a task_uuid and the fields to change) or
+    an `update` applied to every task matching `filter` (the GET /tasks
+    filters). A filter matching more than the batch limit is rejected.
+    """
+    service = TaskService(db)
+
+    if bulk.items is not None:
+        if bulk.filter or bulk.update:
+            raise HTTPException(status_code=400, detail="Send either items or filter and update, not both")
+        _check_bulk_size(len(bulk.items))
+        valid, errors = _validate_bulk_items(TaskBulkPatchItem, bulk.items)
+        tasks, item_errors = service.update_tasks([
+            (index, item.task_uuid, item.dict(exclude_unset=True, exclude={"task_uuid"}))
+            for index, item in valid
+        ])
+        return {"tasks": tasks, "errors": sorted(errors + item_errors, key=lambda error: error["index"])}
+
+    if not bulk.filter or not bulk.update:
+        raise HTTPException(status_code=400, detail="Send either items or filter and update")
+    filters = _task_filters(current_user, **bulk.filter.dict())
+    if not filters:
+        raise HTTPException(status_code=400, detail="filter must not be empty")
+    try:
+        tasks = service.update_tasks_matching(
+            bulk.update.dict(exclude_unset=True), settings.BULK_MAX_BATCH_SIZE, **filters
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"tasks": tasks, "errors": []}
+
+@router.delete("/bulk", response_model=TaskBulkResponse)
+def delete_tasks_bulk(
+    bulk: TaskBulkDelete,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    rate_limit: dict = Depends(check_tasks_delete_rate_limit)
+):
+    """Soft delete many tasks in one transaction; unknown tasks are reported in `errors`."""
+    _check_bulk_size(len(bulk.task_uuids))
+    service = TaskService(db)
+    tasks, errors = service.delete_tasks(bulk.task_uuids)
+    return {"tasks": tasks, "errors": errors}
 
 @router.post("/", response_model=TaskResponse)
 def create_task(
@@ -51,48 +496,146 @@ def create_task(
 @router.get("/", response_model=List[TaskResponse])
 def get_tasks(
     request: Request,
+    background_tasks: BackgroundTasks,
     skip: int = 0, 
     limit: int = 10, 
+    cursor: Optional[str] = None,
+    total: Optional[str] = None,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    ids: Optional[str] = None,
+    q: Optional[str] = None,
     status: Optional[str] = None, 
     due_date_from: Optional[str] = None,
     due_date_to: Optional[str] = None,
     assigned_to_me: Optional[bool] = None,
+    tags_any: Optional[str] = None,
+    tags_all: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     rate_limit: dict = Depends(check_tasks_read_rate_limit)
 ):
-    """Get tasks with filtering options and rate limiting."""
+    """Get tasks with filtering options and rate limiting.
+
+    Pass the X-Next-Cursor header of a page as `cursor` to fetch the next one;
+    `skip` is ignored when a cursor is given. Set `total` to "exact" (cached)
+    or "estimated" (planner estimate) to get X-Total-Count. `fields` is a
+    comma separated subset of TaskResponse fields to return. Responses carry
+    a weak ETag that changes with any task write; a matching If-None-Match
+    gets an empty 304 without running the query. Pages are cached in Redis
+    and may be served stale while they are re-rendered; X-Cache says
+    whether the page was a hit, a miss or stale. `q` searches
+    title and description (prefix matching); results are then ordered by
+    relevance instead of due date. `tags_any` / `tags_all` are comma separated
+    tags of which a task must have at least one / all. `ids` (comma separated
+    UUIDs) fetches just those tasks in one query, all on one page.
+    `expand=assignee` embeds each task's assignee as {user_uuid, username,
+    name} (null when unassigned), joined in by the same query.
+    """
+    if total and total not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"total must be one of: {', '.join(COUNT_MODES)}")
+    try:
+        task_fields = parse_task_fields(fields)
+        task_expand = parse_task_expand(expand)
+        task_ids = parse_ids(ids, settings.BULK_MAX_IDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     service = TaskService(db)
-    filters = {}
-    
-    if status:
-        filters['status'] = status
-    if due_date_from:
-        filters['due_date_from'] = due_date_from
-    if due_date_to:
-        filters['due_date_to'] = due_date_to
-    if assigned_to_me:
-        filters['assigned_to'] = current_user.user_uuid
-    
-    return service.get_tasks_filtered(
-        skip=skip, 
-        limit=limit, 
-        **filters
+    filters = _task_filters(
+        current_user, q, status, due_date_from, due_date_to, assigned_to_me, tags_any, tags_all
     )
+    if task_ids:
+        filters['ids'] = task_ids
+        limit = max(limit, len(task_ids))
+    page = dict(skip=skip, limit=limit, cursor=cursor, fields=task_fields, expand=task_expand)
+    # Embedded users change with user writes, which the tasks version does not follow
+    users_version = cache_service.get_version(UserService.CACHE_NAMESPACE) if task_expand else None
 
-@router.get("/{task_uuid}", response_model=TaskResponse)
+    # Checked before querying: a match costs one Redis read
+    version = cache_service.get_version(TaskService.CACHE_NAMESPACE)
+    etag = service.get_list_etag(
+        version, user=current_user.user_uuid, total=total, users_version=users_version, **page, **filters
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    signature = cache_service.signature(user=current_user.user_uuid, users_version=users_version, **page, **filters)
+    outcome, entry = task_list_cache.lookup(signature, version) if version is not None else (CACHE_MISS, None)
+    if outcome == CACHE_MISS:
+        try:
+            body, next_cursor = render_task_list(service, filters=filters, **page)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            # An outdated entry comes back as a miss only to the request holding the refresh lock
+            if entry:
+                task_list_cache.release(signature)
+        if version is not None:
+            task_list_cache.store(signature, version, body, next_cursor)
+    else:
+        body, next_cursor = entry["body"], entry["next_cursor"] or None
+        # A stale page gets the validator of the version it was rendered at
+        etag = service.get_list_etag(
+            int(entry["version"]), user=current_user.user_uuid, total=total, users_version=users_version, **page, **filters
+        )
+        if outcome == CACHE_REFRESH:
+            background_tasks.add_task(task_list_cache.refresh, signature, filters=filters, **page)
+    if version is not None:
+        task_list_cache.record(outcome)
+
+    headers = {"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE} if etag else {}
+    headers["X-Cache"] = CACHE_STALE if outcome == CACHE_REFRESH else outcome
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    if total:
+        headers["X-Total-Count"] = str(service.count_tasks_filtered(mode=total, **filters))
+
+    # Bodies are rendered (or cached) already serialized, trimmed to `fields` if given
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get("/{task_uuid}", response_model=TaskResponse, responses={200: {"model": TaskExpandedResponse}})
 def get_task(
     task_uuid: UUID,
     request: Request,
+    response: Response,
+    expand: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     rate_limit: dict = Depends(check_tasks_read_rate_limit)
 ):
-    """Get a specific task with rate limiting."""
+    """Get a specific task with rate limiting.
+
+    Sends a weak ETag over the task's content; a matching If-None-Match gets
+    an empty 304. `expand=assignee` embeds the assignee, read with the task
+    in one joined query.
+    """
+    try:
+        task_expand = parse_task_expand(expand)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     service = TaskService(db)
+    if task_expand:
+        task = service.get_task_expanded(task_uuid)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+        etag = content_etag(task, task._fields)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        return Response(
+            content=dump_task(task, task_expand), media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE}
+        )
+
     task = service.get_task(task_uuid)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+
+    etag = content_etag(task, TaskResponse.model_fields)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PRIVATE_REVALIDATE
     return task
 
 @router.put("/{task_uuid}", response_model=TaskResponse)
@@ -138,18 +681,11 @@ def assign_task(
     """Assign or unassign a task to/from a user with rate limiting."""
     service = TaskService(db)
     
-    # Get the user_uuid from the request body
-    user_uuid = assignment_data.user_uuid
-    
-    # Validate that the user exists if user_uuid is provided
-    if user_uuid:
-        from services.user_service import UserService
-        user_service = UserService(db)
-        user = user_service.get_user(user_uuid)
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-    
-    assigned = service.assign_task(task_uuid, user_uuid)
+    # The assignee is checked by the UPDATE itself
+    try:
+        assigned = service.assign_task(task_uuid, assignment_data.user_uuid)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     if not assigned:
         raise HTTPException(status_code=404, detail="Task not found")
     return assigned
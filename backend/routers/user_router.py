@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from uuid import UUID
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from db import get_db
 from services.user_service import UserService
 from models.user import User
 from dto.user_dto import UserCreate, UserUpdate, UserResponse
 from authorization.dependencies import get_current_active_user
+from services.count_service import COUNT_MODES
+from services.pagination import parse_ids
+from config.settings import settings
+from services.etags import PRIVATE_REVALIDATE, content_etag, etag_matches, not_modified
 
 router = APIRouter(tags=["users"])
 
@@ -37,13 +41,33 @@ def create_user(
     created = service.create_user(**user.model_dump())
     return created
 
+@router.get("/search", response_model=List[UserResponse])
+def search_users(
+    q: str,
+    limit: int = 10,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Typeahead search: users whose username, name or email contains `q`, best matches first.
+
+    Terms shorter than 3 characters match prefixes only.
+    """
+    if limit < 1 or limit > settings.USER_SEARCH_MAX_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"limit must be between 1 and {settings.USER_SEARCH_MAX_LIMIT}"
+        )
+    return UserService(db).search_users(q, limit=limit)
+
 @router.get("/{user_uuid}", response_model=UserResponse)
 def get_user(
     user_uuid: UUID, 
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Get a user by UUID."""
+    """Get a user by UUID; a matching If-None-Match gets an empty 304."""
     service = UserService(db)
     user = service.get_user(user_uuid)
     if not user:
@@ -51,18 +75,44 @@ def get_user(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="User not found"
         )
+
+    etag = content_etag(user, UserResponse.model_fields)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PRIVATE_REVALIDATE
     return user
 
 @router.get("/", response_model=List[UserResponse])
 def get_users(
+    response: Response,
     skip: int = 0, 
     limit: int = 10, 
+    total: Optional[str] = None,
+    ids: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Get all users with pagination."""
+    """Get all users with pagination; `total` ("exact" or "estimated") adds X-Total-Count.
+
+    `ids` (comma separated UUIDs) fetches just those users in one query
+    instead of a GET /users/{id} each; unknown or deleted ones are left out.
+    """
+    if total and total not in COUNT_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"total must be one of: {', '.join(COUNT_MODES)}"
+        )
+    try:
+        user_ids = parse_ids(ids, settings.BULK_MAX_IDS)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     service = UserService(db)
-    return service.get_users(skip=skip, limit=limit)
+    users = service.get_users(skip=skip, limit=limit, ids=user_ids)
+    if total:
+        response.headers["X-Total-Count"] = str(service.get_user_count(mode=total))
+    return users
 
 @router.put("/{user_uuid}", response_model=UserResponse)
 def update_user(
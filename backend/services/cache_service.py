@@ -0,0 +1,199 @@
+import hashlib
+import json
+import orjson
+import time
+import logging
+from typing import Any, Optional
+import redis
+from services.redis_service import redis_manager
+
+logger = logging.getLogger(__name__)
+
+class CacheService:
+    """JSON cache on top of Redis with per-namespace version counters.
+
+    Writers bump the version of a namespace instead of deleting keys; readers
+    embed the current version in their cache keys, so every entry written
+    before the bump simply stops being read and expires on its own.
+    """
+
+    def __init__(self, prefix: str = "cache"):
+        self.prefix = prefix
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.prefix}:version:{namespace}"
+
+    @staticmethod
+    def signature(**parts: Any) -> str:
+        """Stable short hash of a set of parameters (filters, pagination, caller)."""
+        normalized = {key: value for key, value in parts.items() if value is not None}
+        payload = json.dumps(normalized, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def get_version(self, namespace: str) -> Optional[int]:
+        """Get the current version of a namespace, or None if Redis is unavailable."""
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return None
+        try:
+            key = self._version_key(namespace)
+            version = redis_client.get(key)
+            if version is None:
+                # Start from the clock so versions never repeat after Redis loses its data;
+                # ETags built from them must not match responses from before the loss
+                redis_client.set(key, int(time.time() * 1000), nx=True)
+                version = redis_client.get(key)
+            return int(version) if version else 0
+        except Exception as e:
+            logger.error(f"Cache version lookup error: {e}")
+            return None
+
+    def bump_version(self, namespace: str) -> None:
+        """Invalidate every entry cached under a namespace."""
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return
+        try:
+            redis_client.incr(self._version_key(namespace))
+        except Exception as e:
+            logger.error(f"Cache version bump error: {e}")
+
+    def versioned_key(self, namespace: str, kind: str, signature: str) -> Optional[str]:
+        """Build a cache key bound to the current namespace version."""
+        version = self.get_version(namespace)
+        if version is None:
+            return None
+        return f"{self.prefix}:{namespace}:{kind}:v{version}:{signature}"
+
+    def get_json(self, key: str) -> Optional[Any]:
+        """Read a JSON value, returning None on miss or Redis failure."""
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return None
+        try:
+            value = redis_client.get(key)
+            return orjson.loads(value) if value is not None else None
+        except Exception as e:
+            logger.error(f"Cache read error: {e}")
+            return None
+
+    def set_json(self, key: str, value: Any, ttl: int) -> None:
+        """Store a JSON value with a TTL in seconds."""
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return
+        try:
+            redis_client.set(key, orjson.dumps(value, default=str), ex=ttl)
+        except Exception as e:
+            logger.error(f"Cache write error: {e}")
+
+    def set_json_at_version(self, key: str, value: Any, ttl: int, namespace: str, version: int) -> bool:
+        """Store a JSON value only if the namespace is still at version.
+
+        For read-through fills: a value read from the database before a
+        concurrent write must not be cached after that write's invalidation.
+        """
+        redis_client = redis_manager.get_client()
+        if not redis_client or version is None:
+            return False
+        try:
+            with redis_client.pipeline() as pipe:
+                version_key = self._version_key(namespace)
+                pipe.watch(version_key)
+                if int(pipe.get(version_key) or 0) != version:
+                    return False
+                pipe.multi()
+                pipe.set(key, orjson.dumps(value, default=str), ex=ttl)
+                pipe.execute()
+            return True
+        except redis.WatchError:
+            return False
+        except Exception as e:
+            logger.error(f"Cache write error: {e}")
+            return False
+
+    def delete(self, *keys: str) -> None:
+        redis_client = redis_manager.get_client()
+        if not redis_client or not keys:
+            return
+        try:
+            redis_client.delete(*keys)
+        except Exception as e:
+            logger.error(f"Cache delete error: {e}")
+
+    def publish(self, channel: str, message: str) -> None:
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return
+        try:
+            redis_client.publish(f"{self.prefix}:{channel}", message)
+        except Exception as e:
+            logger.error(f"Cache publish error: {e}")
+
+    def get_hash(self, key: str) -> Optional[dict]:
+        """Read every field of a hash, returning None on miss or Redis failure."""
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return None
+        try:
+            return redis_client.hgetall(key) or None
+        except Exception as e:
+            logger.error(f"Cache read error: {e}")
+            return None
+
+    def set_hash(self, key: str, mapping: dict, ttl: int) -> None:
+        """Replace a hash with the given fields and a TTL in seconds."""
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return
+        try:
+            pipe = redis_client.pipeline()
+            pipe.delete(key)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache write error: {e}")
+
+    def acquire_lock(self, key: str, ttl: int) -> bool:
+        """Take a short-lived lock with SET NX; False if held elsewhere or Redis is down."""
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return False
+        try:
+            return bool(redis_client.set(f"{self.prefix}:lock:{key}", 1, nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Cache lock error: {e}")
+            return False
+
+    def release_lock(self, key: str) -> None:
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return
+        try:
+            redis_client.delete(f"{self.prefix}:lock:{key}")
+        except Exception as e:
+            logger.error(f"Cache lock error: {e}")
+
+    def incr_metric(self, name: str, field: str) -> None:
+        """Count an event (hit, miss, ...) in a per-cache metrics hash."""
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return
+        try:
+            redis_client.hincrby(f"{self.prefix}:metrics:{name}", field, 1)
+        except Exception as e:
+            logger.error(f"Cache metrics error: {e}")
+
+    def get_metrics(self, name: str) -> dict:
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return {}
+        try:
+            return {field: int(count) for field, count in redis_client.hgetall(f"{self.prefix}:metrics:{name}").items()}
+        except Exception as e:
+            logger.error(f"Cache metrics error: {e}")
+            return {}
+
+# Global cache service instance
+cache_service = CacheService()
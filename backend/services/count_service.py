@@ -0,0 +1,75 @@
+import json
+import logging
+from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from services.cache_service import cache_service
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+COUNT_MODE_EXACT = "exact"
+COUNT_MODE_ESTIMATED = "estimated"
+COUNT_MODES = (COUNT_MODE_EXACT, COUNT_MODE_ESTIMATED)
+
+class _ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper so bound parameters are processed as usual."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+class CountService:
+    """Total row counts for list endpoints.
+
+    Exact counts are cached in Redis under the namespace version, so any write
+    that bumps the version invalidates them. Estimated counts come from the
+    PostgreSQL planner's row estimate and never scan the table.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def count(self, statement, namespace: str, signature: str, mode: str = COUNT_MODE_EXACT) -> int:
+        """Count the rows a SELECT would return, using the requested mode."""
+        statement = statement.order_by(None).limit(None).offset(None)
+
+        if mode == COUNT_MODE_ESTIMATED and self.db.get_bind().dialect.name == "postgresql":
+            estimate = self._estimate(statement)
+            if estimate is not None:
+                return estimate
+
+        return self._cached_exact(statement, namespace, signature)
+
+    def _cached_exact(self, statement, namespace: str, signature: str) -> int:
+        key = cache_service.versioned_key(namespace, "count", signature)
+        if key:
+            cached = cache_service.get_json(key)
+            if cached is not None:
+                return cached
+
+        total = self.db.execute(
+            select(func.count()).select_from(statement.subquery())
+        ).scalar_one()
+
+        if key:
+            cache_service.set_json(key, total, settings.CACHE_COUNT_TTL)
+        return total
+
+    def _estimate(self, statement) -> Optional[int]:
+        try:
+            # Savepoint keeps a failed EXPLAIN from aborting the outer transaction
+            with self.db.begin_nested():
+                plan = self.db.execute(_ExplainJSON(statement)).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            logger.error(f"Row estimate failed, falling back to exact count: {e}")
+            return None
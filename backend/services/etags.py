@@ -0,0 +1,31 @@
+import hashlib
+from typing import Iterable, Optional
+from fastapi import Request, Response
+
+# Per-user responses: the browser may store them but must revalidate every time
+PRIVATE_REVALIDATE = "private, no-cache"
+# Reference data that only changes with a deploy
+STATIC_REFERENCE = "public, max-age=86400"
+
+def weak_etag(*parts) -> str:
+    """Weak ETag from a version counter, a filter signature or row content."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+def content_etag(entity, fields: Iterable[str]) -> str:
+    """Weak ETag over the response fields of an entity (ORM object or row)."""
+    return weak_etag(*(getattr(entity, name) for name in fields))
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """Weak comparison of etag with the request's If-None-Match header."""
+    header = request.headers.get("if-none-match")
+    if not etag or not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+def not_modified(etag: str, cache_control: str = PRIVATE_REVALIDATE) -> Response:
+    """Empty 304 response carrying the current validators."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
@@ -0,0 +1,74 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class ExpiredCursorError(InvalidCursorError):
+    """Raised when a cursor points further back than the data needed to resume from it is kept."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode an opaque cursor back into its raw sort key values."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Invalid cursor")
+    return values
+
+
+def parse_cursor_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a datetime stored in a cursor."""
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def parse_cursor_uuid(value: str) -> UUID:
+    """Parse a UUID stored in a cursor."""
+    try:
+        return UUID(value)
+    except (TypeError, ValueError, AttributeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def parse_ids(ids: Optional[str], max_count: int) -> Optional[List[UUID]]:
+    """Parse a comma separated `ids=` value of UUIDs for a batch fetch.
+
+    Raises ValueError on malformed UUIDs or more than max_count of them.
+    """
+    if not ids:
+        return None
+    values = list(dict.fromkeys(value.strip() for value in ids.split(",") if value.strip()))
+    if len(values) > max_count:
+        raise ValueError(f"At most {max_count} ids per request")
+    try:
+        return [UUID(value) for value in values] or None
+    except ValueError:
+        raise ValueError("ids must be comma separated UUIDs")
@@ -0,0 +1,335 @@
+import heapq
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+import orjson
+import redis
+from sqlalchemy import select
+from models.task import Task, Status
+from services.redis_service import redis_manager
+from services.task_events import EVENT_DUE, EVENT_RESET, STREAM_KEY, due_event_payload
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Held by the one active scheduler; the value identifies which replica holds it
+LEASE_KEY = "reminders:lease"
+# (due_date, task_uuid) of the last reminder fired, so a new leader neither repeats nor skips any
+WATERMARK_KEY = "reminders:fired_until"
+
+_TASKS = Task.__table__
+_MAX_UUID = UUID(int=2 ** 128 - 1)
+
+def _naive_utc(value: datetime) -> datetime:
+    # Due dates are compared as naive UTC, like datetime.utcnow(), whatever the column type returns
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return _naive_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+
+def _encode_watermark(key: Tuple[datetime, UUID]) -> str:
+    return f"{key[0].isoformat()}|{key[1]}"
+
+def _decode_watermark(value: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+    if not value:
+        return None
+    due_date, _, task_uuid = value.partition("|")
+    try:
+        return _parse_datetime(due_date), UUID(task_uuid)
+    except ValueError:
+        return None
+
+class SchedulerLease:
+    """Redis lease (SET NX PX) that makes one scheduler active across replicas.
+
+    The holder renews it well before it expires. Renewal checks the token
+    under WATCH, so a scheduler that lost the lease (paused past the TTL)
+    cannot renew it or write anything queued with the renewal.
+    """
+
+    def __init__(self, key: str, ttl_ms: int, token: Optional[str] = None):
+        self.key = key
+        self.ttl_ms = ttl_ms
+        self.token = token or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.held = False
+
+    def acquire(self, redis_client) -> bool:
+        self.held = bool(redis_client.set(self.key, self.token, nx=True, px=self.ttl_ms))
+        return self.held
+
+    def renew(self, redis_client, also: Optional[Callable] = None) -> bool:
+        """Extend the lease if still held, running `also(pipe)` in the same transaction."""
+        try:
+            with redis_client.pipeline() as pipe:
+                pipe.watch(self.key)
+                if pipe.get(self.key) != self.token:
+                    self.held = False
+                    return False
+                pipe.multi()
+                pipe.pexpire(self.key, self.ttl_ms)
+                if also is not None:
+                    also(pipe)
+                pipe.execute()
+        except redis.WatchError:
+            self.held = False
+            return False
+        self.held = True
+        return True
+
+    def release(self, redis_client) -> None:
+        try:
+            with redis_client.pipeline() as pipe:
+                pipe.watch(self.key)
+                if pipe.get(self.key) == self.token:
+                    pipe.multi()
+                    pipe.delete(self.key)
+                    pipe.execute()
+        except redis.WatchError:
+            pass
+        self.held = False
+
+class ReminderQueue:
+    """Due dates of the loaded horizon, earliest first.
+
+    A heap of (due_date, task_uuid) with lazy deletion: `_due` has each
+    task's current due date, and heap entries that no longer match it are
+    dropped when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, UUID]] = []
+        self._due = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._due.clear()
+
+    def schedule(self, task_uuid: UUID, due_date: datetime) -> None:
+        if self._due.get(task_uuid) == due_date:
+            return
+        self._due[task_uuid] = due_date
+        heapq.heappush(self._heap, (due_date, task_uuid))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            # Tasks rescheduled many times leave stale entries behind
+            self._heap = [(due, key) for key, due in self._due.items()]
+            heapq.heapify(self._heap)
+
+    def cancel(self, task_uuid: UUID) -> None:
+        self._due.pop(task_uuid, None)
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[datetime]:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[Tuple[datetime, UUID]]:
+        """Remove and return the entries due at or before `now`, in order."""
+        due = []
+        self._drop_stale()
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            del self._due[entry[1]]
+            due.append(entry)
+            self._drop_stale()
+        return due
+
+class DueReminderScheduler:
+    """Fires a task.due event on the task event stream when a task comes due.
+
+    Only the next REMINDER_HORIZON_SECONDS of due dates of open tasks are
+    loaded, through the due-date index, into a ReminderQueue; the window
+    slides forward as time passes. Task changes are followed on the task
+    event stream and applied to the queue, and a tasks.reset event (import,
+    archiving) reloads it. Before firing, the tasks are read again so a
+    reminder never goes out for a task that was completed, deleted or
+    rescheduled in the meantime.
+
+    Every replica may run a scheduler; the one holding the SchedulerLease
+    is active and the others wait to take over. Reminders are appended to
+    the stream in the same fenced transaction that advances the watermark,
+    so a new leader starts right after the last reminder fired.
+    """
+
+    def __init__(self, session_factory, lease: Optional[SchedulerLease] = None):
+        self.session_factory = session_factory
+        self.lease = lease or SchedulerLease(LEASE_KEY, settings.REMINDER_LEASE_TTL_SECONDS * 1000)
+        self.queue = ReminderQueue()
+        self.watermark: Optional[Tuple[datetime, UUID]] = None
+        self.loaded_until: Optional[Tuple[datetime, UUID]] = None
+        self.stream_id = None
+        self._renew_at = 0.0
+        self._stopped = threading.Event()
+        self.stats = {"fired": 0, "skipped": 0, "loads": 0, "events": 0, "takeovers": 0}
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def run(self) -> None:
+        """Schedule until stop() is called, giving up the lease on the way out."""
+        try:
+            while not self._stopped.is_set():
+                redis_client = redis_manager.get_client()
+                if not redis_client:
+                    # No lease without Redis, and no way to tell if another replica is firing
+                    self.lease.held = False
+                    self._stopped.wait(5)
+                    continue
+                try:
+                    self.step(redis_client)
+                except Exception as e:
+                    logger.error(f"Reminder scheduler error: {e}")
+                    self.lease.held = False
+                    self._stopped.wait(1)
+        finally:
+            redis_client = redis_manager.get_client()
+            if redis_client and self.lease.held:
+                self.lease.release(redis_client)
+            logger.info(f"Reminder scheduler stopped: {self.stats}")
+
+    def step(self, redis_client) -> None:
+        """One round: keep the lease, fire what is due, then wait for events until the next due date."""
+        now = datetime.utcnow()
+        if not self.lease.held:
+            if not self.lease.acquire(redis_client):
+                self._stopped.wait(self.lease.ttl_ms / 3000)
+                return
+            self.take_over(redis_client, now)
+        elif time.monotonic() >= self._renew_at:
+            if not self.lease.renew(redis_client):
+                logger.warning("Reminder scheduler lost its lease")
+                return
+        self._renew_at = time.monotonic() + self.lease.ttl_ms / 3000
+
+        self.fire_due(redis_client, now)
+        if self.loaded_until[0] < now + timedelta(seconds=settings.REMINDER_HORIZON_SECONDS / 2):
+            self.load(now)
+
+        wait = self.lease.ttl_ms / 3000
+        next_due = self.queue.next_due()
+        if next_due is not None:
+            wait = min(wait, max((next_due - datetime.utcnow()).total_seconds(), 0))
+        self.follow(redis_client, wait)
+
+    def take_over(self, redis_client, now: datetime) -> None:
+        self.stats["takeovers"] += 1
+        logger.info(f"Reminder scheduler {self.lease.token} is now active")
+        # Stream position first: every change committed after the load shows up as an event
+        newest = redis_client.xrevrange(STREAM_KEY, count=1)
+        self.stream_id = newest[0][0] if newest else "0-0"
+        earliest = (now - timedelta(seconds=settings.REMINDER_CATCH_UP_SECONDS), _MAX_UUID)
+        watermark = _decode_watermark(redis_client.get(WATERMARK_KEY))
+        # Reminders missed while no scheduler was active go out late, up to the catch-up window
+        self.watermark = max(watermark, earliest) if watermark else (now, _MAX_UUID)
+        self.reload(now)
+
+    def reload(self, now: datetime) -> None:
+        self.queue.clear()
+        self.loaded_until = self.watermark
+        self.load(now)
+
+    def load(self, now: datetime) -> None:
+        """Load open tasks due after the loaded window, up to the horizon."""
+        horizon = now + timedelta(seconds=settings.REMINDER_HORIZON_SECONDS)
+        limit = settings.REMINDER_MAX_LOADED - len(self.queue)
+        if limit <= 0:
+            return
+        stmt = select(_TASKS.c.task_uuid, _TASKS.c.due_date).where(
+            _TASKS.c.deleted_date == None,
+            _TASKS.c.status != Status.DONE.value,
+            _TASKS.c.due_date >= self.loaded_until[0],
+            _TASKS.c.due_date <= horizon
+        ).order_by(_TASKS.c.due_date, _TASKS.c.task_uuid).limit(limit + 1)
+        db = self.session_factory()
+        try:
+            rows = [(_naive_utc(due_date), task_uuid) for task_uuid, due_date in db.execute(stmt)]
+        finally:
+            db.close()
+        rows = [row for row in rows if row > self.loaded_until]
+        for due_date, task_uuid in rows[:limit]:
+            self.queue.schedule(task_uuid, due_date)
+        # A full queue covers the window only up to the last task loaded
+        if len(rows) > limit:
+            self.loaded_until = rows[limit - 1]
+        else:
+            self.loaded_until = (horizon, _MAX_UUID)
+        self.stats["loads"] += 1
+
+    def follow(self, redis_client, timeout: float) -> None:
+        """Apply task events from the stream, blocking up to `timeout` seconds for the first."""
+        response = redis_client.xread({STREAM_KEY: self.stream_id}, count=500, block=max(int(timeout * 1000), 1))
+        if not response:
+            return
+        entries = response[0][1]
+        self.stream_id = entries[-1][0]
+        for _, fields in entries:
+            self.apply(orjson.loads(fields["event"]))
+
+    def apply(self, event: dict) -> None:
+        """Bring the queue in line with one task event."""
+        self.stats["events"] += 1
+        if event["type"] == EVENT_RESET:
+            self.reload(datetime.utcnow())
+            return
+        if event["type"] == EVENT_DUE:
+            return
+        task = event["task"]
+        task_uuid = UUID(task["task_uuid"])
+        due_date = _parse_datetime(task["due_date"])
+        if (
+            due_date is None or task["deleted_date"] is not None or task["status"] == Status.DONE.value
+            or not self.watermark < (due_date, task_uuid) <= self.loaded_until
+        ):
+            self.queue.cancel(task_uuid)
+        else:
+            self.queue.schedule(task_uuid, due_date)
+
+    def fire_due(self, redis_client, now: datetime) -> None:
+        due = self.queue.pop_due(now)
+        if not due:
+            return
+        db = self.session_factory()
+        try:
+            rows = db.execute(select(_TASKS.c).where(
+                _TASKS.c.task_uuid.in_([task_uuid for _, task_uuid in due]),
+                _TASKS.c.deleted_date == None,
+                _TASKS.c.status != Status.DONE.value
+            )).all()
+        finally:
+            db.close()
+        scheduled = dict((task_uuid, due_date) for due_date, task_uuid in due)
+        rows = sorted(
+            (row for row in rows if _naive_utc(row.due_date) == scheduled[row.task_uuid]),
+            key=lambda row: (_naive_utc(row.due_date), row.task_uuid)
+        )
+        watermark = max(self.watermark, due[-1])
+
+        def append(pipe):
+            for row in rows:
+                pipe.xadd(STREAM_KEY, {"event": due_event_payload(row)}, maxlen=settings.STREAM_MAX_LENGTH, approximate=True)
+            pipe.set(WATERMARK_KEY, _encode_watermark(watermark))
+
+        if not self.lease.renew(redis_client, append):
+            # Another scheduler took over; it fires these from the shared watermark
+            logger.warning("Reminder scheduler lost its lease before firing")
+            return
+        self.watermark = watermark
+        self.stats["fired"] += len(rows)
+        self.stats["skipped"] += len(due) - len(rows)
+        if rows:
+            logger.info(f"Fired {len(rows)} due reminders")
@@ -0,0 +1,164 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import and_, delete, insert, literal, or_, select, text
+from sqlalchemy.orm import Session
+from models.task import Task
+from models.task_archive import TaskArchive
+from constants import Status
+from services.cache_service import cache_service
+from services.task_entity_cache import task_entity_cache
+from services.task_counter_service import TaskCounterService
+from services.task_events import task_event_broker
+from services.task_service import TaskService
+from config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+TASK_COLUMNS = [column.name for column in Task.__table__.c]
+
+class TaskArchiveService:
+    """Moves dead tasks out of the hot tasks table into tasks_archive.
+
+    A task is archived once it has been soft deleted for
+    ARCHIVE_DELETED_RETENTION_DAYS, or completed (and still live) for
+    ARCHIVE_COMPLETED_RETENTION_DAYS. Each batch is a single
+    DELETE ... RETURNING feeding an INSERT, committed on its own, so row
+    locks are held for one batch at a time.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._partitions = set()
+
+    def archive_expired(self, batch_size: Optional[int] = None, max_batches: Optional[int] = None) -> int:
+        """Archive every expired task, batch by batch. Returns the number archived."""
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            moved = self.archive_batch(batch_size)
+            total += moved
+            batches += 1
+            if moved < batch_size:
+                break
+        logger.info(f"Archived {total} tasks in {batches} batches")
+        return total
+
+    def archive_batch(self, batch_size: int) -> int:
+        """Archive up to batch_size expired tasks in one transaction."""
+        now = datetime.utcnow()
+        expired = or_(
+            and_(
+                Task.deleted_date != None,
+                Task.deleted_date < now - timedelta(days=settings.ARCHIVE_DELETED_RETENTION_DAYS)
+            ),
+            and_(
+                Task.deleted_date == None,
+                Task.status == Status.DONE.value,
+                Task.completed_date < now - timedelta(days=settings.ARCHIVE_COMPLETED_RETENTION_DAYS)
+            )
+        )
+        batch = select(Task.task_uuid).where(expired).limit(batch_size).with_for_update(skip_locked=True)
+
+        try:
+            if self.db.get_bind().dialect.name == "postgresql":
+                self._ensure_partition(now)
+                rows = self._move_returning(batch, now)
+            else:
+                rows = self._move_portable(batch, now)
+
+            # Deleted tasks already left the counters when they were deleted
+            deltas = Counter()
+            for row in rows:
+                if row.deleted_date is None:
+                    deltas[TaskCounterService.key(row.assigned_to, row.status)] -= 1
+            TaskCounterService(self.db).apply(deltas)
+
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error archiving tasks: {e}")
+            self.db.rollback()
+            raise
+
+        if rows:
+            cache_service.bump_version(TaskService.CACHE_NAMESPACE)
+            task_entity_cache.invalidate([row.task_uuid for row in rows])
+            task_event_broker.publish_reset("archive")
+        return len(rows)
+
+    def get_archived_tasks(self, skip: int = 0, limit: int = 10, assigned_to: Optional[UUID] = None) -> List[TaskArchive]:
+        """List archived tasks, most recently archived first."""
+        query = self.db.query(TaskArchive)
+        if assigned_to:
+            query = query.filter(TaskArchive.assigned_to == assigned_to)
+        return query.order_by(TaskArchive.archived_date.desc(), TaskArchive.task_uuid).offset(skip).limit(limit).all()
+
+    def get_archived_task(self, task_uuid: UUID) -> Optional[TaskArchive]:
+        """Get an archived task by UUID."""
+        return self.db.query(TaskArchive).filter(TaskArchive.task_uuid == task_uuid).first()
+
+    def restore_task(self, task_uuid: UUID) -> Optional[Task]:
+        """Move an archived task back into tasks as a live task.
+
+        A restored task that is still completed and past retention is archived
+        again by the next run unless it is reopened.
+        """
+        try:
+            archived = self.db.query(TaskArchive).filter(
+                TaskArchive.task_uuid == task_uuid
+            ).with_for_update().first()
+            if not archived:
+                return None
+
+            task = Task(**{name: getattr(archived, name) for name in TASK_COLUMNS})
+            task.deleted_date = None
+            task.modified_date = datetime.utcnow()
+            self.db.delete(archived)
+            self.db.add(task)
+            TaskCounterService(self.db).move(None, TaskCounterService.key(task.assigned_to, task.status))
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error restoring task {task_uuid}: {e}")
+            self.db.rollback()
+            raise
+
+        cache_service.bump_version(TaskService.CACHE_NAMESPACE)
+        self.db.refresh(task)
+        task_event_broker.publish([task])
+        return task
+
+    def _move_returning(self, batch, now: datetime):
+        tasks = Task.__table__
+        moved = delete(tasks).where(tasks.c.task_uuid.in_(batch)).returning(*tasks.c).cte("moved")
+        stmt = insert(TaskArchive.__table__).from_select(
+            TASK_COLUMNS + ["archived_date"],
+            select(*[moved.c[name] for name in TASK_COLUMNS], literal(now, TaskArchive.archived_date.type))
+        ).returning(TaskArchive.task_uuid, TaskArchive.assigned_to, TaskArchive.status, TaskArchive.deleted_date)
+        return self.db.execute(stmt).all()
+
+    def _move_portable(self, batch, now: datetime):
+        # Databases without data-modifying CTEs copy and delete in two statements
+        tasks = Task.__table__
+        rows = self.db.execute(select(*tasks.c).where(tasks.c.task_uuid.in_(batch))).all()
+        if rows:
+            self.db.execute(
+                insert(TaskArchive.__table__),
+                [dict(row._mapping, archived_date=now) for row in rows]
+            )
+            self.db.execute(delete(tasks).where(tasks.c.task_uuid.in_([row.task_uuid for row in rows])))
+        return rows
+
+    def _ensure_partition(self, now: datetime) -> None:
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        if month_start in self._partitions:
+            return
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        self.db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS tasks_archive_{month_start:%Y_%m} "
+            f"PARTITION OF tasks_archive "
+            f"FOR VALUES FROM ('{month_start:%Y-%m-%d}+00') TO ('{next_month:%Y-%m-%d}+00')"
+        ))
+        self._partitions.add(month_start)
@@ -0,0 +1,127 @@
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from models.task import Task
+from models.task_counter import TaskCounter, UNASSIGNED
+from constants import Status
+import logging
+
+logger = logging.getLogger(__name__)
+
+CounterKey = Tuple[UUID, str]
+
+class TaskCounterService:
+    """Per-assignee, per-status task counters kept in step with task writes.
+
+    Callers collect deltas while changing tasks and apply them before their own
+    commit, so counters and tasks change in the same transaction.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def key(assigned_to: Optional[UUID], status) -> CounterKey:
+        """Counter key for a task's assignee and status."""
+        return (assigned_to or UNASSIGNED, getattr(status, "value", status))
+
+    def apply(self, deltas: Counter) -> None:
+        """Upsert counter deltas in the current transaction (no commit)."""
+        # Sorted keys give concurrent writers a consistent lock order
+        for (assigned_to, status), delta in sorted(deltas.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+            if delta == 0:
+                continue
+            stmt = self._insert().values(assigned_to=assigned_to, status=status, task_count=delta)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TaskCounter.assigned_to, TaskCounter.status],
+                set_={"task_count": TaskCounter.task_count + stmt.excluded.task_count}
+            )
+            self.db.execute(stmt)
+
+    def move(self, old_key: Optional[CounterKey], new_key: Optional[CounterKey]) -> None:
+        """Move one task between counters; None stands for "no counter"."""
+        if old_key == new_key:
+            return
+        deltas = Counter()
+        if old_key:
+            deltas[old_key] -= 1
+        if new_key:
+            deltas[new_key] += 1
+        self.apply(deltas)
+
+    def get_counts(self, assigned_to: Optional[UUID] = None) -> Dict[str, int]:
+        """Task counts by status for one assignee, or for everyone when None."""
+        if assigned_to is None:
+            stmt = select(TaskCounter.status, func.sum(TaskCounter.task_count)).group_by(TaskCounter.status)
+        else:
+            stmt = select(TaskCounter.status, TaskCounter.task_count).where(TaskCounter.assigned_to == assigned_to)
+
+        counts = {status.value: 0 for status in Status}
+        for status, task_count in self.db.execute(stmt):
+            counts[status] = int(task_count or 0)
+        return counts
+
+    def get_overdue_count(self, assigned_to: Optional[UUID] = None) -> int:
+        """Open tasks past their due date.
+
+        Overdue depends on the clock rather than on writes, so it is counted
+        directly through the due date indexes instead of being kept as a counter.
+        """
+        stmt = select(func.count()).select_from(Task).where(
+            Task.deleted_date == None,
+            Task.due_date < datetime.utcnow(),
+            Task.status != Status.DONE.value
+        )
+        if assigned_to is not None:
+            stmt = stmt.where(Task.assigned_to == assigned_to)
+        return self.db.execute(stmt).scalar_one()
+
+    def reconcile(self, fix: bool = True) -> List[dict]:
+        """Recompute counters from the tasks table and report (and optionally fix) drift."""
+        if fix and self.db.get_bind().dialect.name == "postgresql":
+            # Hold off concurrent counter updates so the recount stays exact
+            self.db.execute(text("LOCK TABLE task_counters IN EXCLUSIVE MODE"))
+
+        expected = Counter()
+        rows = self.db.execute(
+            select(Task.assigned_to, Task.status, func.count())
+            .where(Task.deleted_date == None)
+            .group_by(Task.assigned_to, Task.status)
+        )
+        for assigned_to, status, task_count in rows:
+            expected[self.key(assigned_to, status)] += task_count
+
+        actual = {
+            (counter.assigned_to, counter.status): counter.task_count
+            for counter in self.db.query(TaskCounter).all()
+        }
+
+        drift = []
+        for key in set(expected) | set(actual):
+            if expected.get(key, 0) != actual.get(key, 0):
+                drift.append({
+                    "assigned_to": None if key[0] == UNASSIGNED else key[0],
+                    "status": key[1],
+                    "expected": expected.get(key, 0),
+                    "actual": actual.get(key, 0)
+                })
+
+        if fix and drift:
+            self.apply(Counter({
+                (item["assigned_to"] or UNASSIGNED, item["status"]): item["expected"] - item["actual"]
+                for item in drift
+            }))
+            logger.warning(f"Fixed {len(drift)} drifted task counters")
+
+        if fix:
+            self.db.commit()
+        return drift
+
+    def _insert(self):
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite.insert(TaskCounter)
+        return postgresql.insert(TaskCounter)
@@ -0,0 +1,150 @@
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Iterable, Optional
+from uuid import UUID
+from dto.task_dto import TaskResponse
+from services.cache_service import cache_service
+from services.redis_service import redis_manager
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Namespace whose version guards read-through fills (TaskService.CACHE_NAMESPACE)
+_NAMESPACE = "tasks"
+INVALIDATION_CHANNEL = "tasks:entity:invalidate"
+
+class TaskEntityCache:
+    """Two-level read-through cache of single tasks, keyed by task_uuid.
+
+    L1 is a bounded LRU in this process, L2 a Redis key per task holding
+    the serialized TaskResponse. Writers evict both levels and publish the
+    task UUIDs on INVALIDATION_CHANNEL; a listener thread in every worker
+    evicts its own L1 entries when the message arrives.
+
+    L1 is only used while the listener is subscribed, and is emptied
+    whenever the subscription is (re)established, so a worker that may
+    have missed invalidations never serves from it. Entries also expire
+    after CACHE_TASK_ENTITY_L1_TTL as a backstop.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._listening = False
+        self._stopped = threading.Event()
+        self._thread = None
+        self.stats = {"l1_hit": 0, "l2_hit": 0, "miss": 0, "invalidated": 0}
+
+    def _key(self, task_uuid) -> str:
+        return f"{cache_service.prefix}:{_NAMESPACE}:entity:{task_uuid}"
+
+    def get(self, task_uuid: UUID) -> Optional[TaskResponse]:
+        """Cached task from L1, then L2; None on a miss."""
+        if self._listening:
+            with self._lock:
+                cached = self._entries.get(task_uuid)
+                if cached is not None and cached[0] > time.monotonic():
+                    self._entries.move_to_end(task_uuid)
+                    self.stats["l1_hit"] += 1
+                    return cached[1]
+
+        data = cache_service.get_json(self._key(task_uuid))
+        if data is None:
+            self.stats["miss"] += 1
+            return None
+        task = TaskResponse.model_validate(data)
+        self._remember(task_uuid, task)
+        self.stats["l2_hit"] += 1
+        return task
+
+    def put(self, task_uuid: UUID, task: TaskResponse, version: Optional[int]) -> None:
+        """Fill both levels with a task read from the database at the given tasks version.
+
+        Skipped when any task write happened since that version was read.
+        """
+        stored = cache_service.set_json_at_version(
+            self._key(task_uuid), task.model_dump(mode="json"), settings.CACHE_TASK_ENTITY_TTL,
+            _NAMESPACE, version
+        )
+        if stored:
+            self._remember(task_uuid, task)
+
+    def invalidate(self, task_uuids: Iterable[UUID]) -> None:
+        """Evict tasks everywhere: this process, Redis and, over pub/sub, other workers."""
+        task_uuids = list(dict.fromkeys(task_uuids))
+        if not task_uuids:
+            return
+        self._evict(task_uuids)
+        cache_service.delete(*[self._key(task_uuid) for task_uuid in task_uuids])
+        cache_service.publish(INVALIDATION_CHANNEL, ",".join(map(str, task_uuids)))
+
+    def _remember(self, task_uuid, task) -> None:
+        if not self._listening:
+            return
+        with self._lock:
+            self._entries[task_uuid] = (time.monotonic() + settings.CACHE_TASK_ENTITY_L1_TTL, task)
+            self._entries.move_to_end(task_uuid)
+            while len(self._entries) > settings.CACHE_TASK_ENTITY_L1_SIZE:
+                self._entries.popitem(last=False)
+
+    def _evict(self, task_uuids) -> None:
+        with self._lock:
+            for task_uuid in task_uuids:
+                if self._entries.pop(task_uuid, None) is not None:
+                    self.stats["invalidated"] += 1
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def start(self) -> None:
+        """Start the invalidation listener thread (once per process)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._listen, name="task-entity-cache", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._listening = False
+        self._clear()
+
+    def _listen(self) -> None:
+        channel = f"{cache_service.prefix}:{INVALIDATION_CHANNEL}"
+        while not self._stopped.is_set():
+            redis_client = redis_manager.get_client()
+            if not redis_client:
+                self._stopped.wait(5)
+                continue
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(channel)
+                # Anything cached before this point may have missed an invalidation
+                self._clear()
+                self._listening = True
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        self._evict([UUID(task_uuid) for task_uuid in message["data"].split(",")])
+            except Exception as e:
+                logger.warning(f"Task cache invalidation listener error: {e}")
+            finally:
+                self._listening = False
+                self._clear()
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+            self._stopped.wait(1)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return dict(self.stats, l1_size=len(self._entries), listening=self._listening)
+
+# Global task entity cache instance
+task_entity_cache = TaskEntityCache()
@@ -0,0 +1,294 @@
+import asyncio
+import re
+import threading
+import logging
+from typing import Iterable, List, Optional
+from uuid import UUID
+import orjson
+from dto.task_dto import TaskResponse
+from models.task import Status
+from services.redis_service import redis_manager
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Capped Redis stream every worker reads; its entry IDs are the event IDs clients resume from
+STREAM_KEY = "events:tasks"
+
+EVENT_CREATED = "task.created"
+EVENT_UPDATED = "task.updated"
+EVENT_ASSIGNED = "task.assigned"
+EVENT_COMPLETED = "task.completed"
+EVENT_DELETED = "task.deleted"
+# Fired by the reminder scheduler (jobs.reminder_scheduler) when an open task reaches its due date
+EVENT_DUE = "task.due"
+# Many tasks changed at once (imports, archiving): subscribers should re-fetch their list
+EVENT_RESET = "tasks.reset"
+
+_EVENT_ID = re.compile(r"^\d+-\d+$")
+
+class StreamUnavailableError(Exception):
+    """Raised when task events cannot be read because Redis is unavailable."""
+    pass
+
+def parse_event_id(event_id: Optional[str]) -> Optional[tuple]:
+    """Stream entry ID ("<ms>-<seq>") as a comparable tuple, None if missing or malformed."""
+    if not event_id or not _EVENT_ID.match(event_id.strip()):
+        return None
+    ms, seq = event_id.strip().split("-")
+    return int(ms), int(seq)
+
+def _event_type(row) -> str:
+    # Rows of _update_old_tasks carry the state right before the write
+    if not hasattr(row, "old_status"):
+        return EVENT_CREATED
+    if row.deleted_date is not None:
+        return EVENT_DELETED
+    if row.status == Status.DONE.value and row.old_status != Status.DONE.value:
+        return EVENT_COMPLETED
+    if row.assigned_to != row.old_assigned_to:
+        return EVENT_ASSIGNED
+    return EVENT_UPDATED
+
+def _event_payload(row) -> bytes:
+    event = {
+        "type": _event_type(row),
+        "task": {name: getattr(row, name) for name in TaskResponse.model_fields},
+    }
+    if hasattr(row, "old_status"):
+        event["previous"] = {"assigned_to": row.old_assigned_to, "status": row.old_status}
+    return orjson.dumps(event, option=orjson.OPT_UTC_Z)
+
+def due_event_payload(row) -> bytes:
+    """Stream entry announcing that a task row has come due."""
+    return orjson.dumps(
+        {"type": EVENT_DUE, "task": {name: getattr(row, name) for name in TaskResponse.model_fields}},
+        option=orjson.OPT_UTC_Z
+    )
+
+class TaskEvent:
+    """One event read from the stream, parsed once per worker for every subscriber."""
+
+    __slots__ = ("id", "key", "type", "data", "json")
+
+    def __init__(self, event_id: str, payload: str):
+        self.id = event_id
+        self.key = parse_event_id(event_id)
+        self.data = orjson.loads(payload)
+        self.type = self.data["type"]
+        self.json = orjson.dumps({"id": event_id, **self.data}).decode()
+
+class TaskEventFilter:
+    """Server-side subscription filter. A task event matches when the task
+    matches before or after the change, so subscribers also hear about tasks
+    leaving their view. Tags are only known after the change."""
+
+    def __init__(self, assigned_to: Optional[UUID] = None, status: Optional[str] = None, tags_any: Optional[List[str]] = None):
+        self.assigned_to = str(assigned_to) if assigned_to else None
+        self.status = status
+        self.tags_any = set(tags_any) if tags_any else None
+
+    def matches(self, event: TaskEvent) -> bool:
+        if event.type == EVENT_RESET:
+            return True
+        task = event.data["task"]
+        previous = event.data.get("previous", {})
+        if self.assigned_to and self.assigned_to not in (task["assigned_to"], previous.get("assigned_to")):
+            return False
+        if self.status and self.status not in (task["status"], previous.get("status")):
+            return False
+        if self.tags_any and not self.tags_any.intersection(task["tags"] or ()):
+            return False
+        return True
+
+class SubscriberOverflow(Exception):
+    """The subscriber fell further behind than its queue allows and must resume from its last event ID."""
+    pass
+
+class Subscription:
+    """A client's bounded queue of matching events, fed from the event loop."""
+
+    def __init__(self, event_filter: TaskEventFilter, last_event_id: Optional[tuple], queue_size: int):
+        self.filter = event_filter
+        self.last_key = last_event_id
+        self.queue = asyncio.Queue(queue_size)
+        self.overflowed = False
+
+    def offer(self, event: TaskEvent) -> bool:
+        """Queue a live event if it matches; False if it was filtered out or did not fit."""
+        if self.overflowed or not self.filter.matches(event):
+            return False
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            # Dropping events silently would leave the client wrong; cut it off instead
+            self.overflowed = True
+            return False
+
+    def replayed(self, event: TaskEvent) -> bool:
+        """Mark an event from the replay as delivered; False if it is filtered out or already seen."""
+        if self.last_key is not None and event.key <= self.last_key:
+            return False
+        self.last_key = event.key
+        return self.filter.matches(event)
+
+    async def next(self, timeout: float) -> Optional[TaskEvent]:
+        """Next undelivered event, or None after `timeout` seconds without one (time for a heartbeat)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            if self.overflowed and self.queue.empty():
+                raise SubscriberOverflow()
+            try:
+                event = await asyncio.wait_for(self.queue.get(), max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                return None
+            # Live events may repeat ones already sent from the replay
+            if self.last_key is None or event.key > self.last_key:
+                self.last_key = event.key
+                return event
+
+class TaskEventBroker:
+    """Publishes task changes to a capped Redis stream and fans them out to local subscribers.
+
+    Writers XADD one entry per changed task after committing. One reader
+    thread per worker follows the stream with a blocking XREAD and hands
+    each event to the subscriptions on the event loop, so Redis sees one
+    reader per worker however many clients are connected.
+
+    Clients resume with the ID of the last event they saw: the entries
+    after it are replayed from the stream (it keeps STREAM_MAX_LENGTH
+    entries). If the ID has already been trimmed away, a tasks.reset event
+    tells the client to re-fetch instead.
+    """
+
+    def __init__(self):
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+        self._loop = None
+        self._stopped = threading.Event()
+        self._thread = None
+        self.stats = {"published": 0, "delivered": 0, "overflowed": 0, "replayed": 0, "resets": 0}
+
+    def publish(self, rows: Iterable) -> None:
+        """Append an event per written task row (INSERT or _update_old_tasks RETURNING)."""
+        self._append([_event_payload(row) for row in rows])
+
+    def publish_reset(self, reason: str) -> None:
+        """Tell every subscriber that too much changed to describe task by task."""
+        self._append([orjson.dumps({"type": EVENT_RESET, "reason": reason})])
+
+    def _append(self, payloads: List[bytes]) -> None:
+        if not payloads:
+            return
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            return
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for payload in payloads:
+                pipe.xadd(STREAM_KEY, {"event": payload}, maxlen=settings.STREAM_MAX_LENGTH, approximate=True)
+            pipe.execute()
+            self.stats["published"] += len(payloads)
+        except Exception as e:
+            logger.error(f"Task event publish error: {e}")
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, event_filter: TaskEventFilter, last_event_id: Optional[str] = None) -> Subscription:
+        """Register a subscription (call from the event loop) before replaying what it missed."""
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(event_filter, parse_event_id(last_event_id), settings.STREAM_QUEUE_SIZE)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        if subscription.overflowed:
+            self.stats["overflowed"] += 1
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def replay(self, subscription: Subscription) -> List[TaskEvent]:
+        """Events after the subscription's last event ID, read from the stream (blocking; run in a thread).
+
+        Raises StreamUnavailableError when Redis is down.
+        """
+        if subscription.last_key is None:
+            return []
+        redis_client = redis_manager.get_client()
+        if not redis_client:
+            raise StreamUnavailableError()
+        try:
+            first = redis_client.xrange(STREAM_KEY, count=1)
+            if first and parse_event_id(first[0][0]) > subscription.last_key:
+                # Entries between the client's last event and the oldest one kept may be gone
+                newest = redis_client.xrevrange(STREAM_KEY, count=1)
+                self.stats["resets"] += 1
+                reset = TaskEvent(newest[0][0], orjson.dumps({"type": EVENT_RESET, "reason": "expired"}).decode())
+                subscription.last_key = reset.key
+                return [reset]
+            last_id = "%d-%d" % subscription.last_key
+            entries = redis_client.xrange(STREAM_KEY, min=f"({last_id}", count=settings.STREAM_MAX_LENGTH)
+        except Exception as e:
+            logger.error(f"Task event replay error: {e}")
+            raise StreamUnavailableError() from e
+
+        events = [TaskEvent(event_id, fields["event"]) for event_id, fields in entries]
+        events = [event for event in events if subscription.replayed(event)]
+        self.stats["replayed"] += len(events)
+        return events
+
+    def _dispatch(self, events: List[TaskEvent]) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for event in events:
+            for subscription in subscriptions:
+                self.stats["delivered"] += subscription.offer(event)
+
+    def start(self) -> None:
+        """Start the stream reader thread (once per process)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._read, name="task-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _read(self) -> None:
+        last_id = None
+        while not self._stopped.is_set():
+            redis_client = redis_manager.get_client()
+            if not redis_client:
+                self._stopped.wait(5)
+                continue
+            try:
+                if last_id is None:
+                    # Follow from the current end; older events are only sent as replays
+                    newest = redis_client.xrevrange(STREAM_KEY, count=1)
+                    last_id = newest[0][0] if newest else "0-0"
+                response = redis_client.xread({STREAM_KEY: last_id}, count=500, block=1000)
+                if not response:
+                    continue
+                entries = response[0][1]
+                last_id = entries[-1][0]
+                if not self._subscriptions or self._loop is None:
+                    continue
+                events = [TaskEvent(event_id, fields["event"]) for event_id, fields in entries]
+                self._loop.call_soon_threadsafe(self._dispatch, events)
+            except Exception as e:
+                logger.warning(f"Task event reader error: {e}")
+                self._stopped.wait(1)
+
+    def metrics(self) -> dict:
+        return dict(self.stats, subscribers=self.subscriber_count, reading=bool(self._thread and self._thread.is_alive()))
+
+# Global task event broker instance
+task_event_broker = TaskEventBroker()
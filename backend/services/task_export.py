@@ -0,0 +1,59 @@
+import csv
+import io
+import logging
+from datetime import datetime
+import orjson
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+_NDJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_UTC_Z
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        # A JSON array, so tags holding the separator or quotes survive an import
+        return orjson.dumps(value).decode()
+    return value
+
+def _ndjson_chunk(rows, columns):
+    # orjson encodes datetimes and UUIDs natively, the same way TaskResponse does
+    return b"".join([orjson.dumps(dict(zip(columns, row)), option=_NDJSON_OPTIONS) for row in rows])
+
+def _csv_chunk(rows, columns):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+async def export_chunks(request: Request, result, export_format: str, batch_size: int):
+    """Yield a streamed task result as NDJSON or CSV text, one batch of rows at a time.
+
+    Rows are fetched from the server-side cursor in a worker thread so the
+    event loop is not blocked. The cursor is closed when the export ends,
+    fails or the client goes away.
+    """
+    columns = list(result.keys())
+    write_chunk = _ndjson_chunk if export_format == "ndjson" else _csv_chunk
+    try:
+        if export_format == "csv":
+            yield _csv_chunk([columns], columns)
+        while True:
+            rows = await run_in_threadpool(result.fetchmany, batch_size)
+            if not rows:
+                break
+            if await request.is_disconnected():
+                logger.info("Client disconnected during task export")
+                break
+            yield write_chunk(rows, columns)
+    finally:
+        # Closed inline: awaiting here would not run if the stream was cancelled
+        result.close()
@@ -0,0 +1,305 @@
+import csv
+import io
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import DateTime, Integer, String, and_, column, exists, func, insert, select, table, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Session
+from dto.task_dto import TaskCreate
+from models.task import Task
+from models.user import User
+from services.cache_service import cache_service
+from services.task_counter_service import TaskCounterService
+from services.task_events import task_event_broker
+from services.task_service import TaskService
+from config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Columns filled from an import row, in COPY order; task_uuid is generated by the INSERT
+_IMPORT_COLUMNS = ["title", "description", "due_date", "tags", "status", "priority", "assigned_to"]
+
+# Per-connection staging table; ON COMMIT DELETE ROWS empties it after every batch
+_CREATE_STAGING = text(
+    "CREATE TEMPORARY TABLE IF NOT EXISTS task_import_staging ("
+    "line_no bigint, title varchar, description varchar, due_date timestamptz, "
+    "tags varchar[], status varchar, priority integer, assigned_to uuid"
+    ") ON COMMIT DELETE ROWS"
+)
+_COPY_STAGING = f"COPY task_import_staging (line_no, {', '.join(_IMPORT_COLUMNS)}) FROM STDIN"
+
+_staging = table(
+    "task_import_staging",
+    column("line_no", Integer),
+    column("title", String),
+    column("description", String),
+    column("due_date", DateTime(timezone=True)),
+    column("tags", ARRAY(String)),
+    column("status", String),
+    column("priority", Integer),
+    column("assigned_to", UUID(as_uuid=True)),
+)
+
+# Staged rows whose assignee is not a live user
+_UNKNOWN_ASSIGNEE = and_(
+    _staging.c.assigned_to != None,
+    ~exists().where(User.user_uuid == _staging.c.assigned_to, User.deleted_date == None)
+)
+
+# COPY text format escapes; plain str.replace is the fastest way to apply them
+def _copy_text(value: Optional[str]) -> str:
+    if value is None:
+        return "\\N"
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+def _copy_array(items: Optional[List[str]]) -> str:
+    if items is None:
+        return "\\N"
+    return _copy_text("{" + ",".join(
+        '"' + item.replace("\\", "\\\\").replace('"', '\\"') + '"' for item in items
+    ) + "}")
+
+def _copy_row(line_no: int, task: TaskCreate) -> str:
+    """One staging row in COPY text format."""
+    return "\t".join((
+        str(line_no),
+        _copy_text(task.title),
+        _copy_text(task.description),
+        "\\N" if task.due_date is None else task.due_date.isoformat(),
+        _copy_array(task.tags),
+        _copy_text(task.status),
+        str(task.priority),
+        "\\N" if task.assigned_to is None else str(task.assigned_to),
+    )) + "\n"
+
+def _decode_line(raw: bytes):
+    """The line as text, or a ValueError to report when it is not valid UTF-8."""
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return ValueError(f"Invalid UTF-8 at byte {e.start}: {e.reason}")
+
+class TaskImportService:
+    """Bulk import of tasks from CSV or NDJSON.
+
+    Rows are read and validated against TaskCreate IMPORT_BATCH_SIZE at a
+    time. On PostgreSQL each batch is copied into a temporary staging table
+    with COPY FROM STDIN and moved into tasks with one INSERT ... SELECT;
+    each batch commits on its own, so memory and lock time stay bounded,
+    and is written while the next one is being validated.
+    Invalid rows are skipped and reported by line number.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def import_file(self, lines: Iterable[bytes], export_format: str, batch_size: Optional[int] = None) -> dict:
+        """Import tasks from an iterable of UTF-8 encoded lines. Returns counts and the first errors.
+
+        Lines that are not valid UTF-8, or that the CSV reader cannot parse,
+        are reported like invalid rows. If the file cannot be read any
+        further, the rows read so far are still imported and the report
+        says where the import stopped.
+        """
+        if export_format not in IMPORT_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(IMPORT_FORMATS)}")
+        batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        records = self._read_csv(lines) if export_format == "csv" else self._read_ndjson(lines)
+
+        report = {"imported": 0, "failed": 0, "errors": []}
+        try:
+            # Batch N is written by the writer thread while batch N+1 is read and
+            # validated here; only the writer touches the session meanwhile
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending = None
+                last_line = 0
+                more = True
+                while more:
+                    batch, more = self._read_batch(records, batch_size, report, last_line)
+                    if batch:
+                        last_line = batch[-1][0]
+                    tasks, line_errors = self._validate(batch)
+                    self._add_errors(report, line_errors)
+                    if pending is not None:
+                        self._add_inserted(report, pending.result())
+                    pending = writer.submit(self._insert_batch, tasks) if tasks else None
+                if pending is not None:
+                    self._add_inserted(report, pending.result())
+        finally:
+            if report["imported"]:
+                cache_service.bump_version(TaskService.CACHE_NAMESPACE)
+                task_event_broker.publish_reset("import")
+
+        report["errors"].sort(key=lambda error: error["line"])
+        logger.info(f"Imported {report['imported']} tasks, {report['failed']} rows rejected")
+        return report
+
+    def _read_batch(self, records: Iterator[Tuple[int, object]], batch_size: int, report: dict, last_line: int):
+        """Up to batch_size records, and whether there may be more to read."""
+        batch = []
+        try:
+            for record in islice(records, batch_size):
+                batch.append(record)
+        except OSError as e:
+            # The rest of the file is lost; the rows read so far are still imported
+            line_no = (batch[-1][0] if batch else last_line) + 1
+            logger.error(f"Task import stopped at line {line_no}: {e}")
+            self._add_errors(report, [(line_no, f"Import stopped, the file could not be read: {e}")])
+            return batch, False
+        return batch, len(batch) == batch_size
+
+    def _add_inserted(self, report: dict, result: Tuple[int, List[int]]) -> None:
+        inserted, unknown_assignees = result
+        report["imported"] += inserted
+        self._add_errors(report, [(line_no, "User not found") for line_no in unknown_assignees])
+
+    @staticmethod
+    def _add_errors(report: dict, line_errors: List[Tuple[int, str]]) -> None:
+        # Every rejected row is counted; only the first IMPORT_MAX_ERRORS are listed
+        report["failed"] += len(line_errors)
+        room = max(settings.IMPORT_MAX_ERRORS - len(report["errors"]), 0)
+        report["errors"] += [{"line": line_no, "detail": detail} for line_no, detail in sorted(line_errors)[:room]]
+
+    @staticmethod
+    def _read_ndjson(lines: Iterable[bytes]) -> Iterator[Tuple[int, object]]:
+        # Lines stay raw; TaskCreate.model_validate_json parses and validates in one pass
+        for line_no, raw in enumerate(lines, start=1):
+            line = _decode_line(raw)
+            if isinstance(line, ValueError) or line.strip():
+                yield line_no, line
+
+    @staticmethod
+    def _read_csv(lines: Iterable[bytes]) -> Iterator[Tuple[int, object]]:
+        # Same layout as the CSV export: empty cells are null, tags are a JSON array
+        unreadable = {}
+
+        def decoded():
+            for line_no, raw in enumerate(lines, start=1):
+                line = _decode_line(raw)
+                if isinstance(line, ValueError):
+                    unreadable[line_no] = line
+                    # Invalid UTF-8 never hides an ASCII quote, comma or newline,
+                    # so the replaced text keeps the rows around it intact
+                    line = raw.decode("utf-8", errors="replace")
+                yield line
+
+        reader = csv.reader(decoded())
+        header = None
+        while True:
+            first_line = reader.line_num + 1
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield reader.line_num, ValueError(f"Invalid CSV: {e}")
+                continue
+            # A row spanning an undecodable line is rejected, not imported mangled
+            broken = [line_no for line_no in range(first_line, reader.line_num + 1) if line_no in unreadable]
+            if broken:
+                for line_no in broken:
+                    yield line_no, unreadable.pop(line_no)
+                continue
+            if not row:
+                continue
+            if header is None:
+                header = row
+                continue
+            record = {key: (value if value != "" else None) for key, value in zip(header, row)}
+            if record.get("tags") is not None:
+                try:
+                    record["tags"] = orjson.loads(record["tags"])
+                except orjson.JSONDecodeError:
+                    # Left as text for TaskCreate to reject as not a list
+                    pass
+            yield reader.line_num, record
+
+    @staticmethod
+    def _validate(batch) -> Tuple[List[Tuple[int, TaskCreate]], List[Tuple[int, str]]]:
+        tasks, errors = [], []
+        for line_no, record in batch:
+            if isinstance(record, ValueError):
+                errors.append((line_no, str(record)))
+                continue
+            try:
+                if isinstance(record, str):
+                    tasks.append((line_no, TaskCreate.model_validate_json(record)))
+                else:
+                    tasks.append((line_no, TaskCreate.model_validate(record)))
+            except ValidationError as e:
+                errors.append((line_no, "; ".join(
+                    f"{'.'.join(map(str, error['loc']))}: {error['msg']}" if error["loc"] else error["msg"]
+                    for error in e.errors()
+                )))
+        return tasks, errors
+
+    def _insert_batch(self, tasks: List[Tuple[int, TaskCreate]]) -> Tuple[int, List[int]]:
+        """Insert one validated batch and commit. Returns (inserted, lines with unknown assignees)."""
+        if not tasks:
+            return 0, []
+        try:
+            if self.db.get_bind().dialect.name == "postgresql":
+                unknown = self._copy_and_insert(tasks)
+            else:
+                unknown = self._insert_portable(tasks)
+
+            skipped = set(unknown)
+            TaskCounterService(self.db).apply(Counter(
+                TaskCounterService.key(task.assigned_to, task.status)
+                for line_no, task in tasks if line_no not in skipped
+            ))
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error importing tasks: {e}")
+            self.db.rollback()
+            raise
+        return len(tasks) - len(unknown), unknown
+
+    def _copy_and_insert(self, tasks: List[Tuple[int, TaskCreate]]) -> List[int]:
+        buffer = io.StringIO("".join([_copy_row(line_no, task) for line_no, task in tasks]))
+
+        self.db.execute(_CREATE_STAGING)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):
+                cursor.copy_expert(_COPY_STAGING, buffer)
+            else:
+                # psycopg 3
+                with cursor.copy(_COPY_STAGING) as copy:
+                    copy.write(buffer.getvalue())
+        finally:
+            cursor.close()
+
+        unknown = self.db.execute(
+            select(_staging.c.line_no).where(_UNKNOWN_ASSIGNEE).order_by(_staging.c.line_no)
+        ).scalars().all()
+        self.db.execute(insert(Task.__table__).from_select(
+            ["task_uuid"] + _IMPORT_COLUMNS,
+            select(func.gen_random_uuid(), *[_staging.c[name] for name in _IMPORT_COLUMNS]).where(~_UNKNOWN_ASSIGNEE)
+        ))
+        return unknown
+
+    def _insert_portable(self, tasks: List[Tuple[int, TaskCreate]]) -> List[int]:
+        # Databases without COPY insert the batch with one executemany
+        assignees = {task.assigned_to for _, task in tasks if task.assigned_to}
+        live = set(self.db.execute(
+            select(User.user_uuid).where(User.user_uuid.in_(assignees), User.deleted_date == None)
+        ).scalars()) if assignees else set()
+
+        rows, unknown = [], []
+        for line_no, task in tasks:
+            if task.assigned_to and task.assigned_to not in live:
+                unknown.append(line_no)
+            else:
+                rows.append(dict(task.model_dump(include=set(_IMPORT_COLUMNS)), task_uuid=uuid.uuid4()))
+        if rows:
+            self.db.execute(insert(Task.__table__), rows)
+        return unknown
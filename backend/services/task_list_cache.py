@@ -0,0 +1,104 @@
+import time
+import logging
+from typing import Optional, Tuple
+from db import SessionLocal
+from dto.task_dto import dump_task_list
+from services.cache_service import cache_service
+from services.task_service import TaskService
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of a lookup
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_STALE = "stale"
+# Stale, and this request holds the refresh lock: serve it and refresh in the background
+CACHE_REFRESH = "refresh"
+
+METRICS_NAME = "tasks_list"
+
+# Upper bound on one refresh; the lock expires on its own if a worker dies mid-way
+REFRESH_LOCK_SECONDS = 30
+
+def render_task_list(service: TaskService, skip, limit, cursor, fields, filters, expand=()) -> Tuple[str, Optional[str]]:
+    """Run a list query and serialize it. Returns (JSON body, next cursor)."""
+    tasks = service.get_tasks_filtered(skip=skip, limit=limit, cursor=cursor, fields=fields, expand=expand, **filters)
+    return dump_task_list(tasks, fields, expand).decode(), service.get_next_cursor(tasks, limit)
+
+class TaskListCache:
+    """Rendered GET /tasks pages in Redis, with stale-while-revalidate.
+
+    An entry is a hash holding the JSON body, the next cursor, the tasks
+    namespace version it was rendered at and when. It is fresh while that
+    version is current and it is younger than CACHE_TASK_LIST_TTL; Redis
+    drops it after CACHE_DEFAULT_TTL. In between it is stale:
+
+    - expired by time only: served, and the request that takes the refresh
+      lock re-renders it in the background;
+    - outdated by a task write: the request that takes the lock renders it
+      inline, so a client reading after its own write sees the write, while
+      concurrent requests are served the stale entry instead of piling onto
+      the database.
+    """
+
+    def _key(self, signature: str) -> str:
+        return f"{cache_service.prefix}:{TaskService.CACHE_NAMESPACE}:list:{signature}"
+
+    def _lock(self, signature: str) -> str:
+        return f"{TaskService.CACHE_NAMESPACE}:list:{signature}"
+
+    def lookup(self, signature: str, version: int) -> Tuple[str, Optional[dict]]:
+        """Classify the cached entry for a request. Returns (outcome, entry)."""
+        entry = cache_service.get_hash(self._key(signature))
+        if not entry:
+            return CACHE_MISS, None
+        current = int(entry["version"]) == version
+        if current and time.time() - float(entry["stored_at"]) < settings.CACHE_TASK_LIST_TTL:
+            return CACHE_HIT, entry
+
+        locked = cache_service.acquire_lock(self._lock(signature), REFRESH_LOCK_SECONDS)
+        if current:
+            return (CACHE_REFRESH if locked else CACHE_STALE), entry
+        return (CACHE_MISS if locked else CACHE_STALE), entry
+
+    def store(self, signature: str, version: int, body: str, next_cursor: Optional[str]) -> None:
+        """Store a rendered page."""
+        cache_service.set_hash(self._key(signature), {
+            "version": version,
+            "stored_at": time.time(),
+            "body": body,
+            "next_cursor": next_cursor or "",
+        }, settings.CACHE_DEFAULT_TTL)
+
+    def release(self, signature: str) -> None:
+        """Release the refresh lock taken by lookup()."""
+        cache_service.release_lock(self._lock(signature))
+
+    def record(self, outcome: str) -> None:
+        # A background refresh is served like any other stale entry
+        cache_service.incr_metric(METRICS_NAME, CACHE_STALE if outcome == CACHE_REFRESH else outcome)
+
+    def metrics(self) -> dict:
+        counts = cache_service.get_metrics(METRICS_NAME)
+        return {name: counts.get(name, 0) for name in (CACHE_HIT, CACHE_MISS, CACHE_STALE, "refreshed", "refresh_failed")}
+
+    def refresh(self, signature: str, skip, limit, cursor, fields, filters, expand=()) -> None:
+        """Re-render an entry with a session of its own; run as a background task."""
+        db = SessionLocal()
+        try:
+            # Read before the query: a write landing meanwhile leaves the entry outdated, not wrong
+            version = cache_service.get_version(TaskService.CACHE_NAMESPACE)
+            body, next_cursor = render_task_list(TaskService(db), skip, limit, cursor, fields, filters, expand)
+            if version is not None:
+                self.store(signature, version, body, next_cursor)
+            cache_service.incr_metric(METRICS_NAME, "refreshed")
+        except Exception as e:
+            logger.error(f"Task list refresh error: {e}")
+            cache_service.incr_metric(METRICS_NAME, "refresh_failed")
+        finally:
+            self.release(signature)
+            db.close()
+
+# Global task list cache instance
+task_list_cache = TaskListCache()
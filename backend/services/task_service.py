@@ -1,25 +1,111 @@
-from models.task import Task, Status
+from models.task import Task, Status, Priority
+from models.user import User
+from models.task_archive import TaskArchive
+from dto.task_dto import TaskResponse
+from sqlalchemy import (
+    ARRAY, String, and_, bindparam, case, cast, column, exists, func, insert, literal, literal_column, or_, select,
+    tuple_, union_all, update, values as sql_values
+)
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, array
 from sqlalchemy.orm import Session
-from datetime import datetime
+from services.pagination import (
+    ExpiredCursorError, InvalidCursorError, encode_cursor, decode_cursor, parse_cursor_datetime, parse_cursor_uuid
+)
+from services.cache_service import cache_service
+from services.task_entity_cache import task_entity_cache
+from services.task_events import task_event_broker
+from services.etags import weak_etag
+from services.count_service import CountService, COUNT_MODE_EXACT
+from services.task_counter_service import TaskCounterService
+from config.settings import settings
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+import re
 from typing import Optional
 from uuid import UUID
 
+# Hot single-task lookups are built once and only bind task_uuid per call, so
+# each execution goes straight to SQLAlchemy's compiled statement cache
+_GET_LIVE_TASK = select(Task).where(
+    Task.task_uuid == bindparam("task_uuid"), Task.deleted_date == None
+).limit(1)
+
+# Writes return the full row in the same statement instead of re-reading it
+_TASKS = Task.__table__
+_ARCHIVE = TaskArchive.__table__
+
+def _select_old_tasks(*criteria):
+    # Live rows about to be written, with the assignee and status their counters are keyed by
+    return select(_TASKS.c.task_uuid, _TASKS.c.assigned_to, _TASKS.c.status).where(
+        _TASKS.c.deleted_date == None, *criteria
+    ).order_by(_TASKS.c.task_uuid)
+
+def _update_old_tasks(old_task, *criteria):
+    # UPDATE joined to the locked old rows, returning the new row plus the old counter key
+    return update(_TASKS).where(_TASKS.c.task_uuid == old_task.c.task_uuid, *criteria).returning(
+        *_TASKS.c, old_task.c.assigned_to.label("old_assigned_to"), old_task.c.status.label("old_status")
+    )
+
+_UPDATE_LIVE_TASK = _update_old_tasks(
+    _select_old_tasks(_TASKS.c.task_uuid == bindparam("target_uuid")).with_for_update().subquery("old_task")
+)
+
+# Assignment checks the assignee is a live user in the same UPDATE; no row back means no task or no user
+_ASSIGN_LIVE_TASK = _update_old_tasks(
+    _select_old_tasks(_TASKS.c.task_uuid == bindparam("target_uuid")).with_for_update().subquery("old_task"),
+    exists().where(User.user_uuid == bindparam("assignee"), User.deleted_date == None)
+)
+
+# Compact assignee embedded by expand=assignee, read through a join instead of a lookup per task
+_ASSIGNEE_COLUMNS = (
+    User.user_uuid.label("assignee_uuid"), User.username.label("assignee_username"), User.name.label("assignee_name")
+)
+_TASKS_WITH_ASSIGNEE = _TASKS.outerjoin(
+    User.__table__, and_(User.user_uuid == _TASKS.c.assigned_to, User.deleted_date == None)
+)
+
+# Longest completed-per-day range GET /tasks/stats reports at once
+STATS_MAX_DAYS = 366
+
+# Generated tsvector over title and description (PostgreSQL only, so not mapped on Task)
+TASK_SEARCH_VECTOR = literal_column("tasks.search_vector")
+
 
 class TaskService:
+    # Cache namespace whose version is bumped on every task write
+    CACHE_NAMESPACE = "tasks"
+
     def __init__(self, db: Session):
         self.db = db
 
     # Create a task
     def create_task(self, **kwargs):
-        task = Task(**kwargs)
-        self.db.add(task)
+        task = self.db.execute(insert(_TASKS).values(**kwargs).returning(*_TASKS.c)).first()
+        TaskCounterService(self.db).move(None, TaskCounterService.key(task.assigned_to, task.status))
         self.db.commit()
-        self.db.refresh(task)
+        self._tasks_changed([task], created=True)
         return task
 
-    # Read a specific task by ID
+    # Read a specific task by ID, through the entity cache
     def get_task(self, task_uuid):
-        return self.db.query(Task).filter(Task.task_uuid == task_uuid, Task.deleted_date == None).first()
+        task = task_entity_cache.get(task_uuid)
+        if task is not None:
+            return task
+        # Read before the query, so a write racing with it keeps the result out of the cache
+        version = cache_service.get_version(self.CACHE_NAMESPACE)
+        row = self.db.execute(_GET_LIVE_TASK, {"task_uuid": task_uuid}).scalars().first()
+        if row is None:
+            return None
+        task = TaskResponse.model_validate(row)
+        task_entity_cache.put(task_uuid, task, version)
+        return task
+
+    # Read a task with its assignee joined in, for expand=assignee
+    def get_task_expanded(self, task_uuid):
+        return self.db.execute(
+            select(*_TASKS.c, *_ASSIGNEE_COLUMNS).select_from(_TASKS_WITH_ASSIGNEE)
+            .where(_TASKS.c.task_uuid == task_uuid, _TASKS.c.deleted_date == None)
+        ).first()
 
     # Read tasks (with pagination)
     def get_tasks(self, skip=0, limit=10, status=None, due_date=None):
@@ -33,10 +119,166 @@ class TaskService:
         return query.offset(skip).limit(limit).all()
 
     # Enhanced filtering method for tasks
-    def get_tasks_filtered(self, skip=0, limit=10, **filters):
-        """Enhanced filtering method for tasks."""
-        query = self.db.query(Task).filter(Task.deleted_date == None)
-        
+    def get_tasks_filtered(self, skip=0, limit=10, cursor=None, fields=None, expand=(), **filters):
+        """Enhanced filtering method for tasks.
+
+        Pages are ordered by (due_date, created_date, task_uuid). When a cursor
+        from a previous page is given, the page starts right after it using a
+        row-value comparison instead of an offset, so every page costs the same.
+        With `fields`, only those columns (plus the cursor keys) are loaded.
+        With "assignee" in `expand`, the assignee's columns are joined in (see
+        dump_task_list). A full-text search (`q`) on PostgreSQL is ordered by rank instead.
+
+        Read-only: returns Core rows (named-tuple like, attribute access by
+        column name) rather than ORM instances, so nothing is added to the
+        session's identity map or instrumented just to be serialized.
+        """
+        columns = _TASKS.c
+        if fields:
+            columns = [_TASKS.c[name] for name in dict.fromkeys(list(fields) + ["due_date", "created_date", "task_uuid"])]
+        stmt = select(*columns)
+        if "assignee" in expand:
+            stmt = select(*columns, *_ASSIGNEE_COLUMNS).select_from(_TASKS_WITH_ASSIGNEE)
+        stmt = self._apply_filters(stmt.where(_TASKS.c.deleted_date == None), filters)
+
+        tsquery = self._search_tsquery(filters.get('q'))
+        if tsquery is not None:
+            return self._get_ranked_page(stmt, tsquery, skip, limit, cursor)
+
+        stmt = stmt.order_by(*self._keyset_order())
+        if cursor is None:
+            return self.db.execute(stmt.offset(skip).limit(limit)).all()
+
+        due_date, created_date, task_uuid = self._decode_keyset_cursor(cursor)
+        if due_date is None:
+            # Already inside the trailing block of tasks without a due date
+            return self.db.execute(stmt.where(
+                Task.due_date == None,
+                tuple_(Task.created_date, Task.task_uuid) > (created_date, task_uuid)
+            ).limit(limit)).all()
+
+        # NULL due dates never satisfy the row comparison, so they are fetched
+        # separately once the dated tasks are exhausted
+        tasks = self.db.execute(stmt.where(
+            tuple_(Task.due_date, Task.created_date, Task.task_uuid) > (due_date, created_date, task_uuid)
+        ).limit(limit)).all()
+        if len(tasks) < limit:
+            tasks += self.db.execute(stmt.where(Task.due_date == None).limit(limit - len(tasks))).all()
+        return tasks
+
+    def _get_ranked_page(self, stmt, tsquery, skip, limit, cursor):
+        # ts_rank is real; comparing it as double keeps cursor values exact.
+        # Rows carry it as search_rank so the next cursor can resume after them
+        rank = cast(func.ts_rank(TASK_SEARCH_VECTOR, tsquery), DOUBLE_PRECISION)
+        stmt = stmt.add_columns(rank.label("search_rank")).order_by(rank.desc(), Task.task_uuid.desc())
+
+        if cursor is None:
+            return self.db.execute(stmt.offset(skip).limit(limit)).all()
+
+        last_rank, task_uuid = decode_cursor(cursor, 2)
+        if not isinstance(last_rank, (int, float)):
+            raise InvalidCursorError("Invalid cursor")
+        return self.db.execute(stmt.where(
+            tuple_(rank, Task.task_uuid) < (float(last_rank), parse_cursor_uuid(task_uuid))
+        ).limit(limit)).all()
+
+    # Stream every task matching the filters from a server-side cursor
+    def stream_tasks(self, batch_size, **filters):
+        """Execute the filtered task query as an unbuffered result of plain rows.
+
+        Rows are fetched batch_size at a time as the caller iterates, so memory
+        stays flat whatever the row count. The caller must close the result.
+        """
+        stmt = self._apply_filters(
+            select(*_TASKS.c).where(_TASKS.c.deleted_date == None), filters
+        ).order_by(*self._keyset_order())
+        return self.db.execute(stmt, execution_options={"stream_results": True, "yield_per": batch_size})
+
+    # Tasks changed after a cursor, for incremental sync
+    def get_changes(self, cursor=None, limit=100):
+        """Tasks modified after `cursor`, oldest change first, deleted ones included as tombstones.
+
+        Tasks moved to tasks_archive after the cursor come back as removals,
+        with archived_date set and modified_date taken from archived_date, so
+        a client drops them instead of keeping a task that left the table.
+        Returns (rows, next_cursor, has_more). The cursor is the
+        (modified_date, task_uuid) of the last row returned, or the given
+        cursor when nothing changed. Rows modified in the last
+        CHANGES_SAFETY_LAG_SECONDS are held back: a write stamped earlier
+        may still be uncommitted, and passing over it would skip it for good.
+        Raises ExpiredCursorError when tombstones older than the cursor may
+        already have been archived.
+        """
+        now = datetime.utcnow()
+        settled = now - timedelta(seconds=settings.CHANGES_SAFETY_LAG_SECONDS)
+        live = select(*_TASKS.c, literal(None, _ARCHIVE.c.archived_date.type).label("archived_date")).where(
+            _TASKS.c.modified_date <= settled
+        )
+        archived = select(*[
+            _ARCHIVE.c.archived_date.label(name) if name == "modified_date" else _ARCHIVE.c[name]
+            for name in _TASKS.c.keys()
+        ], _ARCHIVE.c.archived_date).where(_ARCHIVE.c.archived_date <= settled)
+        if cursor is not None:
+            modified_date, task_uuid = decode_cursor(cursor, 2)
+            modified_date, task_uuid = parse_cursor_datetime(modified_date), parse_cursor_uuid(task_uuid)
+            if modified_date is None:
+                raise InvalidCursorError("Invalid cursor")
+            if modified_date.tzinfo is not None:
+                modified_date = modified_date.astimezone(timezone.utc).replace(tzinfo=None)
+            if modified_date < now - timedelta(days=settings.ARCHIVE_DELETED_RETENTION_DAYS):
+                raise ExpiredCursorError("Cursor expired, sync the full task list again")
+            live = live.where(tuple_(_TASKS.c.modified_date, _TASKS.c.task_uuid) > (modified_date, task_uuid))
+            archived = archived.where(
+                tuple_(_ARCHIVE.c.archived_date, _ARCHIVE.c.task_uuid) > (modified_date, task_uuid)
+            )
+
+        # Each branch walks its own (date, task_uuid) index up to the limit
+        changes = union_all(
+            live.order_by(_TASKS.c.modified_date, _TASKS.c.task_uuid).limit(limit + 1),
+            archived.order_by(_ARCHIVE.c.archived_date, _ARCHIVE.c.task_uuid).limit(limit + 1)
+        ).subquery()
+        rows = self.db.execute(
+            select(changes).order_by(changes.c.modified_date, changes.c.task_uuid).limit(limit + 1)
+        ).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if rows:
+            cursor = encode_cursor(rows[-1].modified_date, rows[-1].task_uuid)
+        return rows, cursor, has_more
+
+    # Validator for a task list response, bumped with every task write
+    def get_list_etag(self, version, **params):
+        """Weak ETag for a list request, or None when the version is unavailable.
+
+        Built from a tasks namespace version and the request parameters, so
+        answering a matching If-None-Match needs no query at all.
+        """
+        if version is None:
+            return None
+        return weak_etag(self.CACHE_NAMESPACE, version, cache_service.signature(**params))
+
+    # Total number of tasks matching the filters
+    def count_tasks_filtered(self, mode=COUNT_MODE_EXACT, **filters):
+        query = self._apply_filters(self.db.query(Task).filter(Task.deleted_date == None), filters)
+        signature = cache_service.signature(**filters)
+        return CountService(self.db).count(query.statement, self.CACHE_NAMESPACE, signature, mode)
+
+    # Cursor pointing after the last task of a full page
+    @staticmethod
+    def get_next_cursor(tasks, limit) -> Optional[str]:
+        if not tasks or len(tasks) < limit:
+            return None
+        last = tasks[-1]
+        search_rank = getattr(last, "search_rank", None)
+        if search_rank is not None:
+            return encode_cursor(search_rank, last.task_uuid)
+        return encode_cursor(last.due_date, last.created_date, last.task_uuid)
+
+    def _apply_filters(self, query, filters):
+        # Batch fetch by task IDs
+        if 'ids' in filters and filters['ids']:
+            query = query.filter(Task.task_uuid.in_(filters['ids']))
+
         # Status filter
         if 'status' in filters and filters['status']:
             query = query.filter(Task.status == filters['status'])
@@ -57,57 +299,379 @@ class TaskService:
         # Priority filter
         if 'priority' in filters and filters['priority']:
             query = query.filter(Task.priority == filters['priority'])
-        
-        # Order by due date and created date
-        query = query.order_by(Task.due_date.asc(), Task.created_date.desc())
-        
-        return query.offset(skip).limit(limit).all()
+
+        # Tag filters; the array operators are served by the GIN index on tags
+        if 'tags_any' in filters and filters['tags_any']:
+            query = query.filter(Task.tags.op("&&")(self._tags_array(filters['tags_any'])))
+        if 'tags_all' in filters and filters['tags_all']:
+            query = query.filter(Task.tags.op("@>")(self._tags_array(filters['tags_all'])))
+
+        # Full-text search over title and description
+        if 'q' in filters and filters['q']:
+            tsquery = self._search_tsquery(filters['q'])
+            if tsquery is not None:
+                query = query.filter(TASK_SEARCH_VECTOR.op("@@")(tsquery))
+            elif self._search_terms(filters['q']):
+                pattern = "%" + re.sub(r"([\\%_])", r"\\\1", filters['q'].strip()) + "%"
+                query = query.filter(or_(
+                    Task.title.ilike(pattern, escape="\\"),
+                    Task.description.ilike(pattern, escape="\\")
+                ))
+
+        return query
+
+    @staticmethod
+    def _tags_array(tags):
+        # Same element type as the column so the GIN index operators apply
+        return cast(array(tags), ARRAY(String))
+
+    @staticmethod
+    def _search_terms(q):
+        # Letters and digits only, so every term parses to at least one lexeme
+        return re.findall(r"[^\W_]+", q.lower()) if q else []
+
+    def _search_tsquery(self, q):
+        """Prefix-matching tsquery for `q`, or None when full-text search does not apply.
+
+        Terms are stemmed like the english search_vector. A stop word ("to",
+        "a", "in") stems to nothing there, which would empty the whole query,
+        so its prefix is taken as typed ("to" still finds "tomorrow").
+        """
+        terms = self._search_terms(q)
+        if not terms or self.db.get_bind().dialect.name != "postgresql":
+            return None
+        tsquery = None
+        for term in terms:
+            prefix = f"{term}:*"
+            term_query = case(
+                (func.length(func.to_tsvector("english", term)) == 0, func.to_tsquery("simple", prefix)),
+                else_=func.to_tsquery("english", prefix)
+            )
+            tsquery = term_query if tsquery is None else tsquery.op("&&")(term_query)
+        return tsquery
+
+    @staticmethod
+    def _keyset_order():
+        # Matches the ix_tasks_due_created_uuid index
+        return (Task.due_date.asc().nullslast(), Task.created_date.asc(), Task.task_uuid.asc())
+
+    @staticmethod
+    def _decode_keyset_cursor(cursor):
+        due_date, created_date, task_uuid = decode_cursor(cursor, 3)
+        return (
+            parse_cursor_datetime(due_date),
+            parse_cursor_datetime(created_date),
+            parse_cursor_uuid(task_uuid),
+        )
 
     # Update a task
     def update_task(self, task_uuid, **kwargs):
-        task = self.db.query(Task).filter(Task.task_uuid == task_uuid, Task.deleted_date == None).first()
-        if not task:
-            return None
-        for key, value in kwargs.items():
-            if value is not None:
-                setattr(task, key, value)
-        self.db.commit()
-        self.db.refresh(task)
-        return task
+        values = {key: value for key, value in kwargs.items() if value is not None}
+        if not values:
+            return self.get_task(task_uuid)
+        return self._update_returning(task_uuid, values)
 
     # Soft delete a task
     def delete_task(self, task_uuid):
-        task = self.db.query(Task).filter(Task.task_uuid == task_uuid, Task.deleted_date == None).first()
-        if not task:
-            return None
-        task.deleted_date = datetime.utcnow()
-        self.db.commit()
-        return task
+        return self._update_returning(task_uuid, {"deleted_date": datetime.utcnow()})
 
     # Assign task to user
     def assign_task(self, task_uuid, user_id):
-        task = self.db.query(Task).filter(Task.task_uuid == task_uuid, Task.deleted_date == None).first()
-        if not task:
-            return None
-        
-        # Set assigned_to to user_id (can be None for unassignment)
-        task.assigned_to = user_id
-        
-        # Update the modified date
-        task.modified_date = datetime.utcnow()
-        
-        self.db.commit()
-        self.db.refresh(task)
-        return task
+        """Set assigned_to to user_id (None unassigns) in one statement.
+
+        Raises ValueError when user_id is not a live user; returns None when
+        there is no live task.
+        """
+        if user_id is None:
+            return self._update_returning(task_uuid, {"assigned_to": None})
+        row = self._update_returning(task_uuid, {"assigned_to": user_id}, _ASSIGN_LIVE_TASK, assignee=user_id)
+        # Only a failed assignment pays for finding out which of the two was missing
+        if row is None and self._missing_assignees([user_id]):
+            raise ValueError("User not found")
+        return row
 
     # Mark task as completed
     def mark_task_completed(self, task_uuid):
-        task = self.db.query(Task).filter(Task.task_uuid == task_uuid, Task.deleted_date == None).first()
-        if not task:
+        return self._update_returning(
+            task_uuid, {"status": Status.DONE.value, "completed_date": datetime.utcnow()}
+        )
+
+    # Create many tasks with one multi-row INSERT ... RETURNING
+    def create_tasks(self, items):
+        """Create tasks from (index, fields) pairs in one transaction.
+
+        Returns (rows, errors); items whose assignee does not exist are
+        reported by index and skipped.
+        """
+        missing = self._missing_assignees(fields.get("assigned_to") for _, fields in items)
+        errors = []
+        valid = []
+        for index, fields in items:
+            if fields.get("assigned_to") in missing:
+                errors.append(self._bulk_error(index, None, "User not found"))
+            else:
+                valid.append(fields)
+
+        rows = []
+        if valid:
+            rows = self.db.execute(insert(_TASKS).returning(*_TASKS.c, sort_by_parameter_order=True), valid).all()
+            deltas = Counter(TaskCounterService.key(row.assigned_to, row.status) for row in rows)
+            TaskCounterService(self.db).apply(deltas)
+            self.db.commit()
+            self._tasks_changed(rows, created=True)
+        return rows, errors
+
+    # Partially update many tasks with UPDATE ... FROM (VALUES ...)
+    def update_tasks(self, items):
+        """Apply (index, task_uuid, values) updates in one transaction.
+
+        Items changing the same set of fields share one statement. Returns
+        (rows, errors); duplicate, missing and invalid items are reported by
+        index and skipped.
+        """
+        missing = self._missing_assignees(values.get("assigned_to") for _, _, values in items)
+        errors = []
+        indexes = {}
+        groups = defaultdict(list)
+        for index, task_uuid, values in items:
+            values = {key: value for key, value in values.items() if value is not None}
+            if task_uuid in indexes:
+                errors.append(self._bulk_error(index, task_uuid, "Duplicate task in request"))
+            elif not values:
+                errors.append(self._bulk_error(index, task_uuid, "No fields to update"))
+            elif values.get("assigned_to") in missing:
+                errors.append(self._bulk_error(index, task_uuid, "User not found"))
+            else:
+                indexes[task_uuid] = index
+                groups[tuple(sorted(values))].append((task_uuid, values))
+
+        rows = []
+        for columns, group in groups.items():
+            changes = sql_values(
+                column("task_uuid", _TASKS.c.task_uuid.type),
+                *[column(name, _TASKS.c[name].type) for name in columns],
+                name="changes"
+            ).data([(task_uuid, *[values[name] for name in columns]) for task_uuid, values in group])
+            old_task = _select_old_tasks(
+                _TASKS.c.task_uuid.in_([task_uuid for task_uuid, _ in group])
+            ).with_for_update().subquery("old_task")
+            stmt = _update_old_tasks(old_task, _TASKS.c.task_uuid == changes.c.task_uuid).values(
+                {name: changes.c[name] for name in columns}
+            )
+            rows += self.db.execute(stmt).all()
+
+        return self._finish_bulk_update(rows, indexes, errors)
+
+    # Apply one update to every task matching the filters
+    def update_tasks_matching(self, values, max_tasks, **filters):
+        """Update at most max_tasks tasks matching the filters in one statement.
+
+        Raises ValueError (and changes nothing) when more tasks match.
+        """
+        values = {key: value for key, value in values.items() if value is not None}
+        if not values:
+            raise ValueError("No fields to update")
+        if values.get("assigned_to") in self._missing_assignees([values.get("assigned_to")]):
+            raise ValueError("User not found")
+
+        old_task = self._apply_filters(_select_old_tasks(), filters).limit(max_tasks + 1).with_for_update()
+        rows = self.db.execute(_update_old_tasks(old_task.subquery("old_task")).values(**values)).all()
+        if len(rows) > max_tasks:
+            self.db.rollback()
+            raise ValueError(f"Filter matches more than {max_tasks} tasks")
+
+        return self._finish_bulk_update(rows, {}, [])[0]
+
+    # Soft delete many tasks in one UPDATE ... RETURNING
+    def delete_tasks(self, task_uuids):
+        """Soft delete tasks by UUID. Returns (rows, errors) with errors by index."""
+        errors = []
+        indexes = {}
+        for index, task_uuid in enumerate(task_uuids):
+            if task_uuid in indexes:
+                errors.append(self._bulk_error(index, task_uuid, "Duplicate task in request"))
+            else:
+                indexes[task_uuid] = index
+
+        old_task = _select_old_tasks(_TASKS.c.task_uuid.in_(list(indexes))).with_for_update().subquery("old_task")
+        rows = self.db.execute(_update_old_tasks(old_task).values(deleted_date=datetime.utcnow())).all() if indexes else []
+        return self._finish_bulk_update(rows, indexes, errors)
+
+    def _finish_bulk_update(self, rows, indexes, errors):
+        # Report requested tasks that matched no live row, then move counters and commit
+        rows = sorted(rows, key=lambda row: indexes.get(row.task_uuid, 0))
+        updated = {row.task_uuid for row in rows}
+        errors += [
+            self._bulk_error(index, task_uuid, "Task not found")
+            for task_uuid, index in indexes.items() if task_uuid not in updated
+        ]
+        if rows:
+            TaskCounterService(self.db).apply(self._counter_deltas(rows))
+            self.db.commit()
+            self._tasks_changed(rows)
+        else:
+            self.db.rollback()
+        return rows, sorted(errors, key=lambda error: error["index"])
+
+    def _missing_assignees(self, user_uuids):
+        # Assignees that are not live users, looked up in one query
+        user_uuids = {user_uuid for user_uuid in user_uuids if user_uuid}
+        if not user_uuids:
+            return set()
+        found = self.db.execute(
+            select(User.user_uuid).where(User.user_uuid.in_(user_uuids), User.deleted_date == None)
+        ).scalars()
+        return user_uuids - set(found)
+
+    @staticmethod
+    def _bulk_error(index, task_uuid, detail):
+        return {"index": index, "task_uuid": task_uuid, "detail": detail}
+
+    # Task summary for dashboards, read from the maintained counters
+    def get_task_summary(self, assigned_to=None):
+        counter_service = TaskCounterService(self.db)
+        counts = counter_service.get_counts(assigned_to)
+        return {
+            "counts": counts,
+            "total": sum(counts.values()),
+            "overdue": counter_service.get_overdue_count(assigned_to)
+        }
+
+    # Tag counts over the tasks matching the filters
+    def get_tag_facets(self, limit=50, **filters):
+        if not 1 <= limit <= settings.TAG_FACETS_MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {settings.TAG_FACETS_MAX_LIMIT}")
+        key = cache_service.versioned_key(
+            self.CACHE_NAMESPACE, "tags", cache_service.signature(limit=limit, **filters)
+        )
+        if key:
+            cached = cache_service.get_json(key)
+            if cached is not None:
+                return cached
+
+        tasks = self._apply_filters(self.db.query(Task).filter(Task.deleted_date == None), filters)
+        tags = tasks.with_entities(func.unnest(Task.tags).label("tag")).subquery()
+        task_count = func.count().label("count")
+        rows = self.db.execute(
+            select(tags.c.tag, task_count)
+            .group_by(tags.c.tag)
+            .order_by(task_count.desc(), tags.c.tag)
+            .limit(limit)
+        ).all()
+        facets = [{"tag": tag, "count": count} for tag, count in rows]
+
+        if key:
+            cache_service.set_json(key, facets, settings.CACHE_TAG_FACETS_TTL)
+        return facets
+
+    # Dashboard statistics over the tasks matching the filters
+    def get_task_stats(self, completed_from, completed_to, **filters):
+        """Counts by status and priority, overdue count and completions per day (UTC).
+
+        One grouped query over the filtered set: on PostgreSQL GROUPING SETS
+        return one group per status, priority and completion day, elsewhere
+        the rows are grouped by all three and added up here. Completions are
+        counted for the days from completed_from to completed_to inclusive.
+        """
+        if completed_from > completed_to:
+            raise ValueError("completed_from must not be after completed_to")
+        days = (completed_to - completed_from).days + 1
+        if days > STATS_MAX_DAYS:
+            raise ValueError(f"The completed date range may span at most {STATS_MAX_DAYS} days")
+
+        key = cache_service.versioned_key(
+            self.CACHE_NAMESPACE, "stats",
+            cache_service.signature(completed_from=completed_from, completed_to=completed_to, **filters)
+        )
+        if key:
+            cached = cache_service.get_json(key)
+            if cached is not None:
+                return cached
+
+        start = datetime.combine(completed_from, datetime.min.time())
+        end = start + timedelta(days=days)
+        filtered = self._apply_filters(select(
+            _TASKS.c.status,
+            _TASKS.c.priority,
+            case(
+                (and_(_TASKS.c.completed_date >= start, _TASKS.c.completed_date < end), self._utc_day(_TASKS.c.completed_date))
+            ).label("completed_day"),
+            case(
+                (and_(_TASKS.c.status != Status.DONE.value, _TASKS.c.due_date < datetime.utcnow()), 1), else_=0
+            ).label("overdue")
+        ).where(_TASKS.c.deleted_date == None), filters).subquery("filtered")
+
+        group_keys = (filtered.c.status, filtered.c.priority, filtered.c.completed_day)
+        columns = [*group_keys, func.count().label("task_count"), func.sum(filtered.c.overdue).label("overdue")]
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Bit 4 set: not grouped by status, 2: by priority, 1: by completion day
+            stmt = select(*columns, func.grouping(*group_keys).label("grouping")).group_by(
+                func.grouping_sets(*(tuple_(group_key) for group_key in group_keys))
+            )
+        else:
+            stmt = select(*columns, literal(0).label("grouping")).group_by(*group_keys)
+
+        by_status = {status.value: 0 for status in Status}
+        by_priority = {str(priority.value): 0 for priority in Priority}
+        completed = {(completed_from + timedelta(days=offset)).isoformat(): 0 for offset in range(days)}
+        overdue = 0
+        for row in self.db.execute(stmt):
+            if not row.grouping & 4:
+                by_status[row.status] = by_status.get(row.status, 0) + row.task_count
+                overdue += int(row.overdue or 0)
+            if not row.grouping & 2:
+                by_priority[str(row.priority)] = by_priority.get(str(row.priority), 0) + row.task_count
+            if not row.grouping & 1 and row.completed_day is not None:
+                completed[str(row.completed_day)[:10]] += row.task_count
+
+        stats = {
+            "total": sum(by_status.values()),
+            "overdue": overdue,
+            "by_status": by_status,
+            "by_priority": by_priority,
+            "completed_per_day": [{"date": day, "count": count} for day, count in completed.items()]
+        }
+        if key:
+            cache_service.set_json(key, stats, settings.CACHE_DEFAULT_TTL)
+        return stats
+
+    def _utc_day(self, column):
+        # timestamptz columns are bucketed by their UTC day, not the session time zone's
+        if self.db.get_bind().dialect.name == "postgresql":
+            return func.date(func.timezone("UTC", column))
+        return func.date(column)
+
+    def _update_returning(self, task_uuid, values, stmt=_UPDATE_LIVE_TASK, **params):
+        """Update a live task in one UPDATE ... RETURNING and move its counter.
+
+        The old assignee and status come from a locked self-join in the same
+        statement, so counters see the row as it was right before this write.
+        Returns the updated row, or None when there is no live task.
+        """
+        row = self.db.execute(stmt.values(**values), {"target_uuid": task_uuid, **params}).first()
+        if row is None:
+            self.db.rollback()
             return None
-        task.status = Status.DONE
-        task.completed_date = datetime.utcnow()
-        task.modified_date = datetime.utcnow()
+
+        TaskCounterService(self.db).apply(self._counter_deltas([row]))
         self.db.commit()
-        self.db.refresh(task)
-        return task
+        self._tasks_changed([row])
+        return row
+
+    @staticmethod
+    def _counter_deltas(rows):
+        # Counter moves for rows returned by _update_old_tasks
+        deltas = Counter()
+        for row in rows:
+            deltas[TaskCounterService.key(row.old_assigned_to, row.old_status)] -= 1
+            if row.deleted_date is None:
+                deltas[TaskCounterService.key(row.assigned_to, row.status)] += 1
+        return deltas
+
+    # After a committed write: invalidate cached lists and counts and the cached
+    # entities of updated tasks, and publish a change event per written row
+    def _tasks_changed(self, rows, created=False):
+        cache_service.bump_version(self.CACHE_NAMESPACE)
+        if not created:
+            task_entity_cache.invalidate([row.task_uuid for row in rows])
+        task_event_broker.publish(rows)
@@ -0,0 +1,72 @@
+import logging
+from contextlib import aclosing
+from typing import AsyncIterator, Optional
+import anyio
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
+from starlette.concurrency import run_in_threadpool
+from services.task_events import (
+    StreamUnavailableError, SubscriberOverflow, TaskEvent, TaskEventFilter, task_event_broker
+)
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# WebSocket close code asking the client to come back later (RFC 6455 "Try Again Later")
+WS_TRY_AGAIN_LATER = 1013
+
+_HEARTBEAT = orjson.dumps({"type": "heartbeat"}).decode()
+
+async def _task_events(event_filter: TaskEventFilter, last_event_id: Optional[str]) -> AsyncIterator[Optional[TaskEvent]]:
+    """Yield the events a subscriber missed, then live ones; None when a heartbeat is due.
+
+    Ends when the subscriber overflows its queue or the missed events cannot
+    be read; the client then reconnects with its last event ID.
+    """
+    subscription = task_event_broker.subscribe(event_filter, last_event_id)
+    try:
+        # Subscribed first, so nothing published during the replay is lost
+        for event in await run_in_threadpool(task_event_broker.replay, subscription):
+            yield event
+        while True:
+            yield await subscription.next(settings.STREAM_HEARTBEAT_SECONDS)
+    except StreamUnavailableError:
+        logger.warning("Task stream ended: events could not be replayed")
+    except SubscriberOverflow:
+        logger.info("Task stream subscriber fell behind and was disconnected")
+    finally:
+        task_event_broker.unsubscribe(subscription)
+
+async def sse_events(event_filter: TaskEventFilter, last_event_id: Optional[str]):
+    """Task events as a text/event-stream body, with comment lines as heartbeats."""
+    yield f"retry: {settings.STREAM_RETRY_MS}\n\n"
+    async with aclosing(_task_events(event_filter, last_event_id)) as events:
+        async for event in events:
+            if event is None:
+                yield ": heartbeat\n\n"
+            else:
+                yield f"id: {event.id}\nevent: {event.type}\ndata: {event.json}\n\n"
+
+async def websocket_events(websocket: WebSocket, event_filter: TaskEventFilter, last_event_id: Optional[str]) -> None:
+    """Send task events as JSON text messages until the client disconnects.
+
+    Messages from the client are read only to notice it going away.
+    """
+    async with anyio.create_task_group() as task_group:
+        async def send_events():
+            try:
+                async with aclosing(_task_events(event_filter, last_event_id)) as events:
+                    async for event in events:
+                        await websocket.send_text(_HEARTBEAT if event is None else event.json)
+                await websocket.close(code=WS_TRY_AGAIN_LATER, reason="Resume from the last event ID")
+            except (WebSocketDisconnect, RuntimeError):
+                pass
+            task_group.cancel_scope.cancel()
+
+        async def wait_for_disconnect():
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+            task_group.cancel_scope.cancel()
+
+        task_group.start_soon(send_events)
+        task_group.start_soon(wait_for_disconnect)
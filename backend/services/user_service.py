@@ -1,14 +1,38 @@
 from uuid import UUID
+import re
+from sqlalchemy import Row, bindparam, func, literal, or_, select, union
 from sqlalchemy.orm import Session
 from models.user import User
+from services.cache_service import cache_service
+from services.count_service import CountService, COUNT_MODE_EXACT
+from config.settings import settings
 from datetime import datetime
 from typing import Optional, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Username lookup runs on every authenticated request; built once, bound per call
+_GET_USER_BY_USERNAME = select(User).where(
+    User.username.ilike(bindparam("username")),
+    User.deleted_date == None
+).limit(1)
+
+# Columns of a user list entry (UserResponse)
+_USER_LIST_COLUMNS = [User.user_uuid, User.username, User.name, User.email, User.created_date]
+
+# Columns matched by search_users, each with pg_trgm GIN and lower() prefix indexes (migration 007)
+_USER_SEARCH_COLUMNS = (User.username, User.name, User.email)
+
+# Shorter search terms have too few trigrams for substring matching to narrow
+# anything down, so they only match prefixes
+USER_SEARCH_MIN_SUBSTRING = 3
+
 class UserService:
     """Service class for user-related operations."""
+
+    # Cache namespace whose version is bumped on every user write
+    CACHE_NAMESPACE = "users"
     
     def __init__(self, db: Session):
         self.db = db
@@ -19,6 +43,7 @@ class UserService:
             user = User(**kwargs)
             self.db.add(user)
             self.db.commit()
+            cache_service.bump_version(self.CACHE_NAMESPACE)
             self.db.refresh(user)
             logger.info(f"User created: {user.username}")
             return user
@@ -36,10 +61,9 @@ class UserService:
 
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Get a user by username (case-insensitive)."""
-        return self.db.query(User).filter(
-            User.username.ilike(username.lower()),
-            User.deleted_date == None
-        ).first()
+        return self.db.execute(
+            _GET_USER_BY_USERNAME, {"username": username.lower()}
+        ).scalars().first()
 
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get a user by email (case-insensitive)."""
@@ -48,11 +72,82 @@ class UserService:
             User.deleted_date == None
         ).first()
 
-    def get_users(self, skip: int = 0, limit: int = 10) -> List[User]:
-        """Get all users with pagination."""
-        return self.db.query(User).filter(
-            User.deleted_date == None
-        ).offset(skip).limit(limit).all()
+    def get_users(self, skip: int = 0, limit: int = 10, ids: Optional[List[UUID]] = None) -> List[Row]:
+        """Get all users with pagination, or the live ones among `ids` in one IN query.
+
+        Read-only: returns Core rows with the UserResponse columns instead of
+        ORM instances.
+        """
+        stmt = select(*_USER_LIST_COLUMNS).where(User.deleted_date == None)
+        if ids:
+            return self.db.execute(stmt.where(User.user_uuid.in_(ids)).order_by(User.user_uuid)).all()
+        return self.db.execute(stmt.offset(skip).limit(limit)).all()
+
+    def search_users(self, q: str, limit: int = 10) -> List[dict]:
+        """Live users whose username, name or email contains `q`, best matches first.
+
+        Prefix matches come first, then the rest by trigram similarity to `q`,
+        then by username. Results are cached per search term for
+        USER_SEARCH_CACHE_TTL seconds, so a typeahead re-sending a prefix does
+        not query again; user writes invalidate them.
+        """
+        term = q.strip().lower()
+        if not term:
+            return []
+
+        key = cache_service.versioned_key(
+            self.CACHE_NAMESPACE, "search", cache_service.signature(q=term, limit=limit)
+        )
+        if key:
+            cached = cache_service.get_json(key)
+            if cached is not None:
+                return cached
+
+        escaped = re.sub(r"([\\%_])", r"\\\1", term)
+        if self.db.get_bind().dialect.name == "postgresql":
+            matches = self._search_candidates(term, escaped, limit)
+            similarity = func.greatest(*(func.similarity(matches.c[column.key], term) for column in _USER_SEARCH_COLUMNS))
+        else:
+            pattern = ("%" if len(term) >= USER_SEARCH_MIN_SUBSTRING else "") + escaped + "%"
+            matches = select(*_USER_LIST_COLUMNS).where(
+                User.deleted_date == None,
+                or_(*(func.lower(column).like(pattern, escape="\\") for column in _USER_SEARCH_COLUMNS))
+            ).subquery()
+            similarity = literal(0)
+
+        is_prefix = or_(*(
+            func.lower(matches.c[column.key]).like(escaped + "%", escape="\\") for column in _USER_SEARCH_COLUMNS
+        ))
+        stmt = select(matches).order_by(is_prefix.desc(), similarity.desc(), matches.c.username).limit(limit)
+        users = [row._asdict() for row in self.db.execute(stmt)]
+
+        if key:
+            cache_service.set_json(key, users, settings.USER_SEARCH_CACHE_TTL)
+        return users
+
+    def _search_candidates(self, term: str, escaped: str, limit: int):
+        """The users search_users ranks, bounded however common the term is (PostgreSQL).
+
+        The first `limit` prefix matches of each column in index order (the
+        lower(column) COLLATE "C" indexes), plus at most
+        USER_SEARCH_CANDIDATES substring matches of each column through the
+        pg_trgm GIN indexes. Ranking every match of a term shared by most of
+        the directory (a mail domain, a common surname) would cost a
+        similarity per user; past the cap, typing more narrows the results.
+        """
+        live = User.deleted_date == None
+        candidates = [
+            select(*_USER_LIST_COLUMNS).where(live, func.lower(column).collate("C").like(escaped + "%", escape="\\"))
+            .order_by(func.lower(column).collate("C")).limit(limit)
+            for column in _USER_SEARCH_COLUMNS
+        ]
+        if len(term) >= USER_SEARCH_MIN_SUBSTRING:
+            candidates += [
+                select(*_USER_LIST_COLUMNS).where(live, column.ilike("%" + escaped + "%", escape="\\"))
+                .limit(settings.USER_SEARCH_CANDIDATES)
+                for column in _USER_SEARCH_COLUMNS
+            ]
+        return union(*candidates).subquery()
 
     def update_user(self, user_uuid: UUID, **kwargs) -> Optional[User]:
         """Update a user by UUID."""
@@ -66,6 +161,7 @@ class UserService:
                     setattr(user, key, value)
             
             self.db.commit()
+            cache_service.bump_version(self.CACHE_NAMESPACE)
             self.db.refresh(user)
             logger.info(f"User updated: {user.username}")
             return user
@@ -83,6 +179,7 @@ class UserService:
             
             user.deleted_date = datetime.utcnow()
             self.db.commit()
+            cache_service.bump_version(self.CACHE_NAMESPACE)
             logger.info(f"User deleted: {user.username}")
             return user
         except Exception as e:
@@ -90,6 +187,9 @@ class UserService:
             self.db.rollback()
             raise
 
-    def get_user_count(self) -> int:
-        """Get total count of active users."""
-        return self.db.query(User).filter(User.deleted_date == None).count()
+    def get_user_count(self, mode: str = COUNT_MODE_EXACT) -> int:
+        """Get total count of active users (cached exact or planner estimate)."""
+        query = self.db.query(User).filter(User.deleted_date == None)
+        return CountService(self.db).count(
+            query.statement, self.CACHE_NAMESPACE, cache_service.signature(), mode
+        )
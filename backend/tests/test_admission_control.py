@@ -0,0 +1,107 @@
+import asyncio
+from middleware.admission_control import AdmissionController, AdmissionControlMiddleware
+
+def make_controller(**overrides):
+    options = dict(
+        initial_limit=2, min_limit=1, max_limit=10, queue_size=1,
+        queue_timeout=0.05, latency_target=0.5, priority_reserve=1
+    )
+    options.update(overrides)
+    return AdmissionController(**options)
+
+class TestAdmissionController:
+    """Test the adaptive concurrency limit."""
+
+    def test_queue_then_reject(self):
+        """Test that requests over the limit queue, then get rejected."""
+        async def scenario():
+            controller = make_controller()
+            assert await controller.acquire()
+            assert await controller.acquire()
+
+            queued = asyncio.ensure_future(controller.acquire())
+            await asyncio.sleep(0)
+            assert not await controller.acquire()  # queue full
+            controller.release(0.01, was_at_limit=True)
+            assert await queued
+            assert controller.in_flight == 2
+
+            assert not await controller.acquire()  # waits, then times out
+            assert controller.stats["rejected"] == 1
+            assert controller.stats["timed_out"] == 1
+
+        asyncio.run(scenario())
+
+    def test_priority_lane(self):
+        """Test that priority requests may use the reserve above the limit."""
+        async def scenario():
+            controller = make_controller(queue_size=0)
+            assert await controller.acquire()
+            assert await controller.acquire()
+            assert not await controller.acquire()
+            assert await controller.acquire(priority=True)
+
+        asyncio.run(scenario())
+
+    def test_limit_adapts(self):
+        """Test additive increase at the limit and multiplicative decrease on slow requests."""
+        async def scenario():
+            controller = make_controller(initial_limit=4)
+            for _ in range(8):
+                await controller.acquire()
+                controller.release(0.01, was_at_limit=True)
+            raised = controller.limit
+            assert raised > 5
+
+            await controller.acquire()
+            controller.release(1.0, was_at_limit=False)
+            assert controller.limit == raised * 0.75
+
+            # Backs off at most once per latency target
+            lowered = controller.limit
+            await controller.acquire()
+            controller.release(1.0, was_at_limit=False)
+            assert controller.limit == lowered
+
+        asyncio.run(scenario())
+
+    def test_overload_signal_lowers_limit(self):
+        """Test that a saturated pool lowers the limit even when requests are fast."""
+        async def scenario():
+            controller = make_controller(initial_limit=8, overloaded=lambda: True)
+            await controller.acquire()
+            controller.release(0.01, was_at_limit=False)
+            assert controller.limit == 6
+
+        asyncio.run(scenario())
+
+    def test_middleware_rejects_with_retry_after(self):
+        """Test the 503 with Retry-After, and that exempt paths bypass the limit."""
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        async def call(middleware, path):
+            messages = []
+
+            async def send(message):
+                messages.append(message)
+
+            async def receive():
+                return {"type": "http.request", "body": b""}
+
+            await middleware({"type": "http", "method": "GET", "path": path, "headers": []}, receive, send)
+            return messages[0]
+
+        async def scenario():
+            controller = make_controller(initial_limit=1, queue_size=0)
+            middleware = AdmissionControlMiddleware(app, controller, ["/auth"], ["/health"])
+            await controller.acquire()  # someone else holds the only slot
+
+            start = await call(middleware, "/tasks/")
+            assert start["status"] == 503
+            assert (b"retry-after", b"1") in start["headers"]
+            assert (await call(middleware, "/health"))["status"] == 200
+            assert (await call(middleware, "/auth/token"))["status"] == 200
+
+        asyncio.run(scenario())
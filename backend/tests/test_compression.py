@@ -0,0 +1,95 @@
+import asyncio
+import gzip
+from middleware.compression import CompressionMiddleware, CompressionStats, negotiate_encoding
+
+BODY = b'{"title": "Write the quarterly report"}' * 100
+
+def make_app(body=BODY, content_type=b"application/json", chunks=1, headers=()):
+    async def app(scope, receive, send):
+        raw = [(b"content-type", content_type), *headers]
+        if chunks == 1:
+            raw.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": raw})
+        for i in range(chunks):
+            await send({"type": "http.response.body", "body": body, "more_body": i < chunks - 1})
+    return app
+
+def call(middleware, accept_encoding="gzip", path="/tasks/"):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    scope = {"type": "http", "method": "GET", "path": path, "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    asyncio.run(middleware(scope, receive, send))
+    headers = dict(messages[0]["headers"])
+    return headers, b"".join(message.get("body", b"") for message in messages[1:])
+
+def make_middleware(app, **overrides):
+    options = dict(
+        stats=CompressionStats(), minimum_size=500, gzip_level=6, brotli_quality=4,
+        precompressed_paths=["/tasks/statuses"]
+    )
+    options.update(overrides)
+    return CompressionMiddleware(app, **options)
+
+class TestCompression:
+    """Test negotiated response compression."""
+
+    def test_negotiate_encoding(self):
+        """Test q-values, wildcards and refusals in Accept-Encoding."""
+        assert negotiate_encoding("gzip, br", ["br", "gzip"]) == "br"
+        assert negotiate_encoding("gzip, br;q=0.5", ["br", "gzip"]) == "gzip"
+        assert negotiate_encoding("*", ["br", "gzip"]) == "br"
+        assert negotiate_encoding("gzip;q=0, identity", ["gzip"]) is None
+        assert negotiate_encoding("", ["gzip"]) is None
+
+    def test_compresses_json(self):
+        """Test that a large JSON body is gzipped with Vary and a weak ETag."""
+        middleware = make_middleware(make_app(headers=[(b"etag", b'"abc"')]))
+        headers, body = call(middleware)
+        assert headers[b"content-encoding"] == b"gzip"
+        assert headers[b"vary"] == b"Accept-Encoding"
+        assert headers[b"etag"] == b'W/"abc"'
+        assert int(headers[b"content-length"]) == len(body)
+        assert gzip.decompress(body) == BODY
+
+        stats = middleware.stats.metrics()["/tasks/"]
+        assert stats["responses"] == 1 and stats["bytes_in"] == len(BODY)
+        assert stats["ratio"] > 5
+
+    def test_skips_small_encoded_and_event_streams(self):
+        """Test that small, already encoded and event-stream bodies pass through."""
+        small = b'{"ok": true}'
+        for app, expected in (
+            (make_app(body=small), small),
+            (make_app(headers=[(b"content-encoding", b"gzip")]), BODY),
+            (make_app(content_type=b"text/event-stream", chunks=2), BODY * 2),
+            (make_app(content_type=b"image/png"), BODY),
+        ):
+            headers, body = call(make_middleware(app))
+            assert b"vary" not in headers
+            assert body == expected
+
+        headers, body = call(make_middleware(make_app()), accept_encoding="identity")
+        assert b"content-encoding" not in headers
+        assert headers[b"vary"] == b"Accept-Encoding"
+        assert body == BODY
+
+    def test_streamed_body(self):
+        """Test that streamed chunks are compressed incrementally without a Content-Length."""
+        headers, body = call(make_middleware(make_app(chunks=3)))
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        assert gzip.decompress(body) == BODY * 3
+
+    def test_precompressed_path(self):
+        """Test that static paths are compressed once and then served from memory."""
+        middleware = make_middleware(make_app(headers=[(b"etag", b'"statuses"')]))
+        first = call(middleware, path="/tasks/statuses")[1]
+        second = call(middleware, path="/tasks/statuses")[1]
+        assert first == second and gzip.decompress(second) == BODY
+        assert middleware.stats.metrics()["/tasks/statuses"]["precompressed"] == 1
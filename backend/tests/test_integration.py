@@ -36,7 +36,7 @@ class TestTaskIntegration:
         assert completed_task["completed_date"] is not None
 
         # 4. Verify task appears in filtered results
-        done_tasks_response = client.get(f"/tasks/?status={Status.DONE}", headers=auth_headers)
+        done_tasks_response = client.get(f"/tasks/?status={Status.DONE.value}", headers=auth_headers)
         assert done_tasks_response.status_code == 200
         done_tasks = done_tasks_response.json()
         task_uuids = [t["task_uuid"] for t in done_tasks]
@@ -127,7 +127,7 @@ class TestTaskIntegration:
             created_tasks.append(response.json())
 
         # Test status filtering
-        todo_response = client.get(f"/tasks/?status={Status.TO_DO}", headers=auth_headers)
+        todo_response = client.get(f"/tasks/?status={Status.TO_DO.value}", headers=auth_headers)
         todo_tasks = todo_response.json()
         assert len([t for t in todo_tasks if t["status"] == Status.TO_DO]) >= 1
 
@@ -174,7 +174,7 @@ class TestTaskIntegration:
 
     def test_redis_rate_limiting_integration(self, client, auth_headers):
         """Test Redis-based rate limiting integration."""
-        from services.redis_manager import redis_manager
+        from services.redis_service import redis_manager
         
         # Skip test if Redis is not available
         if not redis_manager.is_connected():
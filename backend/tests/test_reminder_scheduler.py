@@ -0,0 +1,83 @@
+import uuid
+from datetime import datetime, timedelta
+from services.reminder_scheduler import DueReminderScheduler, ReminderQueue, _MAX_UUID
+from services.task_events import EVENT_RESET
+
+NOW = datetime(2026, 10, 19, 12, 0)
+
+def make_event(task_uuid, due_date, status="To Do", deleted_date=None):
+    return {"type": "task.updated", "task": {
+        "task_uuid": str(task_uuid), "due_date": due_date.isoformat() if due_date else None,
+        "status": status, "deleted_date": deleted_date
+    }}
+
+def make_scheduler():
+    scheduler = DueReminderScheduler(session_factory=None)
+    scheduler.watermark = (NOW, _MAX_UUID)
+    scheduler.loaded_until = (NOW + timedelta(hours=1), _MAX_UUID)
+    return scheduler
+
+class TestReminderQueue:
+    """Test the due-date heap."""
+
+    def test_pops_due_entries_in_order(self):
+        """Test that only entries due by now come out, earliest first."""
+        queue = ReminderQueue()
+        first, second, later = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        queue.schedule(second, NOW - timedelta(minutes=1))
+        queue.schedule(later, NOW + timedelta(minutes=5))
+        queue.schedule(first, NOW - timedelta(minutes=2))
+
+        assert [task_uuid for _, task_uuid in queue.pop_due(NOW)] == [first, second]
+        assert queue.next_due() == NOW + timedelta(minutes=5)
+        assert len(queue) == 1
+
+    def test_reschedule_and_cancel(self):
+        """Test that stale heap entries are skipped after a reschedule or cancel."""
+        queue = ReminderQueue()
+        moved, cancelled = uuid.uuid4(), uuid.uuid4()
+        queue.schedule(moved, NOW - timedelta(minutes=1))
+        queue.schedule(cancelled, NOW - timedelta(minutes=1))
+        queue.schedule(moved, NOW + timedelta(minutes=1))
+        queue.cancel(cancelled)
+
+        assert queue.pop_due(NOW) == []
+        assert queue.pop_due(NOW + timedelta(minutes=1)) == [(NOW + timedelta(minutes=1), moved)]
+        assert queue.next_due() is None
+
+class TestDueReminderScheduler:
+    """Test how task events update the scheduler's queue."""
+
+    def test_events_inside_the_window_are_scheduled(self):
+        """Test that open tasks due within the loaded window are queued, others are not."""
+        scheduler = make_scheduler()
+        inside, beyond, done = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        scheduler.apply(make_event(inside, NOW + timedelta(minutes=10)))
+        scheduler.apply(make_event(beyond, NOW + timedelta(hours=2)))
+        scheduler.apply(make_event(done, NOW + timedelta(minutes=10), status="Done"))
+
+        assert scheduler.queue.pop_due(NOW + timedelta(hours=3)) == [(NOW + timedelta(minutes=10), inside)]
+
+    def test_completed_deleted_or_undated_tasks_are_cancelled(self):
+        """Test that a task leaves the queue once completed, deleted or its due date is cleared."""
+        scheduler = make_scheduler()
+        tasks = [uuid.uuid4() for _ in range(3)]
+        for task_uuid in tasks:
+            scheduler.apply(make_event(task_uuid, NOW + timedelta(minutes=10)))
+
+        scheduler.apply(make_event(tasks[0], NOW + timedelta(minutes=10), status="Done"))
+        scheduler.apply(make_event(tasks[1], NOW + timedelta(minutes=10), deleted_date=NOW.isoformat()))
+        scheduler.apply(make_event(tasks[2], None))
+        assert len(scheduler.queue) == 0
+
+    def test_reset_reloads(self, monkeypatch):
+        """Test that a tasks.reset event reloads the queue from the watermark."""
+        scheduler = make_scheduler()
+        scheduler.apply(make_event(uuid.uuid4(), NOW + timedelta(minutes=10)))
+        loads = []
+        monkeypatch.setattr(scheduler, "load", loads.append)
+
+        scheduler.apply({"type": EVENT_RESET, "reason": "import"})
+        assert len(scheduler.queue) == 0
+        assert scheduler.loaded_until == scheduler.watermark
+        assert len(loads) == 1
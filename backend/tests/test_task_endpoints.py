@@ -0,0 +1,706 @@
+import pytest
+from fastapi.testclient import TestClient
+from datetime import datetime, timedelta
+import json
+import uuid
+from constants import Status, Priority
+from config.settings import settings
+
+class TestTaskEndpoints:
+    """Test suite for task management endpoints."""
+
+    def test_get_task_statuses(self, client):
+        """Test getting available task statuses."""
+        response = client.get("/tasks/statuses")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert "TO_DO" in data
+        assert "IN_PROGRESS" in data
+        assert "DONE" in data
+        assert data["TO_DO"] == Status.TO_DO
+        assert data["IN_PROGRESS"] == Status.IN_PROGRESS
+        assert data["DONE"] == Status.DONE
+
+    def test_get_task_statuses_cached(self, client):
+        """Test that task statuses are served with long-lived validators."""
+        response = client.get("/tasks/statuses")
+        assert "max-age" in response.headers["Cache-Control"]
+
+        response = client.get("/tasks/statuses", headers={"If-None-Match": response.headers["ETag"]})
+        assert response.status_code == 304
+
+    def test_create_task_success(self, client, auth_headers):
+        """Test successful task creation."""
+        task_data = {
+            "title": "New Test Task",
+            "description": "A new test task description",
+            "status": Status.TO_DO,
+            "priority": 1,
+            "due_date": (datetime.utcnow() + timedelta(days=5)).isoformat(),
+            "tags": ["urgent", "testing"]
+        }
+        
+        response = client.post("/tasks/", json=task_data, headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["title"] == task_data["title"]
+        assert data["description"] == task_data["description"]
+        assert data["status"] == task_data["status"]
+        assert data["priority"] == task_data["priority"]
+        assert data["tags"] == task_data["tags"]
+        assert "task_uuid" in data
+
+    def test_create_task_missing_title(self, client, auth_headers):
+        """Test task creation with missing title."""
+        task_data = {
+            "description": "Task without title",
+            "status": Status.TO_DO,
+            "priority": 2
+        }
+        
+        response = client.post("/tasks/", json=task_data, headers=auth_headers)
+        assert response.status_code == 422
+
+    def test_create_task_unauthorized(self, client):
+        """Test task creation without authentication."""
+        task_data = {
+            "title": "Unauthorized Task",
+            "description": "Should fail",
+            "status": Status.TO_DO,
+            "priority": 2
+        }
+        
+        response = client.post("/tasks/", json=task_data)
+        assert response.status_code == 401
+
+    def test_get_tasks_success(self, client, auth_headers, test_task):
+        """Test getting tasks list."""
+        response = client.get("/tasks/", headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data, list)
+        assert len(data) >= 1
+        
+        # Check if our test task is in the response
+        task_titles = [task["title"] for task in data]
+        assert test_task.title in task_titles
+
+    def test_get_tasks_with_filters(self, client, auth_headers, test_task):
+        """Test getting tasks with filters."""
+        # Test status filter
+        response = client.get(f"/tasks/?status={Status.TO_DO}", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        for task in data:
+            assert task["status"] == Status.TO_DO
+
+        # Test pagination
+        response = client.get("/tasks/?skip=0&limit=5", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) <= 5
+
+    def test_get_tasks_cursor_pagination(self, client, auth_headers):
+        """Test walking the task list with keyset cursors."""
+        for i in range(5):
+            task_data = {
+                "title": f"Cursor Task {i}",
+                "status": Status.TO_DO,
+                "priority": 2,
+                "due_date": (datetime.utcnow() + timedelta(days=i % 2)).isoformat()
+            }
+            assert client.post("/tasks/", json=task_data, headers=auth_headers).status_code == 200
+
+        expected = [t["task_uuid"] for t in client.get("/tasks/?limit=100", headers=auth_headers).json()]
+
+        seen = []
+        cursor = None
+        while True:
+            url = "/tasks/?limit=2" + (f"&cursor={cursor}" if cursor else "")
+            response = client.get(url, headers=auth_headers)
+            assert response.status_code == 200
+            seen.extend(t["task_uuid"] for t in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert seen == expected
+
+    def test_get_tasks_invalid_cursor(self, client, auth_headers):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/tasks/?cursor=not-a-cursor", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_get_tasks_total_count(self, client, auth_headers, test_task):
+        """Test the X-Total-Count header and its mode validation."""
+        response = client.get("/tasks/?total=exact&limit=1", headers=auth_headers)
+        assert response.status_code == 200
+        assert int(response.headers["X-Total-Count"]) >= 1
+
+        response = client.get("/tasks/?total=bogus", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_get_task_summary(self, client, auth_headers, test_user):
+        """Test that the summary counters follow task writes."""
+        before = client.get("/tasks/summary", headers=auth_headers).json()
+
+        task_data = {
+            "title": "Summary Task",
+            "status": Status.TO_DO,
+            "priority": 2,
+            "assigned_to": str(test_user.user_uuid)
+        }
+        task_uuid = client.post("/tasks/", json=task_data, headers=auth_headers).json()["task_uuid"]
+        client.post(f"/tasks/{task_uuid}/complete", headers=auth_headers)
+
+        response = client.get("/tasks/summary", headers=auth_headers)
+        assert response.status_code == 200
+        after = response.json()
+        assert after["counts"][Status.DONE] == before["counts"][Status.DONE] + 1
+        assert after["counts"][Status.TO_DO] == before["counts"][Status.TO_DO]
+        assert after["total"] == before["total"] + 1
+
+    def test_get_task_stats(self, client, auth_headers):
+        """Test the grouped dashboard statistics over filtered tasks."""
+        overdue = {"title": "Overdue", "status": Status.TO_DO, "priority": 1, "tags": ["stats"],
+                   "due_date": (datetime.utcnow() - timedelta(days=1)).isoformat()}
+        client.post("/tasks/", json=overdue, headers=auth_headers)
+        done = {"title": "Done", "status": Status.TO_DO, "priority": 3, "tags": ["stats"]}
+        task_uuid = client.post("/tasks/", json=done, headers=auth_headers).json()["task_uuid"]
+        client.post(f"/tasks/{task_uuid}/complete", headers=auth_headers)
+
+        response = client.get("/tasks/stats?tags_any=stats", headers=auth_headers)
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["total"] == 2
+        assert stats["overdue"] == 1
+        assert stats["by_status"][Status.DONE] == 1
+        assert stats["by_priority"] == {"1": 1, "2": 0, "3": 1}
+        assert len(stats["completed_per_day"]) == 30
+        assert stats["completed_per_day"][-1] == {"date": datetime.utcnow().date().isoformat(), "count": 1}
+
+        response = client.get("/tasks/stats?completed_from=2026-02-01&completed_to=2026-01-01", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_get_tasks_sparse_fields(self, client, auth_headers, test_task):
+        """Test trimming task list rows with fields=."""
+        response = client.get("/tasks/?fields=task_uuid,title,status", headers=auth_headers)
+        assert response.status_code == 200
+        for task in response.json():
+            assert set(task) == {"task_uuid", "title", "status"}
+
+        response = client.get("/tasks/?fields=title,not_a_field", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_get_tasks_by_ids_with_assignee(self, client, auth_headers, test_task, test_user2):
+        """Test batch fetching tasks and users by ids=, with expand=assignee."""
+        task_data = {"title": "Assigned", "status": Status.TO_DO, "priority": 2, "assigned_to": str(test_user2.user_uuid)}
+        assigned_uuid = client.post("/tasks/", json=task_data, headers=auth_headers).json()["task_uuid"]
+
+        ids = ",".join([str(test_task.task_uuid), assigned_uuid, str(uuid.uuid4())])
+        response = client.get(f"/tasks/?ids={ids}&expand=assignee&limit=1", headers=auth_headers)
+        assert response.status_code == 200
+        assignees = {task["task_uuid"]: task["assignee"] for task in response.json()}
+        assert set(assignees) == {str(test_task.task_uuid), assigned_uuid}
+        assert assignees[assigned_uuid] == {
+            "user_uuid": str(test_user2.user_uuid), "username": test_user2.username, "name": test_user2.name
+        }
+
+        response = client.get(f"/tasks/{assigned_uuid}?expand=assignee", headers=auth_headers)
+        assert response.json()["assignee"]["user_uuid"] == str(test_user2.user_uuid)
+
+        response = client.get(f"/users/?ids={test_user2.user_uuid},{uuid.uuid4()}", headers=auth_headers)
+        assert [user["user_uuid"] for user in response.json()] == [str(test_user2.user_uuid)]
+
+        assert client.get("/tasks/?ids=not-a-uuid", headers=auth_headers).status_code == 400
+        assert client.get("/tasks/?expand=owner", headers=auth_headers).status_code == 400
+
+    def test_search_users(self, client, auth_headers, test_user, test_user2):
+        """Test the assignee typeahead over username, name and email."""
+        response = client.get("/users/search?q=TEST", headers=auth_headers)
+        assert response.status_code == 200
+        assert [user["username"] for user in response.json()] == ["testuser", "testuser2"]
+
+        response = client.get("/users/search?q=user2&limit=5", headers=auth_headers)
+        assert [user["user_uuid"] for user in response.json()] == [str(test_user2.user_uuid)]
+
+        assert client.get("/users/search?q=test_", headers=auth_headers).json() == []
+        assert client.get("/users/search?q=test&limit=0", headers=auth_headers).status_code == 400
+
+    def test_search_tasks(self, client, auth_headers, test_task):
+        """Test full-text search over title and description with q=."""
+        for title in ["Quarterly report", "Reporting pipeline", "Unrelated chore"]:
+            client.post("/tasks/", json={"title": title, "status": Status.TO_DO, "priority": 2}, headers=auth_headers)
+
+        response = client.get("/tasks/?q=report&total=exact", headers=auth_headers)
+        assert response.status_code == 200
+        titles = [task["title"] for task in response.json()]
+        assert "Quarterly report" in titles
+        assert "Reporting pipeline" in titles
+        assert "Unrelated chore" not in titles
+        assert response.headers["X-Total-Count"] == str(len(titles))
+
+    def test_search_tasks_stop_word_prefix(self, client, auth_headers):
+        """Test that a prefix which is also a stop word still matches, alone or with other terms."""
+        for title in ["Call the bank tomorrow", "Unrelated chore"]:
+            client.post("/tasks/", json={"title": title, "status": Status.TO_DO, "priority": 2}, headers=auth_headers)
+
+        response = client.get("/tasks/?q=to", headers=auth_headers)
+        assert response.status_code == 200
+        assert [task["title"] for task in response.json()] == ["Call the bank tomorrow"]
+
+        response = client.get("/tasks/?q=bank%20to&total=exact", headers=auth_headers)
+        assert [task["title"] for task in response.json()] == ["Call the bank tomorrow"]
+        assert response.headers["X-Total-Count"] == "1"
+
+    def test_filter_tasks_by_tags(self, client, auth_headers):
+        """Test tags_any / tags_all filters and the tag facet counts."""
+        for title, tags in [("Both", ["work", "urgent"]), ("Work", ["work"]), ("Home", ["home"])]:
+            task_data = {"title": title, "status": Status.TO_DO, "priority": 2, "tags": tags}
+            client.post("/tasks/", json=task_data, headers=auth_headers)
+
+        response = client.get("/tasks/?tags_any=urgent,home", headers=auth_headers)
+        assert response.status_code == 200
+        assert {task["title"] for task in response.json()} == {"Both", "Home"}
+
+        response = client.get("/tasks/?tags_all=work,urgent", headers=auth_headers)
+        assert response.status_code == 200
+        assert [task["title"] for task in response.json()] == ["Both"]
+
+        response = client.get("/tasks/tags?tags_any=work", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == [{"tag": "work", "count": 2}, {"tag": "urgent", "count": 1}]
+
+        assert client.get("/tasks/tags?limit=0", headers=auth_headers).status_code == 400
+
+    def test_export_tasks(self, client, auth_headers, test_task):
+        """Test streaming task export as NDJSON and CSV."""
+        response = client.get("/tasks/export", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert str(test_task.task_uuid) in [row["task_uuid"] for row in rows]
+
+        response = client.get("/tasks/export?format=csv", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.text.splitlines()[0].startswith("task_uuid,title")
+
+        response = client.get("/tasks/export?format=xml", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_import_tasks(self, client, auth_headers):
+        """Test importing tasks from an NDJSON upload with a rejected row."""
+        lines = [
+            json.dumps({"title": "Imported 1", "status": Status.TO_DO, "priority": 2, "tags": ["import"]}),
+            json.dumps({"title": "Missing status"}),
+            json.dumps({"title": "Imported 2", "status": Status.DONE, "priority": 1}),
+        ]
+        response = client.post(
+            "/tasks/import",
+            files={"file": ("tasks.ndjson", "\n".join(lines).encode(), "application/x-ndjson")},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 2
+        assert data["failed"] == 1
+        assert data["errors"][0]["line"] == 2
+
+        titles = [task["title"] for task in client.get("/tasks/?tags_any=import", headers=auth_headers).json()]
+        assert titles == ["Imported 1"]
+
+    def test_import_reports_undecodable_lines(self, client, auth_headers):
+        """Test that a line that is not UTF-8 is reported and the rest still imported."""
+        lines = [
+            json.dumps({"title": "Before", "status": Status.TO_DO, "priority": 2, "tags": ["decode"]}).encode(),
+            b'{"title": "\xff"}',
+            json.dumps({"title": "After", "status": Status.TO_DO, "priority": 2, "tags": ["decode"]}).encode(),
+        ]
+        response = client.post(
+            "/tasks/import",
+            files={"file": ("tasks.ndjson", b"\n".join(lines), "application/x-ndjson")},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 2
+        assert [error["line"] for error in data["errors"]] == [2]
+
+    def test_export_csv_round_trip(self, client, auth_headers):
+        """Test that tags containing the CSV separator survive export and re-import."""
+        task_data = {"title": "Round trip", "status": Status.TO_DO, "priority": 2, "tags": ["a;b", "roundtrip"]}
+        client.post("/tasks/", json=task_data, headers=auth_headers)
+
+        exported = client.get("/tasks/export?format=csv&tags_any=roundtrip", headers=auth_headers).text
+        response = client.post(
+            "/tasks/import?format=csv",
+            files={"file": ("tasks.csv", exported.encode(), "text/csv")},
+            headers=auth_headers
+        )
+        assert response.json()["imported"] == 1
+
+        tasks = client.get("/tasks/?tags_any=roundtrip", headers=auth_headers).json()
+        assert [task["tags"] for task in tasks] == [["a;b", "roundtrip"]] * 2
+
+    def test_get_task_by_id_success(self, client, auth_headers, test_task):
+        """Test getting a specific task by ID."""
+        response = client.get(f"/tasks/{test_task.task_uuid}", headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["task_uuid"] == str(test_task.task_uuid)
+        assert data["title"] == test_task.title
+        assert data["description"] == test_task.description
+
+    def test_get_task_conditional(self, client, auth_headers, test_task):
+        """Test ETag / If-None-Match on a single task."""
+        response = client.get(f"/tasks/{test_task.task_uuid}", headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        response = client.get(
+            f"/tasks/{test_task.task_uuid}", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        client.put(f"/tasks/{test_task.task_uuid}", json={"title": "Changed"}, headers=auth_headers)
+        response = client.get(
+            f"/tasks/{test_task.task_uuid}", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_get_tasks_cached_page_sees_writes(self, client, auth_headers, test_task):
+        """Test that a cached task list is re-rendered after a task write."""
+        response = client.get("/tasks/", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] in ("hit", "miss")
+
+        client.put(f"/tasks/{test_task.task_uuid}", json={"title": "Changed"}, headers=auth_headers)
+        response = client.get("/tasks/", headers=auth_headers)
+        assert response.headers["X-Cache"] == "miss"
+        titles = [task["title"] for task in response.json()]
+        assert "Changed" in titles
+
+    def test_get_task_not_served_from_cache_after_delete(self, client, auth_headers, test_task):
+        """Test that deleting a task evicts it from the task cache."""
+        response = client.get(f"/tasks/{test_task.task_uuid}", headers=auth_headers)
+        assert response.status_code == 200
+
+        client.delete(f"/tasks/{test_task.task_uuid}", headers=auth_headers)
+        response = client.get(f"/tasks/{test_task.task_uuid}", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_get_task_changes_includes_tombstones(self, client, auth_headers, test_task, monkeypatch):
+        """Test that changes come back in modification order, deletes included, and resume from the cursor."""
+        monkeypatch.setattr(settings, "CHANGES_SAFETY_LAG_SECONDS", 0)
+        response = client.get("/tasks/changes", headers=auth_headers)
+        assert response.status_code == 200
+        cursor = response.json()["next_cursor"]
+        assert str(test_task.task_uuid) in [task["task_uuid"] for task in response.json()["changes"]]
+
+        client.delete(f"/tasks/{test_task.task_uuid}", headers=auth_headers)
+        response = client.get(f"/tasks/changes?since={cursor}", headers=auth_headers)
+        changes = response.json()["changes"]
+        assert [task["task_uuid"] for task in changes] == [str(test_task.task_uuid)]
+        assert changes[0]["deleted_date"] is not None
+
+        response = client.get("/tasks/changes?since=not-a-cursor", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_get_task_changes_reports_archived_tasks(self, client, auth_headers, test_task, db_session, monkeypatch):
+        """Test that a task moved to the archive after the cursor comes back as a removal."""
+        from services.task_archive_service import TaskArchiveService
+        monkeypatch.setattr(settings, "CHANGES_SAFETY_LAG_SECONDS", 0)
+        task_uuid = str(test_task.task_uuid)
+        cursor = client.get("/tasks/changes", headers=auth_headers).json()["next_cursor"]
+
+        test_task.status = Status.DONE.value
+        test_task.completed_date = datetime.utcnow() - timedelta(days=settings.ARCHIVE_COMPLETED_RETENTION_DAYS + 1)
+        db_session.commit()
+        assert TaskArchiveService(db_session).archive_expired() == 1
+
+        response = client.get(f"/tasks/changes?since={cursor}", headers=auth_headers)
+        assert response.status_code == 200
+        changes = response.json()["changes"]
+        assert [task["task_uuid"] for task in changes] == [task_uuid]
+        assert changes[0]["archived_date"] is not None
+
+    def test_get_task_by_id_not_found(self, client, auth_headers):
+        """Test getting a non-existent task."""
+        fake_uuid = str(uuid.uuid4())
+        response = client.get(f"/tasks/{fake_uuid}", headers=auth_headers)
+        
+        assert response.status_code == 404
+        assert "Task not found" in response.json()["detail"]
+
+    def test_update_task_success(self, client, auth_headers, test_task):
+        """Test successful task update."""
+        update_data = {
+            "title": "Updated Task Title",
+            "description": "Updated description",
+            "status": Status.IN_PROGRESS,
+            "priority": 1
+        }
+        
+        response = client.put(
+            f"/tasks/{test_task.task_uuid}", 
+            json=update_data, 
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["title"] == update_data["title"]
+        assert data["description"] == update_data["description"]
+        assert data["status"] == update_data["status"]
+        assert data["priority"] == update_data["priority"]
+
+    def test_update_task_partial(self, client, auth_headers, test_task):
+        """Test partial task update."""
+        update_data = {
+            "title": "Partially Updated Task"
+        }
+        
+        response = client.put(
+            f"/tasks/{test_task.task_uuid}", 
+            json=update_data, 
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["title"] == update_data["title"]
+        # Original description should remain unchanged
+        assert data["description"] == test_task.description
+
+    def test_update_task_not_found(self, client, auth_headers):
+        """Test updating a non-existent task."""
+        fake_uuid = str(uuid.uuid4())
+        update_data = {"title": "Updated Title"}
+        
+        response = client.put(
+            f"/tasks/{fake_uuid}", 
+            json=update_data, 
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 404
+
+    def test_delete_task_success(self, client, auth_headers, test_task):
+        """Test successful task deletion (soft delete)."""
+        response = client.delete(f"/tasks/{test_task.task_uuid}", headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["task_uuid"] == str(test_task.task_uuid)
+        
+        # Verify task is soft deleted (should not appear in GET requests)
+        get_response = client.get(f"/tasks/{test_task.task_uuid}", headers=auth_headers)
+        assert get_response.status_code == 404
+
+    def test_delete_task_not_found(self, client, auth_headers):
+        """Test deleting a non-existent task."""
+        fake_uuid = str(uuid.uuid4())
+        response = client.delete(f"/tasks/{fake_uuid}", headers=auth_headers)
+        
+        assert response.status_code == 404
+
+    def test_bulk_create_update_delete(self, client, auth_headers):
+        """Test the bulk endpoints with per-item errors."""
+        items = [
+            {"title": "Bulk 1", "status": Status.TO_DO, "priority": 1},
+            {"status": Status.TO_DO},
+            {"title": "Bulk 2", "status": Status.TO_DO, "priority": 2},
+        ]
+        response = client.post("/tasks/bulk", json={"items": items}, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [task["title"] for task in data["tasks"]] == ["Bulk 1", "Bulk 2"]
+        assert [error["index"] for error in data["errors"]] == [1]
+        task_uuids = [task["task_uuid"] for task in data["tasks"]]
+
+        patch = [
+            {"task_uuid": task_uuids[0], "status": Status.DONE},
+            {"task_uuid": str(uuid.uuid4()), "title": "Missing"},
+        ]
+        response = client.patch("/tasks/bulk", json={"items": patch}, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [task["status"] for task in data["tasks"]] == [Status.DONE]
+        assert data["errors"][0]["index"] == 1
+        assert data["errors"][0]["detail"] == "Task not found"
+
+        response = client.request(
+            "DELETE", "/tasks/bulk", json={"task_uuids": task_uuids}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert len(response.json()["tasks"]) == 2
+        for task_uuid in task_uuids:
+            assert client.get(f"/tasks/{task_uuid}", headers=auth_headers).status_code == 404
+
+    def test_bulk_update_requires_filter(self, client, auth_headers):
+        """Test that a filtered bulk update rejects an empty filter."""
+        response = client.patch(
+            "/tasks/bulk", json={"filter": {}, "update": {"priority": 3}}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
+    def test_get_archived_tasks(self, client, auth_headers):
+        """Test listing archived tasks."""
+        response = client.get("/tasks/archive", headers=auth_headers)
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+
+        assert client.get("/tasks/archive?limit=-1", headers=auth_headers).status_code == 400
+        assert client.get("/tasks/archive?limit=100000", headers=auth_headers).status_code == 400
+
+    def test_restore_archived_task_not_found(self, client, auth_headers):
+        """Test restoring a task that is not in the archive."""
+        fake_uuid = str(uuid.uuid4())
+        response = client.post(f"/tasks/archive/{fake_uuid}/restore", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_assign_task_success(self, client, auth_headers, test_task, test_user2):
+        """Test successful task assignment."""
+        assignment_data = {
+            "user_uuid": str(test_user2.user_uuid)
+        }
+        
+        response = client.post(
+            f"/tasks/{test_task.task_uuid}/assign",
+            json=assignment_data,
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["assigned_to"] == str(test_user2.user_uuid)
+
+    def test_assign_task_to_nonexistent_user(self, client, auth_headers, test_task):
+        """Test assigning task to non-existent user."""
+        fake_user_uuid = str(uuid.uuid4())
+        assignment_data = {
+            "user_uuid": fake_user_uuid
+        }
+        
+        response = client.post(
+            f"/tasks/{test_task.task_uuid}/assign",
+            json=assignment_data,
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 404
+        assert "User not found" in response.json()["detail"]
+
+    def test_unassign_task_success(self, client, auth_headers, test_task, test_user2):
+        """Test successful task unassignment."""
+        # First assign the task
+        assignment_data = {"user_uuid": str(test_user2.user_uuid)}
+        assign_response = client.post(
+            f"/tasks/{test_task.task_uuid}/assign",
+            json=assignment_data,
+            headers=auth_headers
+        )
+        assert assign_response.status_code == 200
+        
+        # Then unassign the task
+        unassignment_data = {"user_uuid": None}
+        response = client.post(
+            f"/tasks/{test_task.task_uuid}/assign",
+            json=unassignment_data,
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["assigned_to"] is None
+
+    def test_assign_task_not_found(self, client, auth_headers, test_user2):
+        """Test assigning a non-existent task."""
+        fake_uuid = str(uuid.uuid4())
+        assignment_data = {
+            "user_uuid": str(test_user2.user_uuid)
+        }
+        
+        response = client.post(
+            f"/tasks/{fake_uuid}/assign",
+            json=assignment_data,
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 404
+
+    def test_complete_task_success(self, client, auth_headers, test_task):
+        """Test successful task completion."""
+        response = client.post(
+            f"/tasks/{test_task.task_uuid}/complete",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == Status.DONE
+        assert data["completed_date"] is not None
+
+    def test_complete_task_not_found(self, client, auth_headers):
+        """Test completing a non-existent task."""
+        fake_uuid = str(uuid.uuid4())
+        response = client.post(f"/tasks/{fake_uuid}/complete", headers=auth_headers)
+        
+        assert response.status_code == 404
+
+    def test_complete_already_completed_task(self, client, auth_headers, test_task):
+        """Test completing an already completed task."""
+        # First complete the task
+        complete_response = client.post(
+            f"/tasks/{test_task.task_uuid}/complete",
+            headers=auth_headers
+        )
+        assert complete_response.status_code == 200
+        
+        # Try to complete it again
+        response = client.post(
+            f"/tasks/{test_task.task_uuid}/complete",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == Status.DONE
+
+    def test_unauthorized_access_to_all_endpoints(self, client, test_task):
+        """Test that all endpoints require authentication."""
+        endpoints = [
+            ("GET", f"/tasks/"),
+            ("POST", f"/tasks/"),
+            ("GET", f"/tasks/{test_task.task_uuid}"),
+            ("PUT", f"/tasks/{test_task.task_uuid}"),
+            ("DELETE", f"/tasks/{test_task.task_uuid}"),
+            ("POST", f"/tasks/{test_task.task_uuid}/assign"),
+            ("POST", f"/tasks/{test_task.task_uuid}/complete"),
+        ]
+        
+        for method, endpoint in endpoints:
+            if method == "GET":
+                response = client.get(endpoint)
+            elif method == "POST":
+                response = client.post(endpoint, json={})
+            elif method == "PUT":
+                response = client.put(endpoint, json={})
+            elif method == "DELETE":
+                response = client.delete(endpoint)
+            
+            assert response.status_code == 401, f"Endpoint {method} {endpoint} should require authentication"
+
+    def test_metrics_requires_authentication(self, client, auth_headers):
+        """Test that the internal metrics are only served to logged in users."""
+        assert client.get("/metrics").status_code == 401
+        response = client.get("/metrics", headers=auth_headers)
+        assert response.status_code == 200
+        assert "admission" in response.json()
\ No newline at end of file
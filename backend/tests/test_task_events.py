@@ -0,0 +1,76 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+import pytest
+from services.task_events import (
+    EVENT_ASSIGNED, EVENT_COMPLETED, EVENT_CREATED, EVENT_DELETED, SubscriberOverflow, Subscription,
+    TaskEvent, TaskEventFilter, _event_payload, parse_event_id
+)
+
+ALICE = uuid.uuid4()
+BOB = uuid.uuid4()
+
+def make_row(**overrides):
+    row = dict(
+        task_uuid=uuid.uuid4(), title="Report", description=None, created_date=None, due_date=None,
+        completed_date=None, tags=["q3"], status="To Do", priority=1, assigned_to=ALICE, deleted_date=None,
+        modified_date=None
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+def make_event(event_id, row):
+    return TaskEvent(event_id, _event_payload(row).decode())
+
+class TestTaskEvents:
+    """Test task change events and subscriptions."""
+
+    def test_event_types(self):
+        """Test that the event type is derived from the row before and after the write."""
+        assert make_event("1-0", make_row()).type == EVENT_CREATED
+        previous = dict(old_status="To Do", old_assigned_to=ALICE)
+        assert make_event("1-0", make_row(status="Done", **previous)).type == EVENT_COMPLETED
+        assert make_event("1-0", make_row(assigned_to=BOB, **previous)).type == EVENT_ASSIGNED
+        assert make_event("1-0", make_row(deleted_date="2026-01-01", **previous)).type == EVENT_DELETED
+
+    def test_filter_matches_before_or_after(self):
+        """Test that a task leaving a subscriber's view is still sent to it."""
+        mine = TaskEventFilter(assigned_to=ALICE)
+        reassigned = make_event("1-0", make_row(assigned_to=BOB, old_status="To Do", old_assigned_to=ALICE))
+        assert mine.matches(reassigned)
+        assert not mine.matches(make_event("2-0", make_row(assigned_to=BOB)))
+        assert not TaskEventFilter(tags_any=["q4"]).matches(reassigned)
+        assert TaskEventFilter(status="To Do", tags_any=["q3", "q4"]).matches(reassigned)
+
+    def test_parse_event_id(self):
+        """Test that only stream entry IDs are accepted as event IDs."""
+        assert parse_event_id("1700000000000-2") == (1700000000000, 2)
+        assert parse_event_id("1-2-3") is None
+        assert parse_event_id("") is None
+
+    def test_live_events_after_replay_are_not_repeated(self):
+        """Test that events already sent from the replay are skipped."""
+        async def scenario():
+            subscription = Subscription(TaskEventFilter(), parse_event_id("1-0"), queue_size=10)
+            for event_id in ("2-0", "3-0", "4-0"):
+                subscription.offer(make_event(event_id, make_row()))
+            assert subscription.replayed(make_event("2-0", make_row()))
+            assert subscription.replayed(make_event("3-0", make_row()))
+            assert (await subscription.next(0.1)).id == "4-0"
+            assert await subscription.next(0.01) is None
+
+        asyncio.run(scenario())
+
+    def test_overflow_disconnects_after_queued_events(self):
+        """Test that a subscriber that falls behind gets what was queued, then is cut off."""
+        async def scenario():
+            subscription = Subscription(TaskEventFilter(), None, queue_size=2)
+            for event_id in ("1-0", "2-0", "3-0"):
+                subscription.offer(make_event(event_id, make_row()))
+            assert subscription.overflowed
+            assert (await subscription.next(0.1)).id == "1-0"
+            assert (await subscription.next(0.1)).id == "2-0"
+            with pytest.raises(SubscriberOverflow):
+                await subscription.next(0.1)
+
+        asyncio.run(scenario())
@@ -2,35 +2,70 @@ import React, { useState, useEffect } from 'react';
 import userService from '../services/userService';
 import taskService from '../services/taskService';
 
+const SEARCH_LIMIT = 20;
+const SEARCH_DEBOUNCE_MS = 200;
+
 const AssignTaskModal = ({ isOpen, task, onClose, onTaskAssigned }) => {
     const [users, setUsers] = useState([]);
+    const [assignedUser, setAssignedUser] = useState(null);
     const [selectedUserId, setSelectedUserId] = useState('');
+    // Kept with the id: the search results change on every keystroke
+    const [selectedUser, setSelectedUser] = useState(null);
     const [loading, setLoading] = useState(false);
     const [error, setError] = useState('');
     const [searchTerm, setSearchTerm] = useState('');
 
     useEffect(() => {
         if (isOpen) {
-            loadUsers();
             // Set current assigned user if task is already assigned
+            setSelectedUser(null);
             if (task && task.assigned_to) {
                 setSelectedUserId(task.assigned_to);
+                loadAssignedUser(task.assigned_to);
             } else {
                 setSelectedUserId('');
+                setAssignedUser(null);
             }
         }
     }, [isOpen, task]);
 
-    const loadUsers = async () => {
+    useEffect(() => {
+        const query = searchTerm.trim();
+        if (!isOpen || !query) {
+            setUsers([]);
+            return;
+        }
+        // Search once typing pauses; the server ranks and limits the matches
+        let cancelled = false;
+        const timer = setTimeout(async () => {
+            try {
+                const userData = await userService.searchUsers(query, SEARCH_LIMIT);
+                if (!cancelled) setUsers(userData);
+            } catch (err) {
+                console.error('Failed to search users:', err);
+                if (!cancelled) setError('Failed to search users');
+            }
+        }, SEARCH_DEBOUNCE_MS);
+        return () => {
+            cancelled = true;
+            clearTimeout(timer);
+        };
+    }, [isOpen, searchTerm]);
+
+    const loadAssignedUser = async (userId) => {
         try {
-            const userData = await userService.getUsers({ limit: 100 });
-            setUsers(userData);
+            setAssignedUser(await userService.getUserById(userId));
         } catch (err) {
-            console.error('Failed to load users:', err);
-            setError('Failed to load users');
+            console.error('Failed to load assigned user:', err);
+            setAssignedUser(null);
         }
     };
 
+    const handleSelectUser = (user) => {
+        setSelectedUserId(user ? (user.user_id || user.user_uuid || user.id) : '');
+        setSelectedUser(user);
+    };
+
     const handleAssign = async () => {
         if (!selectedUserId) {
             setError('Please select a user to assign this task to');
@@ -49,13 +84,11 @@ const AssignTaskModal = ({ isOpen, task, onClose, onTaskAssigned }) => {
         try {
             console.log('Assigning task:', taskId, 'to user:', selectedUserId);
             const updatedTask = await taskService.assignTask(taskId, selectedUserId);
-            
-            // Find the assigned user details
-            const assignedUser = users.find(user => 
-                (user.user_id || user.user_uuid || user.id) === selectedUserId
-            );
 
-            onTaskAssigned(updatedTask, assignedUser);
+            // The current assignee is preselected without a search result behind it
+            const assignedTo = selectedUserId === task.assigned_to ? assignedUser : selectedUser;
+
+            onTaskAssigned(updatedTask, assignedTo);
             handleClose();
         } catch (err) {
             console.error('Assign task error:', err);
@@ -92,26 +125,13 @@ const AssignTaskModal = ({ isOpen, task, onClose, onTaskAssigned }) => {
 
     const handleClose = () => {
         setSelectedUserId('');
+        setSelectedUser(null);
         setSearchTerm('');
+        setUsers([]);
         setError('');
         onClose();
     };
 
-    const filteredUsers = users.filter(user =>
-        user.name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        user.username?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        user.email?.toLowerCase().includes(searchTerm.toLowerCase())
-    );
-
-    const getAssignedUser = () => {
-        if (!task || !task.assigned_to) return null;
-        return users.find(user => 
-            (user.user_id || user.user_uuid || user.id) === task.assigned_to
-        );
-    };
-
-    const assignedUser = getAssignedUser();
-
     if (!isOpen || !task) return null;
 
     return (
@@ -171,7 +191,7 @@ const AssignTaskModal = ({ isOpen, task, onClose, onTaskAssigned }) => {
                                         name="assignedUser"
                                         value=""
                                         checked={selectedUserId === ''}
-                                        onChange={(e) => setSelectedUserId(e.target.value)}
+                                        onChange={() => handleSelectUser(null)}
                                     />
                                     <div className="user-option-content">
                                         <div className="user-avatar unassigned">
@@ -185,7 +205,7 @@ const AssignTaskModal = ({ isOpen, task, onClose, onTaskAssigned }) => {
                                 </label>
                             </div>
 
-                            {filteredUsers.map(user => {
+                            {users.map(user => {
                                 const userId = user.user_id || user.user_uuid || user.id;
                                 return (
                                     <div key={userId} className="user-option">
@@ -195,7 +215,7 @@ const AssignTaskModal = ({ isOpen, task, onClose, onTaskAssigned }) => {
                                                 name="assignedUser"
                                                 value={userId}
                                                 checked={selectedUserId === userId}
-                                                onChange={(e) => setSelectedUserId(e.target.value)}
+                                                onChange={() => handleSelectUser(user)}
                                             />
                                             <div className="user-option-content">
                                                 <div className="user-avatar">
@@ -213,7 +233,7 @@ const AssignTaskModal = ({ isOpen, task, onClose, onTaskAssigned }) => {
                             })}
                         </div>
 
-                        {filteredUsers.length === 0 && searchTerm && (
+                        {users.length === 0 && searchTerm && (
                             <div className="no-users-found">
                                 No users found matching "{searchTerm}"
                             </div>
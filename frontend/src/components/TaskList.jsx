@@ -143,22 +143,58 @@ const TaskList = () => {
                 const updatedTaskId = updatedTask.task_id || updatedTask.task_uuid || updatedTask.id;
                 
                 if (taskId === updatedTaskId) {
+                    if (!updatedTask.assigned_to) {
+                        return { ...task, ...updatedTask, assignee: null, assignedUserName: null, assignedUserEmail: null };
+                    }
+                    if (!assignedUser) {
+                        // Still assigned but no user came back: keep the embedded assignee if it
+                        // is still the right one, otherwise the re-read below brings it
+                        return task.assignee?.user_uuid === updatedTask.assigned_to
+                            ? { ...task, ...updatedTask }
+                            : { ...task, ...updatedTask, assignee: null, assignedUserName: null, assignedUserEmail: null };
+                    }
                     return {
                         ...task,
                         ...updatedTask,
-                        assignedUserName: assignedUser?.name || null,
-                        assignedUserEmail: assignedUser?.email || null
+                        // Replaces the expand=assignee object loaded with the list
+                        assignee: {
+                            user_uuid: assignedUser.user_uuid,
+                            username: assignedUser.username,
+                            name: assignedUser.name
+                        },
+                        assignedUserName: assignedUser.name,
+                        assignedUserEmail: assignedUser.email
                     };
                 }
                 return task;
             })
         );
-        
-        // Optionally reload tasks to ensure consistency
-        // loadTasks();
+
+        if (updatedTask.assigned_to && !assignedUser) {
+            refreshTaskAssignee(updatedTask);
+        }
+    };
+
+    const refreshTaskAssignee = async (updatedTask) => {
+        const updatedTaskId = updatedTask.task_id || updatedTask.task_uuid || updatedTask.id;
+        try {
+            const freshTask = await taskService.getTask(updatedTaskId);
+            setTasks(prevTasks =>
+                prevTasks.map(task =>
+                    (task.task_id || task.task_uuid || task.id) === updatedTaskId
+                        ? { ...task, ...freshTask }
+                        : task
+                )
+            );
+        } catch (err) {
+            console.error('Failed to reload assigned task:', err);
+        }
     };
 
     const getUserDisplayName = (task) => {
+        if (task.assignee) {
+            return task.assignee.name;
+        }
         if (task.assignedUserName) {
             return task.assignedUserName;
         }
@@ -12,6 +12,8 @@ class TaskService {
         if (filters.due_date_from) params.append('due_date_from', filters.due_date_from);
         if (filters.due_date_to) params.append('due_date_to', filters.due_date_to);
         if (filters.assigned_to_me) params.append('assigned_to_me', filters.assigned_to_me);
+        // Embed each assignee in the same response instead of a user request per task
+        params.append('expand', 'assignee');
 
         const response = await fetch(`${API_BASE_URL}/tasks?${params}`, {
             headers: {
@@ -26,6 +28,22 @@ class TaskService {
         return response.json();
     }
 
+    async getTask(taskId) {
+        const token = localStorage.getItem('accessToken');
+
+        const response = await fetch(`${API_BASE_URL}/tasks/${taskId}?expand=assignee`, {
+            headers: {
+                'Authorization': `Bearer ${token}`,
+            },
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to fetch task');
+        }
+
+        return response.json();
+    }
+
     async getTaskStatuses() {
         const response = await fetch(`${API_BASE_URL}/tasks/statuses`);
         
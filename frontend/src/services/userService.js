@@ -22,6 +22,24 @@ class UserService {
         return response.json();
     }
 
+    async searchUsers(query, limit = 10) {
+        const token = localStorage.getItem('accessToken');
+
+        const params = new URLSearchParams({ q: query, limit });
+
+        const response = await fetch(`${API_BASE_URL}/users/search?${params}`, {
+            headers: {
+                'Authorization': `Bearer ${token}`,
+            },
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to search users');
+        }
+
+        return response.json();
+    }
+
     async getUserById(userId) {
         const token = localStorage.getItem('accessToken');
         